@@ -0,0 +1,199 @@
+
+import typing as tp
+
+import numpy as np
+
+from static_frame.core.util import DTYPE_INT_KIND
+from static_frame.core.util import DTYPE_NAT_KIND
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import FLOAT_TYPES
+from static_frame.core.util import searchable_element_match
+
+
+# kinds of fixed-width labels that can be hashed by their 64-bit integer representation
+DTYPE_ARRAY_MAP_KIND = DTYPE_INT_KIND + DTYPE_NAT_KIND
+
+# minimum count of labels for which an ArrayMap is used in place of a dictionary; for smaller indices, the faster scalar lookups of a dictionary are preferred over the memory savings
+ARRAY_MAP_SIZE_MIN = 100_000
+
+_UINT64_MASK = (1 << 64) - 1
+# Fibonacci hashing: the 64-bit integer closest to 2**64 divided by the golden ratio; an odd multiplier that scatters sequential integers
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+
+_EMPTY = -1
+
+
+class ArrayMap:
+    '''
+    A mapping of unique, fixed-width integer, datetime64, or timedelta64 labels to their integer positions, implemented as an open-addressing hash table (with linear probing) stored in NumPy arrays. Labels are not copied: the table stores positions, and the labels array is referenced to confirm matches. With a load factor at or below one half, this uses between 8 and 16 bytes per label (for fewer than 2**31 labels), in place of the 100 or more bytes per label of a dictionary of NumPy scalars.
+
+    Presents the subset of the dictionary interface used by :obj:`Index`; labels cannot be added.
+    '''
+
+    __slots__ = (
+            '_labels',
+            '_keys',
+            '_table',
+            '_shift',
+            '_mask',
+            '_bounds',
+            )
+
+    @staticmethod
+    def supports(labels: np.ndarray) -> bool:
+        '''
+        Return True if an ``ArrayMap`` can, and should, be used for these labels.
+        '''
+        return (labels.dtype.kind in DTYPE_ARRAY_MAP_KIND
+                and len(labels) >= ARRAY_MAP_SIZE_MIN)
+
+    @staticmethod
+    def _to_keys(array: np.ndarray) -> np.ndarray:
+        '''
+        Return the 64-bit integer representation of a fixed-width integer or datetime64 array, viewed as unsigned.
+        '''
+        if array.dtype.itemsize == 8:
+            return array.view(np.uint64)
+        # widen smaller integers; signed values must be sign extended before reinterpretation
+        if array.dtype.kind == 'u':
+            return array.astype(np.uint64)
+        return array.astype(DTYPE_INT_DEFAULT).view(np.uint64)
+
+    def __init__(self, labels: np.ndarray) -> None:
+        '''
+        Args:
+            labels: a 1D immutable array of unique values of integer, datetime64, or timedelta64 dtype.
+        '''
+        self._labels = labels
+        self._keys = self._to_keys(labels)
+
+        size = len(labels)
+        # the smallest power of two at least double the size
+        bits = max(3, (size * 2 - 1).bit_length())
+        self._shift = 64 - bits
+        self._mask = (1 << bits) - 1
+
+        if labels.dtype.kind in DTYPE_INT_KIND:
+            info = np.iinfo(labels.dtype)
+            self._bounds: tp.Optional[tp.Tuple[int, int]] = (int(info.min), int(info.max))
+        else:
+            self._bounds = None
+
+        dtype_table = np.int32 if size < np.iinfo(np.int32).max else DTYPE_INT_DEFAULT
+        table = np.full(1 << bits, _EMPTY, dtype=dtype_table)
+
+        # insert all labels concurrently: each pending label claims the slot it probes if that slot is empty, with the first of any labels probing the same empty slot winning; all others advance to the next slot
+        slots = self._hash(self._keys)
+        pending = np.arange(size, dtype=DTYPE_INT_DEFAULT)
+        while len(pending):
+            slots_pending = slots[pending]
+            empty = table[slots_pending] == _EMPTY
+            slots_claimed, winners = np.unique(slots_pending[empty], return_index=True)
+            table[slots_claimed] = pending[np.flatnonzero(empty)[winners]]
+
+            placed = np.full(len(pending), False, dtype=DTYPE_BOOL)
+            placed[np.flatnonzero(empty)[winners]] = True
+            pending = pending[~placed]
+            slots[pending] = (slots[pending] + 1) & self._mask
+
+        table.flags.writeable = False
+        self._table = table
+
+    def _hash(self, keys: np.ndarray) -> np.ndarray:
+        '''
+        Return the starting slot for each key in an array of unsigned 64-bit keys.
+        '''
+        # multiplication of unsigned integers wraps on overflow
+        return ((keys * np.uint64(_HASH_MULTIPLIER)) >> np.uint64(self._shift)).astype(DTYPE_INT_DEFAULT)
+
+    def _label_to_key(self, label: tp.Any) -> tp.Optional[int]:
+        '''
+        Return the 64-bit unsigned integer representation of a label, or None if the label cannot be equal to any label of this map's dtype.
+        '''
+        if not searchable_element_match(self._labels.dtype, label):
+            return None
+        if self._bounds is None: # datetime64 or timedelta64 of the same unit
+            return int(label.astype(DTYPE_INT_DEFAULT)) & _UINT64_MASK
+        if isinstance(label, FLOAT_TYPES):
+            if not float(label).is_integer():
+                return None # includes NaN and inf
+        value = int(label)
+        if value < self._bounds[0] or value > self._bounds[1]:
+            return None
+        return value & _UINT64_MASK
+
+    #---------------------------------------------------------------------------
+    # dictionary interface
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def get(self,
+            label: tp.Hashable,
+            default: tp.Optional[int] = None,
+            ) -> tp.Optional[int]:
+        key = self._label_to_key(label)
+        if key is None:
+            return default
+
+        table = self._table
+        keys = self._keys
+        slot = ((key * _HASH_MULTIPLIER) & _UINT64_MASK) >> self._shift
+        while True:
+            pos = table[slot]
+            if pos == _EMPTY:
+                return default
+            if int(keys[pos]) == key:
+                # NaT is never equal to NaT, as in a dictionary of NumPy scalars
+                if self._bounds is None and self._labels[pos] != label:
+                    return default
+                return int(pos)
+            slot = (slot + 1) & self._mask
+
+    def __getitem__(self, label: tp.Hashable) -> int:
+        pos = self.get(label)
+        if pos is None:
+            raise KeyError(label)
+        return pos
+
+    def __contains__(self, label: tp.Hashable) -> bool:
+        return self.get(label) is not None
+
+    #---------------------------------------------------------------------------
+    def get_positions(self,
+            key: np.ndarray,
+            ) -> tp.Optional[tp.Tuple[np.ndarray, np.ndarray]]:
+        '''
+        Vectorized lookup of all labels in a 1D array ``key``, returning the integer positions and a Boolean array identifying which labels were found; positions of labels not found are undefined. If the dtype of ``key`` cannot be compared to labels by their integer representation, return None.
+        '''
+        dtype = self._labels.dtype
+        if dtype.kind in DTYPE_NAT_KIND:
+            if key.dtype != dtype:
+                return None
+        elif (key.dtype.kind not in DTYPE_INT_KIND
+                or (key.dtype.kind == 'u') != (dtype.kind == 'u')):
+            # mixing signed and unsigned integers could match different values with the same representation
+            return None
+
+        keys_probe = self._to_keys(key)
+        slots = self._hash(keys_probe)
+        positions = np.zeros(len(key), dtype=DTYPE_INT_DEFAULT)
+        found = np.full(len(key), False, dtype=DTYPE_BOOL)
+
+        pending = np.arange(len(key), dtype=DTYPE_INT_DEFAULT)
+        while len(pending):
+            pos = self._table[slots[pending]]
+            occupied = pos != _EMPTY
+            # only evaluate keys of occupied slots; pos of empty slots is invalid
+            match = occupied.copy()
+            match[occupied] = self._keys[pos[occupied]] == keys_probe[pending[occupied]]
+            positions[pending[match]] = pos[match]
+            found[pending[match]] = True
+            pending = pending[occupied & ~match]
+            slots[pending] = (slots[pending] + 1) & self._mask
+
+        if dtype.kind in DTYPE_NAT_KIND:
+            # NaT is never equal to NaT
+            found[found] = self._labels[positions[found]] == key[found]
+        return positions, found
@@ -2,7 +2,8 @@
 This module us for utilty functions that take as input and / or return Container subclasses such as Index, Series, or Frame, and that need to be shared by multiple such Container classes.
 '''
 
-from collections import defaultdict
+
+from itertools import islice
 
 import numpy as np
 import typing as tp
@@ -25,6 +26,9 @@ from static_frame.core.util import slice_to_ascending_slice
 from static_frame.core.util import GetItemKeyType
 from static_frame.core.util import DEFAULT_SORT_KIND
 from static_frame.core.util import iterable_to_array_1d
+from static_frame.core.util import array_to_codes
+from static_frame.core.util import DTYPE_OBJECT
+from static_frame.core.util import INT_MAX_COERCIBLE_TO_FLOAT
 
 from static_frame.core.index_base import IndexBase
 
@@ -357,6 +361,52 @@ def axis_window_items( *,
             break
 
 
+def axis_window_bounds(*,
+        count: int,
+        size: int,
+        step: int = 1,
+        window_sized: bool = True,
+        label_shift: int = 0,
+        start_shift: int = 0,
+        size_increment: int = 0,
+        ) -> tp.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''Return arrays of the start positions, stop positions, and label positions of the valid windows over an axis of ``count`` elements, as the windows are determined by ``axis_window_items``.
+    '''
+    if size <= 0:
+        raise RuntimeError('window size must be greater than 0')
+    if step < 0:
+        raise RuntimeError('window step cannot be less than than 0')
+
+    if start_shift >= 0:
+        count_window_max = count
+    else: # add for iterations when less than 0
+        count_window_max = count + abs(start_shift)
+    idx_left_max = count_window_max - 1
+
+    # the number of windows evaluated before axis_window_items breaks
+    if step == 0:
+        count_window = 1 if start_shift > idx_left_max else count_window_max + 1
+    else:
+        count_window = min(count_window_max + 1,
+                max((idx_left_max - start_shift) // step + 1, 1))
+    if size_increment < 0: # windows end once the size is less than 0
+        count_window = min(count_window, size // -size_increment + 1)
+
+    positions = np.arange(count_window)
+    idx_left = start_shift + positions * step
+    sizes = size + positions * size_increment
+    idx_right = idx_left + sizes - 1
+    starts = np.minimum(np.maximum(idx_left, 0), count)
+    stops = np.minimum(np.maximum(idx_right, -1) + 1, count)
+    stops = np.maximum(stops, starts)
+    idx_label = idx_right + label_shift
+
+    valid = (idx_label >= 0) & (idx_label < count)
+    if window_sized:
+        valid &= (stops - starts) == sizes
+    return starts[valid], stops[valid], idx_label[valid]
+
+
 def bloc_key_normalize(
         key: Bloc2DKeyType,
         container: 'Frame'
@@ -429,9 +479,13 @@ def rehierarch_and_map(*,
         index_constructor: IndexConstructor,
         index_constructors: tp.Optional[IndexConstructors] = None,
         name: tp.Hashable = None,
+        codes: tp.Optional[tp.Sequence[np.ndarray]] = None,
         ) -> tp.Tuple['IndexHierarchy', tp.Sequence[int]]:
     '''
     Given labels suitable for a hierarchical index, order them into a hierarchy using the given depth_map.
+
+    Args:
+        codes: optionally provide, for each column of ``labels``, integer codes that increase in the order labels are observed.
     '''
 
     depth = labels.shape[1] # number of columns
@@ -442,22 +496,13 @@ def rehierarch_and_map(*,
         raise RuntimeError('all depths must be specified')
 
     labels_post = labels[NULL_SLICE, list(depth_map)]
-    labels_sort = np.full(labels_post.shape, 0)
 
-    # get ordering of vlues found in each level
-    order = [defaultdict(int) for _ in range(depth)]
-
-    for idx_row, label in enumerate(labels):
-        label = tuple(label)
-        for idx_col in range(depth):
-            if label[idx_col] not in order[idx_col]:
-                # Map label to an integer representing the observed order.
-                order[idx_col][label[idx_col]] = len(order[idx_col])
-            # Fill array for sorting based on observed order.
-            labels_sort[idx_row, idx_col] = order[idx_col][label[idx_col]]
+    if codes is None:
+        # map each label to an integer representing the observed order
+        codes = [array_to_codes(labels[NULL_SLICE, i])[1] for i in range(depth)]
 
     # Reverse depth_map for lexical sorting, which sorts by rightmost column first.
-    order_lex = np.lexsort([labels_sort[NULL_SLICE, i] for i in reversed(depth_map)])
+    order_lex = np.lexsort([codes[i] for i in reversed(depth_map)])
     labels_post = labels_post[order_lex]
     labels_post.flags.writeable = False
     index = index_constructor(labels_post,
@@ -513,3 +558,152 @@ def array_from_value_iter(
 
 
 
+def _records_chunk_to_array(values: tp.Sequence[tp.Any]) -> tp.Optional[np.ndarray]:
+    '''
+    Convert a sequence of column values to an array, applying the same type resolution as ``iterable_to_array_1d``, but discovering types with a single set of value types rather than a per-value loop. Returns None if the resulting array depends on values outside of this sequence.
+    '''
+    value_types = set(map(type, values))
+    if (bytes in value_types or np.bytes_ in value_types) and not value_types <= {bytes, np.bytes_}:
+        return None # NumPy sizes bytes mixed with other types from all values
+    if tuple in value_types or list in value_types:
+        array = np.empty(len(values), dtype=DTYPE_OBJECT)
+        array[NULL_SLICE] = values
+        return array
+
+    has_str = str in value_types or np.str_ in value_types
+    if has_str and not value_types <= {str, np.str_}:
+        return np.array(values, dtype=DTYPE_OBJECT)
+
+    if (int in value_types
+            and (float in value_types or complex in value_types)
+            and any(abs(v) > INT_MAX_COERCIBLE_TO_FLOAT
+                    for v in values if type(v) == int)):
+        return np.array(values, dtype=DTYPE_OBJECT)
+
+    return np.array(values)
+
+
+def _records_dtype_resolve(
+        previous: np.ndarray,
+        array: np.ndarray,
+        ) -> tp.Optional[np.dtype]:
+    '''
+    Return the dtype that NumPy would have produced from the values of both arrays, or None if that dtype cannot be determined without re-evaluating the original values.
+    '''
+    kind_previous = previous.dtype.kind
+    kind_array = array.dtype.kind
+
+    if kind_previous in 'bif' and kind_array in 'bif':
+        if {kind_previous, kind_array} == {'i', 'f'}:
+            ints = previous if kind_previous == 'i' else array
+            if len(ints) and np.abs(ints).max() > INT_MAX_COERCIBLE_TO_FLOAT:
+                return None # large ints with floats resolve to object
+        return np.result_type(previous.dtype, array.dtype)
+
+    if kind_previous == kind_array and kind_previous in 'USMm':
+        return np.result_type(previous.dtype, array.dtype)
+
+    return None
+
+
+def arrays_from_records(
+        rows: tp.Iterable[tp.Any],
+        *,
+        keys: tp.Sequence[tp.Hashable],
+        get_chunk_columns: tp.Callable[[tp.List[tp.Any]], tp.Sequence[tp.Sequence[tp.Any]]],
+        get_value_iter: tp.Callable[[tp.Hashable], tp.Iterator[tp.Any]],
+        get_col_dtype: tp.Optional[tp.Callable],
+        row_count: int,
+        chunk_size: int = 1024,
+        ) -> tp.Iterator[np.ndarray]:
+    '''
+    Yield a single array per column from rows of records, iterating rows only once. Rows are read in chunks and transposed into columns with ``get_chunk_columns``; each column chunk is converted to an array and written into a typed buffer allocated from the dtype of the first chunk, promoting that buffer when later chunks require a wider dtype. Columns whose dtype cannot be promoted without re-evaluating values (such as str mixed with numbers across chunks) fall back to ``array_from_value_iter``.
+
+    Args:
+        keys: hashables, in column order, for looking up fields in ``get_value_iter``.
+        get_chunk_columns: function that, given a list of rows, returns a sequence of column values for at least all ``keys``.
+        get_value_iter: function that, given a key, returns an iterator of all values for that column.
+        get_col_dtype: optional function that, given a column position, returns a dtype or None.
+    '''
+    col_count = len(keys)
+    buffers: tp.List[tp.Optional[np.ndarray]] = [None] * col_count
+    fallback = [False] * col_count
+
+    dtypes: tp.List[tp.Optional[np.dtype]] = [None] * col_count
+    if get_col_dtype is not None:
+        for col_idx in range(col_count):
+            column_type = get_col_dtype(col_idx)
+            if column_type is None:
+                continue
+            dtype = np.dtype(column_type)
+            if dtype == DTYPE_OBJECT or dtype.itemsize == 0:
+                # object and unsized flexible dtypes cannot be written into a buffer
+                fallback[col_idx] = True
+            dtypes[col_idx] = dtype
+
+    rows_iter = iter(rows)
+    start = 0
+    while start < row_count:
+        chunk = list(islice(rows_iter, chunk_size))
+        if not chunk:
+            break
+        stop = start + len(chunk)
+        columns = get_chunk_columns(chunk)
+
+        for col_idx in range(col_count):
+            if fallback[col_idx]:
+                continue
+            values = columns[col_idx]
+            buffer = buffers[col_idx]
+            dtype = dtypes[col_idx]
+
+            if dtype is not None:
+                try:
+                    array = np.fromiter(values, count=len(values), dtype=dtype)
+                except (ValueError, TypeError):
+                    fallback[col_idx] = True
+                    buffers[col_idx] = None
+                    continue
+            elif buffer is not None and buffer.dtype == DTYPE_OBJECT:
+                # assign values without NumPy type conversion
+                array = np.empty(len(values), dtype=DTYPE_OBJECT)
+                array[NULL_SLICE] = values
+            else:
+                array = _records_chunk_to_array(values)
+                if array is None or array.ndim != 1:
+                    fallback[col_idx] = True
+                    buffers[col_idx] = None
+                    continue
+
+            if buffer is None:
+                if stop == row_count: # a single chunk
+                    buffers[col_idx] = array
+                    continue
+                buffer = np.empty(row_count, dtype=array.dtype)
+            elif buffer.dtype != array.dtype:
+                dtype_resolved = _records_dtype_resolve(buffer[:start], array)
+                if dtype_resolved is None:
+                    fallback[col_idx] = True
+                    buffers[col_idx] = None
+                    continue
+                if dtype_resolved != buffer.dtype:
+                    buffer = buffer.astype(dtype_resolved)
+
+            buffer[start: stop] = array
+            buffers[col_idx] = buffer
+
+        start = stop
+
+    for col_idx, key in enumerate(keys):
+        if fallback[col_idx]:
+            yield array_from_value_iter(
+                    key=key,
+                    idx=col_idx,
+                    get_value_iter=get_value_iter,
+                    get_col_dtype=get_col_dtype,
+                    row_count=row_count,
+                    )
+        else:
+            array = buffers[col_idx]
+            array.flags.writeable = False
+            yield array
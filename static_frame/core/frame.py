@@ -4,7 +4,7 @@ import csv
 import json
 from functools import partial
 from itertools import chain
-from itertools import repeat
+from operator import itemgetter
 
 import numpy as np
 
@@ -22,6 +22,7 @@ from static_frame.core.util import INT_TYPES
 from static_frame.core.util import GetItemKeyType
 from static_frame.core.util import GetItemKeyTypeCompound
 from static_frame.core.util import KeyOrKeys
+from static_frame.core.util import DTYPE_BOOL
 from static_frame.core.util import PathSpecifier
 from static_frame.core.util import PathSpecifierOrFileLike
 from static_frame.core.util import PathSpecifierOrFileLikeOrIterator
@@ -54,13 +55,16 @@ from static_frame.core.util import array2d_to_tuples
 from static_frame.core.util import _read_url
 from static_frame.core.util import write_optional_file
 from static_frame.core.util import ufunc_unique
+from static_frame.core.util import ufunc_unique_and_locations
+from static_frame.core.util import join_locations
+from static_frame.core.util import join_asof_locations
 # from static_frame.core.util import STATIC_ATTR
 from static_frame.core.util import concat_resolved
 from static_frame.core.util import DepthLevelSpecifier
 from static_frame.core.util import array_to_groups_and_locations
+from static_frame.core.util import locations_to_selections
 from static_frame.core.util import is_callable_or_mapping
 from static_frame.core.util import CallableOrCallableMap
-from static_frame.core.util import ufunc_axis_skipna
 from static_frame.core.util import AnyCallable
 
 from static_frame.core.util import argmin_2d
@@ -69,6 +73,11 @@ from static_frame.core.util import resolve_dtype
 from static_frame.core.util import key_normalize
 from static_frame.core.util import get_tuple_constructor
 from static_frame.core.util import dtype_to_na
+from static_frame.core.util import array_group_reduce
+from static_frame.core.util import UFUNC_TO_GROUP_REDUCE
+from static_frame.core.util import GROUP_REDUCE_FUNCS
+from static_frame.core.util import group_reduce_supported
+from static_frame.core.util import DTYPE_INT_DEFAULT
 
 from static_frame.core.selector_node import InterfaceGetItem
 from static_frame.core.selector_node import InterfaceSelection2D
@@ -81,9 +90,10 @@ from static_frame.core.container import ContainerOperand
 from static_frame.core.container_util import matmul
 from static_frame.core.container_util import index_from_optional_constructor
 from static_frame.core.container_util import axis_window_items
+from static_frame.core.container_util import axis_window_bounds
 from static_frame.core.container_util import bloc_key_normalize
 from static_frame.core.container_util import rehierarch_and_map
-from static_frame.core.container_util import array_from_value_iter
+from static_frame.core.container_util import arrays_from_records
 from static_frame.core.container_util import dtypes_mappable
 from static_frame.core.container_util import key_to_ascending_key
 from static_frame.core.container_util import index_constructor_empty
@@ -129,6 +139,7 @@ from static_frame.core.store_filter import STORE_FILTER_DEFAULT
 
 
 from static_frame.core.exception import ErrorInitFrame
+from static_frame.core.exception import ErrorInitIndex
 from static_frame.core.exception import AxisInvalid
 
 from static_frame.core.doc_str import doc_inject
@@ -403,44 +414,68 @@ class Frame(ContainerOperand):
             elif index is None:
                 # returns immutable array
                 index = concat_resolved([frame._index.values for frame in frames])
-                from_array_index = True
-                # avoid sort for performance; always want rows if ndim is 2
-                if len(ufunc_unique(index, axis=0)) != len(index):
+                if index.ndim == 1:
+                    # build the index in one pass, as creating the index evaluates uniqueness
+                    try:
+                        index = Index(index)
+                    except ErrorInitIndex:
+                        index = None
+                    else:
+                        own_index = True
+                else:
+                    from_array_index = True
+                    # avoid sort for performance; always want rows if ndim is 2
+                    if len(ufunc_unique(index, axis=0)) != len(index):
+                        index = None
+                if index is None:
                     raise ErrorInitFrame('Index names after vertical concatenation are not unique; supply an index argument or IndexAutoFactory.')
 
+            # if all columns are identical, no columns need to be aligned
+            columns_first = frames[0]._columns
+            columns_identical = columns is None and all(
+                    frame._columns is columns_first or (
+                    frame._columns.__class__ is columns_first.__class__
+                    and frame._columns.shape == columns_first.shape
+                    and (frame._columns.values == columns_first.values).all())
+                    for frame in frames[1:])
+
             if columns is IndexAutoFactory:
                 raise ErrorInitFrame('for axis 0 concatenation, columns must be used for reindexing and column alignment: IndexAutoFactory is not permitted')
             elif columns is None:
-                columns = ufunc_set_iter(
-                        (frame._columns.values for frame in frames),
-                        union=union,
-                        assume_unique=True
-                        )
-                columns.flags.writeable = False
-                from_array_columns = True
+                if columns_identical:
+                    columns = columns_first
+                else:
+                    columns = ufunc_set_iter(
+                            (frame._columns.values for frame in frames),
+                            union=union,
+                            assume_unique=True
+                            )
+                    columns.flags.writeable = False
+                    from_array_columns = True
 
             def blocks():
                 aligned_frames = []
                 previous_frame = None
                 block_compatible = True
-                reblock_compatible = True
 
                 for frame in frames:
-                    if len(frame.columns) != len(columns) or (frame.columns != columns).any():
+                    if not columns_identical and (len(frame.columns) != len(columns)
+                            or (frame.columns != columns).any()):
                         frame = frame.reindex(columns=columns, fill_value=fill_value)
 
                     aligned_frames.append(frame)
                     # column size is all the same by this point
-                    if previous_frame is not None: # after the first
-                        if block_compatible:
-                            block_compatible &= frame._blocks.block_compatible(
-                                    previous_frame._blocks,
-                                    axis=1) # only compare columns
-                        if reblock_compatible:
-                            reblock_compatible &= frame._blocks.reblock_compatible(
-                                    previous_frame._blocks)
+                    if previous_frame is not None and block_compatible: # after the first
+                        block_compatible &= frame._blocks.block_compatible(
+                                previous_frame._blocks,
+                                axis=1) # only compare columns
                     previous_frame = frame
 
+                # reblocking is only necessary if blocks are not compatible
+                reblock_compatible = not block_compatible and all(
+                        frame._blocks.reblock_compatible(previous._blocks)
+                        for previous, frame in zip(aligned_frames, aligned_frames[1:]))
+
                 if block_compatible or reblock_compatible:
                     if not block_compatible and reblock_compatible:
                         # after reblocking, will be compatible
@@ -450,13 +485,17 @@ class Frame(ContainerOperand):
 
                     # all TypeBlocks have the same number of blocks by here
                     for block_idx in range(len(type_blocks[0]._blocks)):
-                        block_parts = []
-                        for frame_idx in range(len(type_blocks)):
-                            b = column_2d_filter(
-                                    type_blocks[frame_idx]._blocks[block_idx])
-                            block_parts.append(b)
-                        # returns immutable array
-                        yield concat_resolved(block_parts)
+                        block_parts = [tb._blocks[block_idx] for tb in type_blocks]
+                        first = block_parts[0]
+                        if all(b.dtype == first.dtype and b.ndim == first.ndim
+                                for b in block_parts):
+                            # blocks of the same signature can be concatenated directly
+                            block = np.concatenate(block_parts)
+                            block.flags.writeable = False
+                            yield block
+                        else:
+                            # returns immutable array
+                            yield concat_resolved([column_2d_filter(b) for b in block_parts])
                 else: # blocks not alignable
                     # break into single column arrays for maximum type integrity; there might be an alternative reblocking that could be more efficient, but determining that shape might be complex
                     for i in range(len(columns)):
@@ -612,10 +651,10 @@ class Frame(ContainerOperand):
         if isinstance(row_reference, dict):
             raise ErrorInitFrame('Frame.from_records() does not support dictionary records. Use Frame.from_dict_records() instead.')
 
-        column_name_getter = None
+        col_count = len(row_reference)
+
         if columns is None and hasattr(row_reference, '_fields'): # NamedTuple
-            column_name_getter = row_reference._fields.__getitem__
-            columns = []
+            columns = list(row_reference._fields)
 
         if dtypes:
             dtypes_is_map = dtypes_mappable(dtypes)
@@ -626,26 +665,28 @@ class Frame(ContainerOperand):
         else:
             get_col_dtype = None
 
-        col_count = len(row_reference)
-
         def get_value_iter(col_key):
             rows_iter = rows if not rows_to_iter else iter(rows)
             # this is possible to support ragged lists, but it noticeably reduces performance
             return (row[col_key] for row in rows_iter)
 
+        def get_chunk_columns(chunk):
+            columns_chunk = list(zip(*chunk))
+            if len(columns_chunk) < col_count:
+                # a row is shorter than the reference row: index each row to raise
+                return [tuple(row[col_idx] for row in chunk)
+                        for col_idx in range(col_count)]
+            return columns_chunk
+
         def blocks():
             # iterate over final column order, yielding 1D arrays
-            for col_idx in range(col_count):
-                if column_name_getter: # append as side effect of generator!
-                    columns.append(column_name_getter(col_idx))
-
-                values = array_from_value_iter(
-                        key=col_idx,
-                        idx=col_idx,
-                        get_value_iter=get_value_iter, get_col_dtype=get_col_dtype,
-                        row_count=row_count
-                        )
-                yield values
+            yield from arrays_from_records(rows,
+                    keys=range(col_count),
+                    get_chunk_columns=get_chunk_columns,
+                    get_value_iter=get_value_iter,
+                    get_col_dtype=get_col_dtype,
+                    row_count=row_count,
+                    )
 
         if consolidate_blocks:
             block_gen = lambda: TypeBlocks.consolidate_blocks(blocks())
@@ -721,24 +762,32 @@ class Frame(ContainerOperand):
 
         col_count = len(row_reference)
 
+        columns.extend(row_reference.keys())
+        values_getter = itemgetter(*columns) if col_count > 1 else None
+
         # define function to get generator of row values; may need to call twice, so need to get fresh row_iter each time
         def get_value_iter(col_key):
             rows_iter = rows if not rows_to_iter else iter(rows)
             return (row.get(col_key, fill_value) for row in rows_iter)
 
+        def get_chunk_columns(chunk):
+            if values_getter is not None:
+                try:
+                    return list(zip(*map(values_getter, chunk)))
+                except KeyError: # not all rows have all keys
+                    pass
+            return [[row.get(col_key, fill_value) for row in chunk]
+                    for col_key in columns]
+
         def blocks():
             # iterate over final column order, yielding 1D arrays
-            for col_idx, col_key in enumerate(row_reference.keys()):
-                columns.append(col_key)
-
-                values = array_from_value_iter(
-                        key=col_key,
-                        idx=col_idx,
-                        get_value_iter=get_value_iter,
-                        get_col_dtype=get_col_dtype,
-                        row_count=row_count
-                        )
-                yield values
+            yield from arrays_from_records(rows,
+                    keys=columns,
+                    get_chunk_columns=get_chunk_columns,
+                    get_value_iter=get_value_iter,
+                    get_col_dtype=get_col_dtype,
+                    row_count=row_count,
+                    )
 
         if consolidate_blocks:
             block_gen = lambda: TypeBlocks.consolidate_blocks(blocks())
@@ -1109,8 +1158,8 @@ class Frame(ContainerOperand):
                 index=index_arrays[0],
                 **kwargs)
         return cls(
-                index=zip(*index_arrays),
-                index_constructor=IndexHierarchy.from_labels,
+                index=index_arrays,
+                index_constructor=IndexHierarchy.from_values_per_depth,
                 **kwargs
                 )
 
@@ -1543,8 +1592,8 @@ class Frame(ContainerOperand):
                 index=index_arrays[0],
                 **kwargs)
         return cls(
-                index=zip(*index_arrays),
-                index_constructor=IndexHierarchy.from_labels,
+                index=index_arrays,
+                index_constructor=IndexHierarchy.from_values_per_depth,
                 **kwargs
                 )
 
@@ -1825,8 +1874,8 @@ class Frame(ContainerOperand):
         if index_depth == 1:
             return cls(index=index_arrays[0], **kwargs)
         return cls(
-                index=zip(*index_arrays),
-                index_constructor=IndexHierarchy.from_labels,
+                index=index_arrays,
+                index_constructor=IndexHierarchy.from_values_per_depth,
                 **kwargs
                 )
 
@@ -3164,6 +3213,18 @@ class Frame(ContainerOperand):
                 index=self._index,
                 columns=self._columns)
 
+    def _blocks_aligned(self,
+            index: IndexBase,
+            columns: IndexBase,
+            ) -> TypeBlocks:
+        '''
+        Return the TypeBlocks of this Frame aligned to ``index`` and ``columns``, only reindexing if necessary.
+        '''
+        if (not _requires_reindex(self._index, index)
+                and not _requires_reindex(self._columns, columns)):
+            return self._blocks
+        return self.reindex(columns=columns, index=index)._blocks
+
     def _ufunc_binary_operator(self, *,
             operator,
             other
@@ -3175,11 +3236,11 @@ class Frame(ContainerOperand):
             return matmul(other, self)
 
         if isinstance(other, Frame):
-            # reindex both dimensions to union indices
+            # reindex both dimensions to union indices; the union of equal indices returns the same Index, and aligned operands are not reindexed
             columns = self._columns.union(other._columns)
             index = self._index.union(other._index)
-            self_tb = self.reindex(columns=columns, index=index)._blocks
-            other_tb = other.reindex(columns=columns, index=index)._blocks
+            self_tb = self._blocks_aligned(index, columns)
+            other_tb = other._blocks_aligned(index, columns)
             return self.__class__(self_tb._ufunc_binary_operator(
                     operator=operator, other=other_tb),
                     index=index,
@@ -3466,8 +3527,8 @@ class Frame(ContainerOperand):
 
         groups, locations = array_to_groups_and_locations(values)
 
-        for idx, group in enumerate(groups):
-            selection = locations == idx
+        for group, selection in zip(groups,
+                locations_to_selections(locations, len(groups))):
 
             if axis == 0:
                 # axis 0 is a row iter, so need to slice index, keep columns
@@ -4201,14 +4262,8 @@ class Frame(ContainerOperand):
             func: function to apply to ``data_fields``, or a dictionary of labelled functions to apply to data fields, producing an additional hierarchical level.
         '''
         if func is None:
-            # form the equivalent Series function for summing
-            func = partial(ufunc_axis_skipna,
-                    skipna=True,
-                    axis=0,
-                    ufunc=np.sum,
-                    ufunc_skipna=np.nansum
-                    )
-            func_map = (('', func),)
+            # the equivalent of summing with skipna
+            func_map = (('', np.nansum),)
         elif callable(func):
             func_map = (('', func),) # store iterable of pairs
         else:
@@ -4237,24 +4292,29 @@ class Frame(ContainerOperand):
             index_loc = index_fields[0]
         else:
             index_loc = index_fields
-        # will return np.array or frozen set
-        index_values = ufunc_unique(
+        # factorize: locations are the index position of each row
+        index_values, index_locations = ufunc_unique_and_locations(
                 self._blocks._extract_array(
-                        column_key=self._columns.loc_to_iloc(index_loc)),
-                axis=0)
+                        column_key=self._columns.loc_to_iloc(index_loc)))
 
         if idx_start_columns == 1:
             index = Index(index_values, name=index_fields[0])
         else:
             index = IndexHierarchy.from_labels(index_values, name=tuple(index_fields))
 
-        # Colect bundle of values for from_product constrcution if columns.
+        # Colect bundle of values for from_product constrcution if columns; combine the locations of each field into a position in the product
         columns_product = []
+        columns_locations = np.zeros(len(index_locations), dtype=DTYPE_INT_DEFAULT)
         for field in columns_fields:
             # Take one at a time
-            columns_values = ufunc_unique(
+            columns_values, locations = ufunc_unique_and_locations(
                     self._blocks._extract_array(column_key=self._columns.loc_to_iloc(field)))
             columns_product.append(columns_values)
+            columns_locations = columns_locations * len(columns_values) + locations
+
+        count_product = 1
+        for columns_values in columns_product:
+            count_product *= len(columns_values)
 
         # For data fields, we add the field name, not the field values, to the columns.
         columns_name = tuple(columns_fields)
@@ -4278,55 +4338,429 @@ class Frame(ContainerOperand):
                     columns_product[0],
                     name=columns_name[0])
 
-        def items():
-            func_single = func_map[0][1] if len(func_map) == 1 else None
-
-            for group, sub in self.iter_group_items(fields_group):
-                index_label = group[:idx_start_columns]
-                index_label = tuple(index_label) if len(index_label) > 1 else index_label[0]
-
-                # get the found parts of the columns labels from the group; this will never have data_fields
-                columns_label_raw = group[idx_start_columns:]
-
-                if len(columns_label_raw) == 0:
-                    # if none, it means we just have data fields
-                    columns_labels = data_fields
-                elif len(columns_label_raw) == 1 and len(data_fields) == 1:
-                    # only one data field, do not need to display it
-                    columns_labels = repeat(columns_label_raw[0])
-                elif len(columns_label_raw) > 1 and len(data_fields) == 1:
-                    # only one data field
-                    columns_labels = repeat(tuple(columns_label_raw))
-                elif len(columns_label_raw) >= 1 and len(data_fields) > 1:
-                    # create column labels that has an entry for each data field
-                    if len(columns_label_raw) == 1:
-                        columns_labels = ((columns_label_raw[0], v) for v in data_fields)
-                    else:
-                        columns_labels = (tuple(chain(columns_label_raw, (v,))) for v in data_fields)
+        # each cell, a position in the index and the columns product, is a group; sort rows by cell
+        cells = index_locations * count_product + columns_locations
+        order = np.argsort(cells, kind=DEFAULT_SORT_KIND)
+        cells = cells[order]
+        is_start = np.empty(len(cells), dtype=DTYPE_BOOL)
+        is_start[:1] = True
+        np.not_equal(cells[1:], cells[:-1], out=is_start[1:])
+        cells_locations = is_start.cumsum() - 1
+        starts = np.flatnonzero(is_start)
+        counts = np.diff(np.append(starts, len(cells)))
+        cells = cells[starts]
+
+        def reduce(values: np.ndarray, func: AnyCallable) -> np.ndarray:
+            reduction = UFUNC_TO_GROUP_REDUCE.get(func)
+            if reduction is not None and group_reduce_supported(values.dtype, reduction[0]):
+                return array_group_reduce(values,
+                        locations=cells_locations,
+                        counts=counts,
+                        func=reduction[0],
+                        skipna=reduction[1])
+            post, _ = iterable_to_array_1d(func(values[start: start + count])
+                    for start, count in zip(starts, counts))
+            return post
+
+        is_filled = len(cells) == len(index) * count_product
+        if not is_filled and fill_value is FILL_VALUE_DEFAULT:
+            fill_value = dtype_to_na(DTYPE_OBJECT)
+
+        reductions = []
+        for field in data_fields:
+            values = self._blocks._extract_array(
+                    column_key=self._columns.loc_to_iloc(field))[order]
+            for _, func in func_map:
+                reductions.append(reduce(values, func))
+
+        rows = cells // count_product
+        columns_product_iloc = cells % count_product
+        shape = (len(index), count_product)
+        arrays = []
+        for post in reductions:
+            if is_filled:
+                array = np.empty(shape, dtype=post.dtype)
+            else:
+                array = np.full(shape,
+                        fill_value,
+                        dtype=resolve_dtype(post.dtype, np.array(fill_value).dtype))
+            array[rows, columns_product_iloc] = post
+            array.flags.writeable = False
+            arrays.append(array)
 
-                for field, column_label in zip(data_fields, columns_labels):
-                    # NOTE: sub[field] produces a Series, which is not needed; better to go to blocks and extract array
-                    if func_single:
-                        yield (index_label, column_label), func_single(sub[field].values)
-                    else:
-                        for label, func in func_map:
-                            if isinstance(column_label, tuple):
-                                column_label_final = column_label + (label,)
-                            else: # a single hashable
-                                column_label_final = (column_label, label)
-                            yield (index_label, column_label_final), func(sub[field].values)
-
-        return self.__class__.from_element_loc_items(
-                items(),
+        if len(arrays) == 1:
+            blocks = TypeBlocks.from_blocks(arrays)
+        else:
+            # columns are ordered by product position, then data field, then function
+            blocks = TypeBlocks.from_blocks(TypeBlocks.consolidate_blocks(
+                    a[:, i] for i in range(count_product) for a in arrays))
+
+        return self.__class__(blocks,
                 index=index,
                 columns=columns,
-                dtype=None, # supply if possible,
-                fill_value=fill_value,
+                own_data=True,
                 own_index=True,
                 own_columns=True
                 )
 
+    def _group_reduce_validate(self,
+            func: str,
+            columns_key: GetItemKeyType,
+            ) -> None:
+        '''
+        Raise if any column selected by ``columns_key`` cannot be reduced by group with ``func``.
+        '''
+        if func not in GROUP_REDUCE_FUNCS:
+            return # raised when reducing
+        for label, dtype in zip(self._columns[columns_key], self._blocks.dtypes[columns_key]):
+            if not group_reduce_supported(dtype, func):
+                raise NotImplementedError(f'no support for group reduction {func} of column {label!r}, of dtype: {dtype}')
 
+    def _group_reduce_to_frame(self,
+            groups: np.ndarray,
+            blocks: TypeBlocks,
+            labels: IndexBase,
+            name: tp.Hashable,
+            axis: int,
+            ) -> 'Frame':
+        '''
+        Given groups and the TypeBlocks of their reductions, return a Frame labelled by group on ``axis``, and by ``labels`` on the opposite axis.
+        '''
+        if groups.ndim == 2 and groups.shape[1] == 1:
+            groups = groups[:, 0]
+
+        if axis == 0:
+            if groups.ndim == 2:
+                index = IndexHierarchy.from_labels(groups, name=name)
+            else:
+                index = Index(groups, name=name)
+            return self.__class__(blocks,
+                    index=index,
+                    columns=labels,
+                    own_data=True,
+                    own_index=True)
+
+        if groups.ndim == 2:
+            columns = self._COLUMNS_HIERARCHY_CONSTRUCTOR.from_labels(groups, name=name)
+        else:
+            columns = self._COLUMNS_CONSTRUCTOR(groups, name=name)
+        return self.__class__(blocks,
+                index=labels,
+                columns=columns,
+                own_data=True,
+                own_columns=True)
+
+    def group_reduce(self,
+            key: KeyOrKeys,
+            func: str = 'sum',
+            *,
+            axis: int = 0,
+            skipna: bool = True,
+            ) -> 'Frame':
+        '''
+        Group by the values of one or more columns (or rows, if ``axis`` is 1), and reduce all other columns (or rows) by group, returning a Frame with a label for each group. This is equivalent to, but much faster than, applying a reduction with ``iter_group``.
+
+        Args:
+            key: one or more column labels (or index labels, if ``axis`` is 1) to group by.
+            func: one of 'sum', 'mean', 'min', 'max', 'count', 'std', 'first', or 'last'.
+            axis: if 0, group rows; if 1, group columns.
+            skipna: if True, missing values are excluded.
+        '''
+        if axis == 0:
+            labels = self._columns
+        elif axis == 1:
+            labels = self._index
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        iloc_key = labels.loc_to_iloc(key)
+        remain = np.full(len(labels), True, dtype=DTYPE_BOOL)
+        remain[iloc_key] = False
+        if axis == 0:
+            self._group_reduce_validate(func, remain)
+
+        groups, blocks = self._blocks.group_reduce(
+                axis=axis,
+                key=iloc_key,
+                func=func,
+                skipna=skipna)
+
+        name = labels[iloc_key]
+        if isinstance(name, IndexBase):
+            name = tuple(name) if len(name) > 1 else name[0]
+
+        return self._group_reduce_to_frame(groups,
+                blocks,
+                labels[remain],
+                name,
+                axis)
+
+    def group_labels_reduce(self,
+            depth_level: DepthLevelSpecifier = 0,
+            func: str = 'sum',
+            *,
+            axis: int = 0,
+            skipna: bool = True,
+            ) -> 'Frame':
+        '''
+        Group by the labels of one or more depths of the index (or columns, if ``axis`` is 1), and reduce all columns (or rows) by group, returning a Frame with a label for each group. This is equivalent to, but much faster than, applying a reduction with ``iter_group_labels``.
+
+        Args:
+            depth_level: one or more depths of the index (or columns) to group by.
+            func: one of 'sum', 'mean', 'min', 'max', 'count', 'std', 'first', or 'last'.
+            axis: if 0, group rows; if 1, group columns.
+            skipna: if True, missing values are excluded.
+        '''
+        if axis == 0:
+            ref_index = self._index
+            labels = self._columns
+        elif axis == 1:
+            ref_index = self._columns
+            labels = self._index
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        if axis == 0:
+            self._group_reduce_validate(func, NULL_SLICE)
+
+        groups, locations = array_to_groups_and_locations(
+                ref_index.values_at_depth(depth_level))
+        blocks = self._blocks.group_locations_reduce(
+                axis=axis,
+                locations=locations,
+                count=len(groups),
+                func=func,
+                skipna=skipna)
+
+        return self._group_reduce_to_frame(groups,
+                blocks,
+                labels,
+                None,
+                axis)
+
+    def window_reduce(self,
+            size: int,
+            func: str = 'mean',
+            *,
+            axis: int = 0,
+            step: int = 1,
+            window_sized: bool = True,
+            label_shift: int = 0,
+            start_shift: int = 0,
+            size_increment: int = 0,
+            skipna: bool = True,
+            ) -> 'Frame':
+        '''
+        Reduce all columns (or rows, if ``axis`` is 1) by window, returning a Frame with a label for each window. Windows are determined as with ``iter_window``, to which this is equivalent, but much faster than, applying a reduction.
+
+        Args:
+            size: integer greater than 0.
+            func: one of 'sum', 'mean', 'min', 'max', 'count', or 'std'.
+            axis: if 0, windows are taken over rows; if 1, windows are taken over columns.
+            step: integer greater than or equal to 0 to determine the step size between windows.
+            window_sized: if True, windows that do not meet the size are skipped.
+            label_shift: shift, relative to the right-most data point contained in the window, to derive the label to be paired with the window.
+            start_shift: shift from 0 to determine where the collection of windows begins.
+            size_increment: value to be added to each window after the first, so as to, in combination with setting the step size to 0, permit expanding windows.
+            skipna: if True, missing values are excluded.
+        '''
+        if axis == 0:
+            ref_index = self._index
+        elif axis == 1:
+            ref_index = self._columns
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        starts, stops, label_ilocs = axis_window_bounds(
+                count=len(ref_index),
+                size=size,
+                step=step,
+                window_sized=window_sized,
+                label_shift=label_shift,
+                start_shift=start_shift,
+                size_increment=size_increment)
+        blocks = self._blocks.window_reduce(
+                axis=axis,
+                starts=starts,
+                stops=stops,
+                func=func,
+                skipna=skipna)
+        labels = ref_index._extract_iloc(label_ilocs)
+
+        if axis == 0:
+            return self.__class__(blocks,
+                    index=labels,
+                    columns=self._columns,
+                    name=self._name,
+                    own_data=True,
+                    own_index=True)
+        return self.__class__(blocks,
+                index=self._index,
+                columns=labels,
+                name=self._name,
+                own_data=True)
+
+    def expanding_reduce(self,
+            func: str = 'mean',
+            *,
+            axis: int = 0,
+            size: int = 1,
+            skipna: bool = True,
+            ) -> 'Frame':
+        '''
+        Reduce all columns (or rows, if ``axis`` is 1) by expanding window, where the first window includes the first ``size`` rows (or columns) and each subsequent window one more, returning a Frame labelled by the last label of each window. This is equivalent to, but much faster than, applying a reduction with ``iter_window`` with a ``step`` of 0 and a ``size_increment`` of 1.
+
+        Args:
+            func: one of 'sum', 'mean', 'min', 'max', 'count', or 'std'.
+            axis: if 0, windows are taken over rows; if 1, windows are taken over columns.
+            size: integer greater than 0; the size of the first window.
+            skipna: if True, missing values are excluded; otherwise, all windows after a missing value are missing.
+        '''
+        return self.window_reduce(size,
+                func,
+                axis=axis,
+                step=0,
+                size_increment=1,
+                skipna=skipna)
+
+    def join(self,
+            other: 'Frame',
+            *,
+            how: str = 'inner',
+            left_columns: KeyOrKeys = None,
+            right_columns: KeyOrKeys = None,
+            left_template: tp.Optional[str] = None,
+            right_template: tp.Optional[str] = None,
+            fill_value: object = np.nan,
+            ) -> 'Frame':
+        '''
+        Join with another Frame on the values of one or more columns, or on the labels of the index, returning a Frame with the columns of this Frame followed by the columns of ``other``. Keys are factorized and matched together, and rows are taken from each block; rows without a match in the other Frame are filled with ``fill_value``.
+
+        If both Frames are joined on the same column labels, the key columns of ``other`` are not repeated; if both Frames are joined on the index, the result is indexed by the joined labels; otherwise, the result has an auto-incremented integer index.
+
+        Args:
+            other: the Frame to join.
+            how: one of 'inner', 'left', 'right', or 'outer'.
+            left_columns: one or more columns of this Frame to join on; if None, the labels of the index (at all depths) are used.
+            right_columns: one or more columns of ``other`` to join on; if None, the labels of the index of ``other`` (at all depths) are used.
+            left_template: if provided, a format string applied to the column labels of this Frame.
+            right_template: if provided, a format string applied to the column labels of ``other``.
+            fill_value: value used for the columns of a Frame that has no row matching a row of the other Frame.
+        '''
+        def keys(frame: 'Frame', columns: KeyOrKeys) -> tp.Tuple[tp.List[int], tp.List[np.ndarray]]:
+            if columns is None:
+                index = frame._index
+                return [], [index.values_at_depth(d) for d in range(index.depth)]
+            ilocs = [frame._columns.loc_to_iloc(c) for c in key_normalize(columns)]
+            return ilocs, [frame._blocks._extract_array(column_key=i) for i in ilocs]
+
+        left_ilocs, left_keys = keys(self, left_columns)
+        right_ilocs, right_keys = keys(other, right_columns)
+
+        positions_left, positions_right = join_locations(left_keys, right_keys, how)
+
+        # on the index, or on the same columns, keys are coalesced from both Frames
+        on_index = left_columns is None and right_columns is None
+        on_same = (left_columns is not None and right_columns is not None
+                and key_normalize(left_columns) == key_normalize(right_columns))
+        keys_coalesced = []
+        if on_index or on_same:
+            unmatched = positions_left < 0
+            positions = np.where(unmatched, len(self) + positions_right, positions_left)
+            for array_left, array_right in zip(left_keys, right_keys):
+                keys_coalesced.append(
+                        concat_resolved((array_left, array_right))[positions])
+
+        blocks_left = self._blocks.take_rows_fill(positions_left, fill_value)
+        if on_same and unmatched.any():
+            for iloc, array in zip(left_ilocs, keys_coalesced):
+                blocks_left = blocks_left.extract_iloc_assign((NULL_SLICE, iloc), array)
+
+        columns_right: GetItemKeyType = NULL_SLICE
+        if on_same:
+            columns_right = [i for i in range(other.shape[1]) if i not in set(right_ilocs)]
+        blocks_right = other._blocks._extract(column_key=columns_right).take_rows_fill(
+                positions_right, fill_value)
+
+        labels_left: tp.Iterable[tp.Hashable] = self._columns
+        if left_template is not None:
+            labels_left = (left_template.format(label) for label in labels_left)
+        labels_right: tp.Iterable[tp.Hashable] = other._columns[columns_right]
+        if right_template is not None:
+            labels_right = (right_template.format(label) for label in labels_right)
+
+        if on_index:
+            if len(keys_coalesced) == 1:
+                index = self._index.__class__(keys_coalesced[0], name=self._index.name)
+            else:
+                index = IndexHierarchy.from_labels(zip(*keys_coalesced), name=self._index.name)
+            own_index = True
+        else:
+            index = IndexAutoFactory
+            own_index = False
+
+        return self.__class__(
+                TypeBlocks.from_blocks(chain(blocks_left._blocks, blocks_right._blocks)),
+                index=index,
+                columns=list(chain(labels_left, labels_right)),
+                own_data=True,
+                own_index=own_index)
+
+    def join_asof(self,
+            other: 'Frame',
+            *,
+            by: KeyOrKeys = None,
+            tolerance: tp.Any = None,
+            left_template: tp.Optional[str] = None,
+            right_template: tp.Optional[str] = None,
+            fill_value: object = np.nan,
+            ) -> 'Frame':
+        '''
+        Join with another Frame as of the labels of the index, such as timestamps: for each row of this Frame, take the last row of ``other`` with an index label at or before the index label of that row. Returns a Frame with the index and columns of this Frame, followed by the columns of ``other``. Rows of ``other`` are found with ``np.searchsorted`` and taken block by block; rows without a match are filled with ``fill_value``.
+
+        Args:
+            other: the Frame to join.
+            by: one or more column labels, found in both Frames, that must also match; these columns of ``other`` are not repeated.
+            tolerance: if provided, the maximum difference between the label of a row and the label of the matched row of ``other``, as a ``np.timedelta64`` for dates.
+            left_template: if provided, a format string applied to the column labels of this Frame.
+            right_template: if provided, a format string applied to the column labels of ``other``.
+            fill_value: value used for the columns of ``other`` where there is no matching row.
+        '''
+        if by is None:
+            left_by: tp.List[np.ndarray] = []
+            right_by: tp.List[np.ndarray] = []
+            columns_right: GetItemKeyType = NULL_SLICE
+        else:
+            by = key_normalize(by)
+            left_by = [self._blocks._extract_array(column_key=self._columns.loc_to_iloc(c))
+                    for c in by]
+            right_ilocs = [other._columns.loc_to_iloc(c) for c in by]
+            right_by = [other._blocks._extract_array(column_key=i) for i in right_ilocs]
+            right_ilocs_exclude = set(right_ilocs)
+            columns_right = [i for i in range(other.shape[1]) if i not in right_ilocs_exclude]
+
+        positions = join_asof_locations(
+                self._index.values,
+                other._index.values,
+                left_by=left_by,
+                right_by=right_by,
+                tolerance=tolerance)
+        blocks_right = other._blocks._extract(column_key=columns_right).take_rows_fill(
+                positions, fill_value)
+
+        labels_left: tp.Iterable[tp.Hashable] = self._columns
+        if left_template is not None:
+            labels_left = (left_template.format(label) for label in labels_left)
+        labels_right: tp.Iterable[tp.Hashable] = other._columns[columns_right]
+        if right_template is not None:
+            labels_right = (right_template.format(label) for label in labels_right)
+
+        return self.__class__(
+                TypeBlocks.from_blocks(chain(self._blocks._blocks, blocks_right._blocks)),
+                index=self._index,
+                columns=list(chain(labels_left, labels_right)),
+                name=self._name,
+                own_data=True)
 
     #---------------------------------------------------------------------------
     # utility function to numpy array
@@ -4815,11 +5249,10 @@ class FrameGO(Frame):
         row_count = len(self._index)
 
         if isinstance(value, Series):
-            # NOTE: performance test if it is faster to compare indices and not call reindex() if we can avoid it?
-            # select only the values matching our index
-            self._blocks.append(
-                    value.reindex(
-                    self.index, fill_value=fill_value).values)
+            # select only the values matching our index; comparing indices is faster than reindexing aligned values
+            if _requires_reindex(self._index, value._index):
+                value = value.reindex(self._index, fill_value=fill_value)
+            self._blocks.append(value.values)
         elif isinstance(value, np.ndarray): # is numpy array
             # this permits unaligned assignment as no index is used, possibly remove
             if value.ndim != 1 or len(value) != row_count:
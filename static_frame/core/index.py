@@ -4,6 +4,7 @@ import operator as operator_mod
 from itertools import zip_longest
 
 from functools import reduce
+from functools import partial
 
 import numpy as np
 
@@ -14,10 +15,14 @@ from static_frame.core.util import EMPTY_SLICE
 from static_frame.core.util import SLICE_ATTRS
 from static_frame.core.util import SLICE_START_ATTR
 from static_frame.core.util import SLICE_STOP_ATTR
+from static_frame.core.util import SLICE_STEP_ATTR
 from static_frame.core.util import BOOL_TYPES
 from static_frame.core.util import KEY_ITERABLE_TYPES
 from static_frame.core.util import EMPTY_ARRAY
 from static_frame.core.util import DTYPE_DATETIME_KIND
+from static_frame.core.util import DTYPE_SEARCHABLE_KIND
+from static_frame.core.util import DTYPE_STR_KIND
+from static_frame.core.util import DTYPE_NAT_KIND
 
 from static_frame.core.util import GetItemKeyType
 from static_frame.core.util import CallableOrMapping
@@ -29,6 +34,22 @@ from static_frame.core.util import DepthLevelSpecifier
 from static_frame.core.util import ufunc_axis_skipna
 from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import isin
+from static_frame.core.util import ufunc_unique
+from static_frame.core.util import is_strictly_ascending
+from static_frame.core.util import is_unique_sortable
+from static_frame.core.util import is_regular_ascending
+from static_frame.core.util import regular_label_to_pos
+from static_frame.core.util import regular_positions
+from static_frame.core.util import DTYPE_REGULAR_KIND
+from static_frame.core.util import searchable_dtype_match
+from static_frame.core.util import searchable_element_match
+from static_frame.core.util import searchsorted_positions
+from static_frame.core.util import searchable_sorter
+from static_frame.core.util import SORTER_KEY_FRACTION_MIN
+from static_frame.core.util import DTYPE_NAN_KIND
+from static_frame.core.util import INEXACT_TYPES
+from static_frame.core.util import union_sorted
+from static_frame.core.util import intersect_sorted
 
 from static_frame.core.util import immutable_filter
 from static_frame.core.util import name_filter
@@ -36,6 +57,8 @@ from static_frame.core.util import array_shift
 from static_frame.core.util import array2d_to_tuples
 
 from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_OBJECT
+from static_frame.core.util import DTYPE_BOOL
 
 from static_frame.core.selector_node import InterfaceGetItem
 from static_frame.core.selector_node import InterfaceSelection1D
@@ -45,12 +68,14 @@ from static_frame.core.util import to_datetime64
 
 
 from static_frame.core.util import resolve_dtype
+from static_frame.core.util import dtype_from_element
 from static_frame.core.container import ContainerOperand
 from static_frame.core.container_util import matmul
 
 
 from static_frame.core.doc_str import doc_inject
 from static_frame.core.index_base import IndexBase
+from static_frame.core.array_map import ArrayMap
 # from static_frame.core.iter_node import IterNode
 from static_frame.core.iter_node import IterNodeDepthLevel
 from static_frame.core.iter_node import IterNodeType
@@ -94,24 +119,82 @@ class ILoc(metaclass=ILocMeta):
 
 class LocMap:
 
+    @staticmethod
+    def sorted_label_to_pos(
+            labels: np.ndarray,
+            label: tp.Hashable,
+            ) -> tp.Optional[int]:
+        '''Alternative to a mapping get() method for strictly ascending ``labels``: find the position of ``label`` with a binary search, returning None if not found.
+        '''
+        if not searchable_element_match(labels.dtype, label):
+            return None
+        pos = labels.searchsorted(label)
+        if pos < len(labels) and labels[pos] == label:
+            return pos
+        return None
+
+    @staticmethod
+    def nan_label_to_pos(
+            labels: np.ndarray,
+            label: tp.Hashable,
+            ) -> tp.Optional[int]:
+        '''Return the position of a NaN ``label`` in float ``labels``, which a mapping cannot find as NaN is not equal to itself; return None if ``label`` is not NaN or is not found.
+        '''
+        if (labels.dtype.kind in DTYPE_NAN_KIND
+                and isinstance(label, INEXACT_TYPES)
+                and label != label):
+            matches = np.flatnonzero(np.isnan(labels))
+            if len(matches):
+                return int(matches[0])
+        return None
+
+    @staticmethod
+    def key_to_searchable(
+            labels: np.ndarray,
+            key: tp.Union[tp.List[tp.Hashable], np.ndarray],
+            ) -> GetItemKeyType:
+        '''Convert a list or object array of labels to a typed array if that array can be searched for in ``labels`` with the same result as mapping lookups; otherwise, return the key unchanged.
+        '''
+        # keys to string labels are excluded, as array creation coerces non-string elements to strings
+        if labels.dtype.kind in DTYPE_STR_KIND:
+            return key
+        try:
+            key_array = np.array(key if isinstance(key, list) else key.tolist())
+        except ValueError: # elements of inconsistent shape
+            return key
+        if key_array.ndim == 1 and searchable_dtype_match(labels.dtype, key_array.dtype):
+            return key_array
+        return key
+
     @staticmethod
     def map_slice_args(
             label_to_pos: tp.Callable[[tp.Iterable[tp.Hashable]], int],
             key: slice,
             labels: tp.Optional[np.ndarray] = None,
-            offset: tp.Optional[int] = 0
+            offset: tp.Optional[int] = 0,
+            labels_sorted: bool = False,
             ) -> tp.Iterator[int]:
         '''Given a slice ``key`` and a label-to-position mapping, yield each integer argument necessary to create a new iloc slice. If the ``key`` defines a region with no constituents, raise ``LocEmpty``
 
         Args:
             label_to_pos: callable into mapping (can be a get() method from a dictionary)
+            labels_sorted: if True, ``labels`` are strictly ascending, permitting binary search of datetime64 slice bounds given in a coarser unit.
         '''
         offset_apply = not offset is None
+        # when offset, open bounds must be limited to the offset labels
+        bound_open = (offset_apply
+                and labels is not None
+                and (key.step is None or key.step > 0))
 
         for field in SLICE_ATTRS:
             attr = getattr(key, field)
             if attr is None:
-                yield None
+                if bound_open and field is SLICE_START_ATTR:
+                    yield offset
+                elif bound_open and field is SLICE_STOP_ATTR:
+                    yield offset + len(labels)
+                else:
+                    yield None
             elif isinstance(attr, np.datetime64):
                 # if a datetime, we assume that the labels are ordered;
                 if attr.dtype == labels.dtype:
@@ -123,6 +206,22 @@ class LocMap:
                     if field == SLICE_STOP_ATTR:
                         pos += 1 # stop is inclusive
 
+                elif (labels_sorted
+                        and labels.dtype.kind == DTYPE_DATETIME_KIND
+                        and np.can_cast(attr.dtype, labels.dtype)
+                        and field != SLICE_STEP_ATTR):
+                    # attr is of a coarser unit: all labels within the period of attr are contiguous, and are bounded by the start of this period and the start of the next period
+                    period_start = attr.astype(labels.dtype)
+                    period_stop = (attr + 1).astype(labels.dtype)
+                    if field == SLICE_START_ATTR:
+                        pos = labels.searchsorted(period_start)
+                        if pos == len(labels) or labels[pos] >= period_stop:
+                            raise LocEmpty()
+                    else: # stop is exclusive of the next period
+                        pos = labels.searchsorted(period_stop)
+                        if pos == 0 or labels[pos - 1] < period_start:
+                            raise LocEmpty()
+
                 elif field == SLICE_START_ATTR:
                     # convert to the type of the atrs; this should get the relevant start
                     pos = label_to_pos(attr.astype(labels.dtype))
@@ -165,17 +264,23 @@ class LocMap:
 
     @classmethod
     def loc_to_iloc(cls, *,
-            label_to_pos: tp.Dict,
+            label_to_pos: tp.Union[tp.Dict[tp.Hashable, int], ArrayMap],
             labels: np.ndarray,
             positions: np.ndarray,
             key: GetItemKeyType,
-            offset: tp.Optional[int] = None
+            offset: tp.Optional[int] = None,
+            labels_sorted: bool = False,
+            labels_sorter: tp.Optional[tp.Tuple[np.ndarray, np.ndarray]] = None,
+            labels_regular: bool = False,
             ) -> GetItemKeyType:
         '''
         Note: all SF objects (Series, Index) need to be converted to basic types before being passed as `key` to this function.
 
         Args:
             offset: in the contect of an IndexHierarchical, the iloc positions returned from this funcition need to be shifted.
+            labels_sorted: if True, ``labels`` are strictly ascending, and slices and arrays of labels are resolved with binary search rather than mapping lookups.
+            labels_sorter: if provided, integer positions that sort ``labels`` and the sorted ``labels``, permitting arrays of labels to be resolved with binary search when ``labels`` are not sorted.
+            labels_regular: if True, ``labels`` ascend by a constant step, and arrays of labels of a compatible dtype are resolved by arithmetic.
         Returns:
             An integer mapped slice, or GetItemKey type that is based on integers, compatible with TypeBlocks
         '''
@@ -187,12 +292,17 @@ class LocMap:
             if offset_apply and key == NULL_SLICE:
                 # when offset is defined (even if it is zero), null slice is not sufficiently specific; need to convert to an explict slice relative to the offset
                 return slice(offset, len(positions) + offset)
+            if labels_sorted:
+                label_to_pos_get = partial(cls.sorted_label_to_pos, labels)
+            else:
+                label_to_pos_get = label_to_pos.get
             try:
                 return slice(*cls.map_slice_args(
-                        label_to_pos.get,
+                        label_to_pos_get,
                         key,
                         labels,
-                        offset)
+                        offset,
+                        labels_sorted)
                         )
             except LocEmpty:
                 return EMPTY_SLICE
@@ -223,16 +333,59 @@ class LocMap:
                     return positions[key] + offset
                 return positions[key]
 
+            if is_array and key.ndim == 1:
+                post = None
+                if labels_regular:
+                    # resolve all labels by arithmetic
+                    post = regular_positions(labels, key)
+                if post is None and (labels_sorted or labels_sorter is not None):
+                    if searchable_dtype_match(labels.dtype, key.dtype):
+                        # resolve all labels with one binary search
+                        post = searchsorted_positions(labels,
+                                key,
+                                sorter=None if labels_sorted else labels_sorter,
+                                )
+                elif isinstance(label_to_pos, ArrayMap):
+                    # resolve all labels with vectorized hash probing
+                    post = label_to_pos.get_positions(key)
+                if post is not None:
+                    pos, found = post
+                    if not found.all():
+                        raise KeyError(key[~found][0])
+                    if offset_apply:
+                        return pos + offset
+                    return pos
+
             # map labels to integer positions
             # NOTE: we may miss the opportunity to get a reference from values when we have contiguous keys
-            if offset_apply:
-                return [label_to_pos[x] + offset for x in key]
-            return [label_to_pos[x] for x in key]
+            try:
+                if offset_apply:
+                    return [label_to_pos[x] + offset for x in key]
+                return [label_to_pos[x] for x in key]
+            except KeyError:
+                if labels.dtype.kind not in DTYPE_NAN_KIND:
+                    raise
+            # labels may include NaN
+            post = []
+            for x in key:
+                pos = label_to_pos.get(x)
+                if pos is None:
+                    pos = cls.nan_label_to_pos(labels, x)
+                    if pos is None:
+                        raise KeyError(x)
+                post.append(pos if not offset_apply else pos + offset)
+            return post
 
         # if a single element (an integer, string, or date, we just get the integer out of the map
+        try:
+            pos = label_to_pos[key]
+        except KeyError:
+            pos = cls.nan_label_to_pos(labels, key)
+            if pos is None:
+                raise
         if offset_apply:
-            return label_to_pos[key] + offset
-        return label_to_pos[key]
+            return pos + offset
+        return pos
 
 
 def immutable_index_filter(index: I) -> I:
@@ -275,9 +428,20 @@ _INDEX_SLOTS = (
         '_positions',
         '_recache',
         '_loc_is_iloc',
+        '_sorted',
+        '_sorter',
+        '_regular',
         '_name'
         )
 
+# slots excluded from pickles, as they can be derived from labels
+_INDEX_SLOTS_DERIVED = frozenset((
+        '_map',
+        '_positions',
+        '_sorter',
+        '_labels_mutable',
+        ))
+
 @doc_inject(selector='index_init')
 class Index(IndexBase):
     '''A mapping of labels to positions, immutable and of fixed size. Used by default in :obj:`Series` and as index and columns in :obj:`Frame`. Base class of all 1D indices.
@@ -298,29 +462,31 @@ class Index(IndexBase):
     # for compatability with IndexHierarchy, where this is implemented as a property method
     depth: int = 1
 
-    _map: tp.Dict[tp.Hashable, tp.Any]
+    _map: tp.Optional[tp.Union[tp.Dict[tp.Hashable, tp.Any], ArrayMap]]
     _labels: np.ndarray
     _positions: np.ndarray
     _recache: bool
     _loc_is_iloc: bool
+    _sorted: tp.Optional[bool]
+    _sorter: tp.Optional[tp.Tuple[np.ndarray, np.ndarray]]
+    _regular: tp.Optional[bool]
     _name: tp.Hashable
 
     #---------------------------------------------------------------------------
     # methods used in __init__ that are customized in dervied classes; there, we need to mutate instance state, this these are instance methods
     @staticmethod
     def _extract_labels(
-            mapping,
-            labels,
+            labels: IndexInitializer,
             dtype: tp.Optional[np.dtype] = None
             ) -> np.ndarray:
-        '''Derive labels, a cache of the mapping keys in a sequence type (either an ndarray or a list).
+        '''Derive labels, a cache of the labels in a sequence type (either an ndarray or a list).
 
-        If the labels passed at instantiation are an ndarray, they are used after immutable filtering. Otherwise, the mapping keys are used to create an ndarray.
+        If the labels passed at instantiation are an ndarray, they are used after immutable filtering. Otherwise, the labels are used to create an ndarray.
 
         This method is overridden in the derived class.
 
         Args:
-            labels: might be an expired Generator, but if it is an immutable ndarray, we can use it without a copy.
+            labels: an iterable of hashables; can be a generator.
         '''
         # pre-fetching labels for faster get_item construction
         if isinstance(labels, np.ndarray):
@@ -331,40 +497,28 @@ class Index(IndexBase):
         if hasattr(labels, '__len__'): # not a generator, not an array
             # resolving the detype is expensive, pass if possible
             labels, _ = iterable_to_array_1d(labels, dtype=dtype)
-
-        else: # labels may be an expired generator, must use the mapping
-
-            # NOTE: explore why this does not work
-            # if dtype is None:
-            #     labels = np.array(list(mapping.keys()), dtype=object)
-            # else:
-            #     labels = np.fromiter(mapping.keys(), count=len(mapping), dtype=dtype)
-
-            labels_len = len(mapping)
-            if labels_len == 0:
+        else: # labels are a generator; if no dtype is given, labels are retained as objects
+            labels, _ = iterable_to_array_1d(labels,
+                    dtype=DTYPE_OBJECT if dtype is None else dtype)
+            if len(labels) == 0 and dtype is None:
                 labels = EMPTY_ARRAY
-            else:
-                labels = np.empty(labels_len, dtype=dtype if dtype else object)
-                for k, v in mapping.items():
-                    labels[v] = k
 
         labels.flags.writeable = False
         return labels
 
     @staticmethod
     def _extract_positions(
-            mapping,
-            positions: tp.Iterable[int]):
+            size: int,
+            positions: tp.Optional[np.ndarray]):
         # positions is either None or an ndarray
         if isinstance(positions, np.ndarray): # if an np array can handle directly
             return immutable_filter(positions)
 
-        return PositionsAllocator.get(len(mapping))
+        return PositionsAllocator.get(size)
 
     @staticmethod
     def _get_map(
-            labels: tp.Iterable[tp.Hashable],
-            positions=None
+            labels: np.ndarray,
             ) -> tp.Dict[tp.Hashable, int]:
         '''
         Return a dictionary mapping index labels to integer positions.
@@ -372,15 +526,22 @@ class Index(IndexBase):
         NOTE: this function is critical to Index performance.
 
         Args:
-            lables: an Iterable of hashables; can be a generator.
+            labels: a 1D array of hashables.
         '''
-        if positions is not None: # can zip both without new collection
-            return dict(zip(labels, positions))
-        if hasattr(labels, '__len__'):
-            # unhashable 2D numpy arrays will raise
-            return dict(zip(labels, range(len(labels))))
-        # support labels as a generator
-        return {v: k for k, v in enumerate(labels)}
+        # unhashable values will raise
+        return dict(zip(labels, range(len(labels))))
+
+    def _update_map_cache(self) -> None:
+        '''
+        Create the mapping of labels to positions. As many indices are never used for label lookups, this is deferred until first needed.
+        '''
+        if self._recache:
+            self._update_array_cache()
+        if self.STATIC and ArrayMap.supports(self._labels):
+            # a compact hash table for large indices of fixed-width labels; as labels cannot be added, not used for grow-only indices
+            self._map = ArrayMap(self._labels)
+        else:
+            self._map = self._get_map(self._labels)
 
     #---------------------------------------------------------------------------
     # constructors
@@ -406,9 +567,16 @@ class Index(IndexBase):
             ) -> None:
 
         self._recache: bool = False
-        self._map: tp.Dict[tp.Hashable, int] = None
+        # the mapping of labels to positions is created lazily, only when needed for lookups
+        self._map: tp.Optional[tp.Union[tp.Dict[tp.Hashable, int], ArrayMap]] = None
+        # evaluated lazily, only when needed for lookups
+        self._sorted: tp.Optional[bool] = None
+        self._sorter: tp.Optional[tp.Tuple[np.ndarray, np.ndarray]] = None
+        self._regular: tp.Optional[bool] = None
 
         positions = None
+        # labels from an Index are known to be unique
+        labels_unique = False
 
         # resolve the targetted labels dtype, by lookin at the class attr _DTYPE and/or the passed dtype argument
         if dtype is None:
@@ -433,10 +601,15 @@ class Index(IndexBase):
                 # get a reference to the immutable arrays, even if this is an IndexGO index, we can take the cached arrays, assuming they are up to date
                 positions = labels._positions
                 loc_is_iloc = labels._loc_is_iloc
+                labels_unique = True
+                self._sorted = labels._sorted
+                self._sorter = labels._sorter
+                self._regular = labels._regular
                 labels = labels._labels
             else: # IndexHierarchy
                 # will be a generator of tuples; already updated caches
                 labels = array2d_to_tuples(labels._labels)
+                labels_unique = True
         elif isinstance(labels, ContainerOperand):
             # it is a Series or similar
             array = labels.values
@@ -451,36 +624,90 @@ class Index(IndexBase):
             if not isinstance(labels, np.ndarray):
                 # for now, assume that if _DTYPE is defined, we have a date
                 labels = (to_datetime64(v, dtype_extract) for v in labels)
-            else: # coerce to target type
+                labels_unique = False
+            elif labels.dtype != dtype_extract: # coerce to target type
                 labels = labels.astype(dtype_extract)
+                # conversion to a coarser unit can produce duplicates
+                labels_unique = False
+                self._map = None
+                self._sorted = None
+                self._sorter = None
+                self._regular = None
 
         self._name = name if name is None else name_filter(name)
 
-        if self._map is None:
-            self._map = self._get_map(labels, positions)
-
         # this might be NP array, or a list, depending on if static or grow only; if an array, dtype will be compared with passed dtype_extract
-        self._labels = self._extract_labels(self._map, labels, dtype_extract)
-        self._positions = self._extract_positions(self._map, positions)
+        self._labels = self._extract_labels(labels, dtype_extract)
+        self._positions = self._extract_positions(len(self._labels), positions)
 
         if self._DTYPE and self._labels.dtype != self._DTYPE:
             raise ErrorInitIndex('invalid label dtype for this Index',
                     self._labels.dtype, self._DTYPE)
-        if len(self._map) != len(self._labels):
-            raise ErrorInitIndex(f'labels ({len(self._labels)}) have non-unique values ({len(self._map)})')
 
-        # NOTE: automatic discovery is possible, but not yet implemented
+        if not labels_unique:
+            if self._labels.dtype == DTYPE_OBJECT:
+                # uniqueness is determined by hashing; retain the mapping
+                self._map = self._get_map(self._labels)
+                labels_unique = len(self._map) == len(self._labels)
+            else:
+                # avoid creating the mapping by checking order, or sorting
+                if self._sorted is None:
+                    self._sorted = is_strictly_ascending(self._labels)
+                labels_unique = self._sorted or is_unique_sortable(self._labels)
+            if not labels_unique:
+                size_unique = (len(self._map) if self._map is not None
+                        else len(ufunc_unique(self._labels)))
+                raise ErrorInitIndex(f'labels ({len(self._labels)}) have non-unique values ({size_unique})')
+
+        labels_are_positions = loc_is_iloc
+        if (not loc_is_iloc
+                and self._labels.dtype == DTYPE_INT_DEFAULT
+                and len(self._labels)
+                and self._labels[0] == 0
+                and self._labels[-1] == len(self._labels) - 1):
+            # discover labels that are equal to their positions; as loc_is_iloc is not set, keys retain loc semantics, and are resolved by arithmetic on regular labels
+            if self._sorted is None:
+                self._sorted = is_strictly_ascending(self._labels)
+            labels_are_positions = self._sorted
+            if labels_are_positions:
+                self._regular = True
+
+        if labels_are_positions:
+            self._sorted = True
+            if self._labels.dtype == DTYPE_INT_DEFAULT:
+                # labels are positions: share the immutable positions array, and drop any reference to another array
+                self._labels = self._positions
+
         self._loc_is_iloc = loc_is_iloc
 
     #---------------------------------------------------------------------------
+    def __getstate__(self) -> tp.Tuple[None, tp.Dict[str, tp.Any]]:
+        '''
+        Exclude state that can be derived from labels, such as the mapping of labels to positions.
+        '''
+        if self._recache:
+            self._update_array_cache()
+        return None, {key: getattr(self, key)
+                for key in self.__slots__
+                if key not in _INDEX_SLOTS_DERIVED}
+
     def __setstate__(self, state):
         '''
-        Ensure that reanimated NP arrays are set not writeable.
+        Ensure that reanimated NP arrays are set not writeable; restore state excluded from the pickle, deferring creation of the mapping until needed.
         '''
         for key, value in state[1].items():
             setattr(self, key, value)
         self._labels.flags.writeable = False
 
+        if '_positions' not in state[1]:
+            self._map = None
+            self._sorter = None
+            self._positions = PositionsAllocator.get(len(self._labels))
+            if self._loc_is_iloc and self._labels.dtype == DTYPE_INT_DEFAULT:
+                self._labels = self._positions
+            if not self.STATIC:
+                self._labels_mutable = self._labels
+
     #---------------------------------------------------------------------------
     # name interface
 
@@ -694,12 +921,58 @@ class Index(IndexBase):
         if key_transform:
             key = key_transform(key)
 
+        if self._regular is None:
+            # labels that ascend by a constant step permit lookups by arithmetic
+            self._regular = is_regular_ascending(self._labels)
+            if self._regular:
+                self._sorted = True
+
+        if self._regular and searchable_element_match(self._labels.dtype, key):
+            pos = regular_label_to_pos(self._labels, key)
+            if pos is None:
+                raise KeyError(key)
+            return pos if offset is None else pos + offset
+
+        labels_searchable = False
+        if isinstance(key, np.ndarray) and key.dtype == DTYPE_BOOL:
+            labels_searchable = True
+        elif isinstance(key, (slice, np.ndarray, list)):
+            # only evaluate if a lookup can benefit from sorted labels
+            if self._sorted is None:
+                self._sorted = is_strictly_ascending(self._labels)
+            if isinstance(key, slice):
+                labels_searchable = self._sorted
+            else:
+                if not self._sorted and self._sorter is None and self.STATIC:
+                    if ArrayMap.supports(self._labels):
+                        # arrays of labels will be found by hash probing, without sorting
+                        if self._map is None:
+                            self._update_map_cache()
+                    elif len(key) >= len(self._labels) * SORTER_KEY_FRACTION_MIN:
+                        # sorting is only worthwhile for keys that are large relative to the labels; as labels can be added, grow-only indices use the mapping
+                        self._sorter = searchable_sorter(self._labels)
+                if (self._sorted
+                        or self._sorter is not None
+                        or isinstance(self._map, ArrayMap)):
+                    if isinstance(key, list) or key.dtype == DTYPE_OBJECT:
+                        key = LocMap.key_to_searchable(self._labels, key)
+                    labels_searchable = isinstance(key, np.ndarray) and (
+                            key.dtype == DTYPE_BOOL
+                            or (key.ndim == 1
+                            and searchable_dtype_match(self._labels.dtype, key.dtype)))
+
+        if self._map is None and not labels_searchable:
+            self._update_map_cache()
+
         return LocMap.loc_to_iloc(
                 label_to_pos=self._map,
                 labels=self._labels,
                 positions=self._positions, # always an np.ndarray
                 key=key,
-                offset=offset
+                offset=offset,
+                labels_sorted=bool(self._sorted),
+                labels_sorter=self._sorter,
+                labels_regular=bool(self._regular),
                 )
 
     def _extract_iloc(self, key: GetItemKeyType) -> 'Index':
@@ -828,6 +1101,98 @@ class Index(IndexBase):
 
     # _ufunc_shape_skipna defined in IndexBase
 
+    def _regular_bounds(self) -> tp.Optional[tp.Tuple[int, int, int]]:
+        '''
+        If labels ascend by a constant step, return the first label, last label, and step as integers; otherwise, return None.
+        '''
+        if self._recache:
+            self._update_array_cache()
+        if self._regular is None:
+            self._regular = is_regular_ascending(self._labels)
+            if self._regular:
+                self._sorted = True
+        if not self._regular:
+            return None
+        labels = self._labels
+        if labels.dtype.kind in DTYPE_NAT_KIND:
+            labels = labels.view(DTYPE_INT_DEFAULT)
+        start, second = labels[:2].tolist()
+        return start, labels[-1].item(), second - start
+
+    def _ufunc_set(self: I,
+            func: tp.Callable[[np.ndarray, np.ndarray, bool], np.ndarray],
+            other: tp.Union['IndexBase', 'Series']
+            ) -> I:
+        '''
+        Specialized for identical, regular, or sorted labels. Identical or equal indices return this Index (or a copy, if mutable). The union or intersection of two indices with labels of the same dtype, ascending by the same step, and aligned to the same values, is computed by arithmetic; that of two indices with strictly ascending labels of the same kind is computed by merging, without hashing or a full sort.
+        '''
+        cls = self.__class__
+        is_union = func is cls._UFUNC_UNION
+        if ((is_union or func is cls._UFUNC_INTERSECTION)
+                and isinstance(other, Index)):
+            if self._recache:
+                self._update_array_cache()
+            if other._recache:
+                other._update_array_cache()
+
+            if other is self or other._labels is self._labels:
+                return self if self.STATIC else cls(self) # type: ignore
+
+            dtype = self.dtype
+            if other.dtype == dtype:
+                bounds = self._regular_bounds()
+                bounds_other = other._regular_bounds() if bounds else None
+
+                if (bounds_other
+                        and bounds[2] == bounds_other[2]
+                        and (bounds_other[0] - bounds[0]) % bounds[2] == 0):
+                    step = bounds[2]
+                    span: tp.Optional[tp.Tuple[int, int]]
+                    if not is_union:
+                        span = (max(bounds[0], bounds_other[0]), min(bounds[1], bounds_other[1]))
+                    elif (bounds_other[0] <= bounds[1] + step
+                            and bounds[0] <= bounds_other[1] + step):
+                        # the union is regular only if the ranges overlap or are adjacent
+                        span = (min(bounds[0], bounds_other[0]), max(bounds[1], bounds_other[1]))
+                    else:
+                        span = None
+
+                    if span == bounds[:2]:
+                        return self if self.STATIC else cls(self) # type: ignore
+                    if span is not None:
+                        labels = np.arange(span[0],
+                                span[1] + step,
+                                step,
+                                dtype=np.uint64 if dtype.kind == 'u' else DTYPE_INT_DEFAULT)
+                        if dtype.kind in DTYPE_NAT_KIND:
+                            labels = labels.view(dtype)
+                        else:
+                            labels = labels.astype(dtype, copy=False)
+                        labels.flags.writeable = False
+                        return cls.from_labels(labels) # type: ignore
+
+            # datetime64 of different units cannot be merged without conversion
+            if other.dtype.kind == dtype.kind and (
+                    other.dtype == dtype or dtype.kind not in DTYPE_NAT_KIND):
+                if self._sorted is None:
+                    self._sorted = is_strictly_ascending(self._labels)
+                if self._sorted and other._sorted is None:
+                    other._sorted = is_strictly_ascending(other._labels)
+                if self._sorted and other._sorted:
+                    if is_union:
+                        labels = union_sorted(self._labels, other._labels)
+                    else:
+                        labels = intersect_sorted(self._labels, other._labels)
+                    # as both are unique, a union of the same size is a superset of other, and an intersection of the same size is a subset of other
+                    if len(labels) == len(self._labels):
+                        return self if self.STATIC else cls(self) # type: ignore
+                    labels.flags.writeable = False
+                    index = cls.from_labels(labels)
+                    index._sorted = True
+                    return index # type: ignore
+
+        return IndexBase._ufunc_set(self, func, other) # type: ignore
+
     #---------------------------------------------------------------------------
     # dictionary-like interface
 
@@ -858,7 +1223,13 @@ class Index(IndexBase):
     def __contains__(self, value) -> bool:
         '''Return True if value in the labels.
         '''
-        return self._map.__contains__(value)
+        if self._map is None:
+            self._update_map_cache()
+        if self._map.__contains__(value):
+            return True
+        if self._recache:
+            self._update_array_cache()
+        return LocMap.nan_label_to_pos(self._labels, value) is not None
 
     # def items(self) -> tp.Iterator[tp.Tuple[tp.Hashable, tp.Any]]:
     #     '''Iterator of pairs of index label and value.
@@ -940,6 +1311,9 @@ _INDEX_GO_SLOTS = (
         '_positions',
         '_recache',
         '_loc_is_iloc',
+        '_sorted',
+        '_sorter',
+        '_regular',
         '_name',
         '_labels_mutable',
         '_labels_mutable_dtype',
@@ -952,21 +1326,30 @@ class _IndexGOMixin:
     STATIC = False
     __slots__ = () # define in derived class
 
+    _map: tp.Optional[tp.Union[tp.Dict[tp.Hashable, tp.Any], ArrayMap]]
+    _labels: np.ndarray
+    _positions: np.ndarray
+    _recache: bool
     _loc_is_iloc: bool
+    _sorted: tp.Optional[bool]
+    _sorter: tp.Optional[tp.Tuple[np.ndarray, np.ndarray]]
+    _regular: tp.Optional[bool]
 
-    _labels_mutable: tp.List[tp.Hashable]
+    _labels_mutable: np.ndarray
     _labels_mutable_dtype: np.dtype
     _positions_mutable_count: int
 
+    _update_map_cache: tp.Callable[[], None] # defined in Index
+
     def _extract_labels(self,
-            mapping,
             labels,
             dtype: tp.Optional[np.dtype] = None
             ) -> np.ndarray:
         '''Called in Index.__init__(). This creates and populates mutable storage as a side effect of array derivation; this storage will be grown as needed.
         '''
-        labels = Index._extract_labels(mapping, labels, dtype)
-        self._labels_mutable = labels.tolist()
+        labels = Index._extract_labels(labels, dtype)
+        # the immutable labels are the initial storage; they are copied into writeable, over-allocated storage on the first append
+        self._labels_mutable = labels
         if len(labels):
             self._labels_mutable_dtype = labels.dtype
         else: # avoid setting to float default when labels is empty
@@ -974,51 +1357,83 @@ class _IndexGOMixin:
         return labels
 
     def _extract_positions(self,
-            mapping,
+            size: int,
             positions
             ) -> tp.Iterable[tp.Any]:
         '''Called in Index.__init__(). This creates and populates mutable storage. This creates and populates mutable storage as a side effect of array derivation.
         '''
-        positions = Index._extract_positions(mapping, positions)
+        positions = Index._extract_positions(size, positions)
         self._positions_mutable_count = len(positions)
         return positions
 
     def _update_array_cache(self):
-
-        if self._labels_mutable_dtype is not None and len(self._labels):
-            # only update if _labels_mutable_dtype has been set and _labels exist
-            self._labels_mutable_dtype = resolve_dtype(
-                    self._labels.dtype,
-                    self._labels_mutable_dtype)
-
-        self._labels = np.array(self._labels_mutable, dtype=self._labels_mutable_dtype)
-        self._labels.flags.writeable = False
+        # labels are an immutable view of the filled region of storage; as storage is only written beyond that region, the view is never mutated
+        labels = self._labels_mutable[:self._positions_mutable_count]
+        labels.flags.writeable = False
         self._positions = PositionsAllocator.get(self._positions_mutable_count)
+        if self._loc_is_iloc and labels.dtype == DTYPE_INT_DEFAULT:
+            self._labels = self._positions
+        else:
+            self._labels = labels
         self._recache = False
 
+    def _labels_mutable_append(self,
+            value: tp.Hashable,
+            dtype: np.dtype,
+            ) -> None:
+        '''
+        Write ``value`` into storage after the last label, where storage must be of ``dtype``. Storage is grown by doubling its capacity, such that appends are amortized constant time.
+        '''
+        count = self._positions_mutable_count
+        storage = self._labels_mutable
+        if (count == len(storage)
+                or not storage.flags.writeable
+                or storage.dtype != dtype):
+            capacity = max(count * 2, len(storage), 8)
+            storage_new = np.empty(capacity, dtype=dtype)
+            storage_new[:count] = storage[:count]
+            storage = storage_new
+            self._labels_mutable = storage
+        storage[count] = value
+
     #---------------------------------------------------------------------------
     # grow only mutation
 
     def append(self, value: tp.Hashable) -> None:
         '''append a value
         '''
-        if value in self._map:
+        if self._map is None:
+            self._update_map_cache()
+        count = self._positions_mutable_count
+        if (value in self._map
+                or LocMap.nan_label_to_pos(self._labels_mutable[:count], value) is not None):
             raise KeyError(f'duplicate key append attempted: {value}')
 
         # the new value is the count
-        self._map[value] = self._positions_mutable_count
+        self._map[value] = count
 
+        dtype_value = dtype_from_element(value)
         if self._labels_mutable_dtype is not None:
             self._labels_mutable_dtype = resolve_dtype(
-                    np.array(value).dtype,
+                    dtype_value,
                     self._labels_mutable_dtype)
         else:
-            self._labels_mutable_dtype = np.array(value).dtype
-
-        self._labels_mutable.append(value)
+            self._labels_mutable_dtype = dtype_value
+
+        if self._sorted and count:
+            # retain if the new value continues the ascending order
+            self._sorted = (self._labels_mutable_dtype.kind in DTYPE_SEARCHABLE_KIND
+                    and value > self._labels_mutable[count - 1])
+        if self._regular:
+            # retain if the new value continues the constant step
+            self._regular = (self._labels_mutable_dtype.kind in DTYPE_REGULAR_KIND
+                    and value - self._labels_mutable[count - 1]
+                    == self._labels_mutable[count - 1] - self._labels_mutable[count - 2])
+        self._sorter = None
+        self._labels_mutable_append(value, self._labels_mutable_dtype)
         # check value before incrementing
         if self._loc_is_iloc:
-            if isinstance(value, int) and value == self._positions_mutable_count:
+            if isinstance(value, int) and value == count:
                 pass # an increment that keeps loc is iloc relationship
             else:
                 self._loc_is_iloc = False
@@ -1069,6 +1484,8 @@ def _requires_reindex(left: Index, right: Index) -> bool:
     '''
     Given two Index objects, determine if we need to reindex
     '''
+    if left is right:
+        return False
     if len(left) != len(right):
         return True
     # do not need a new Index object, so just compare arrays directly, which might return a single Boolean if the types are not compatible
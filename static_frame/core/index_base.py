@@ -19,6 +19,7 @@ from static_frame.core.container import ContainerOperand
 # from static_frame.core.selector_node import InterfaceGetItem
 # from static_frame.core.selector_node import TContainer
 from static_frame.core.exception import ErrorInitIndex
+from static_frame.core.array_map import ArrayMap
 
 if tp.TYPE_CHECKING:
     import pandas #pylint: disable=W0611 #pragma: no cover
@@ -37,11 +38,14 @@ class IndexBase(ContainerOperand):
     #---------------------------------------------------------------------------
     # type defs
 
-    _map: tp.Dict[tp.Hashable, tp.Any]
+    _map: tp.Optional[tp.Union[tp.Dict[tp.Hashable, tp.Any], ArrayMap]]
     _labels: np.ndarray
     _positions: np.ndarray
     _recache: bool
     _loc_is_iloc: bool
+    _sorted: tp.Optional[bool]
+    _sorter: tp.Optional[tp.Tuple[np.ndarray, np.ndarray]]
+    _regular: tp.Optional[bool]
     _name: tp.Hashable
     values: np.ndarray
     depth: int
@@ -321,6 +325,8 @@ class IndexBase(ContainerOperand):
         labels = func(self._labels, opperand, assume_unique=assume_unique) # type: ignore
 
         if id(labels) == id(self._labels):
+            if self.STATIC:
+                return self
             # NOTE: favor using cls constructor here as it permits maximal sharing of static resources and the underlying dictionary
             return cls(self) # type: ignore
         return cls.from_labels(labels)
@@ -0,0 +1,628 @@
+import typing as tp
+
+import numpy as np
+
+from static_frame.core.array_go import ArrayGO
+from static_frame.core.hloc import HLoc
+from static_frame.core.index import ILoc
+from static_frame.core.index import Index
+from static_frame.core.index import LocMap
+from static_frame.core.index import PositionsAllocator
+from static_frame.core.index import immutable_index_filter
+from static_frame.core.index_level import IndexLevel
+
+from static_frame.core.util import IndexConstructors
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_INT_KIND
+from static_frame.core.util import DTYPE_NAT_KIND
+from static_frame.core.util import DEFAULT_SORT_KIND
+from static_frame.core.util import EMPTY_ARRAY_INT
+from static_frame.core.util import INT_TYPES
+from static_frame.core.util import KEY_ITERABLE_TYPES
+from static_frame.core.util import KEY_MULTIPLE_TYPES
+from static_frame.core.util import NULL_SLICE
+from static_frame.core.util import GetItemKeyType
+from static_frame.core.util import GetItemKeyTypeCompound
+from static_frame.core.util import array_to_codes
+from static_frame.core.util import resolve_dtype_iter
+from static_frame.core.util import isin
+from static_frame.core.util import searchable_sorter
+from static_frame.core.util import is_strictly_ascending
+from static_frame.core.util import searchsorted_positions
+from static_frame.core.util import positions_to_slice
+
+
+# the largest number of combinations of codes that can be represented by a single 64-bit integer key
+_KEYS_COUNT_MAX = np.iinfo(DTYPE_INT_DEFAULT).max
+
+
+def codes_dtype(count: int) -> np.dtype:
+    '''
+    Return the smallest signed integer dtype that can hold codes for ``count`` unique labels.
+    '''
+    for dtype in (np.int8, np.int16, np.int32):
+        if count <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return DTYPE_INT_DEFAULT
+
+
+def radix_multipliers(indices: tp.Sequence[Index]) -> tp.Optional[tp.List[int]]:
+    '''
+    Return, for each depth, the multiplier of positions in ``indices`` used to combine positions at all depths into a single integer (as digits of a mixed-radix number), or None if that integer cannot be represented by a 64-bit integer.
+    '''
+    multipliers = []
+    count = 1
+    for index in reversed(indices):
+        multipliers.append(count)
+        count *= max(len(index), 1)
+    if count > _KEYS_COUNT_MAX:
+        return None
+    return multipliers[::-1]
+
+
+def _index_positions_bulk(
+        index: Index,
+        labels: np.ndarray,
+        ) -> tp.Optional[np.ndarray]:
+    '''
+    Return the positions of all ``labels`` in ``index`` from a single lookup, or None if that lookup fails or does not give one integer position per label.
+    '''
+    try:
+        positions = index.loc_to_iloc(labels)
+    except KeyError:
+        return None
+    if isinstance(positions, list):
+        positions = np.array(positions)
+    if (isinstance(positions, np.ndarray)
+            and positions.ndim == 1
+            and positions.dtype.kind in DTYPE_INT_KIND
+            and len(positions) == len(labels)):
+        return positions
+    return None
+
+
+def index_positions(
+        index: Index,
+        labels: np.ndarray,
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    Given an array of labels, return the positions of those labels in ``index``, as well as a Boolean array identifying which labels were found; positions of labels not found are undefined.
+    '''
+    # Boolean arrays are selections, and datetime64 keys of other units (or strings, for datetime64 labels) are partial selections; all must be found by individual labels
+    if (labels.dtype != DTYPE_BOOL
+            and (labels.dtype == index.dtype
+            or (labels.dtype.kind not in DTYPE_NAT_KIND
+            and index.dtype.kind not in DTYPE_NAT_KIND))):
+        positions = _index_positions_bulk(index, labels)
+        if positions is not None:
+            return positions, np.full(len(labels), True, dtype=DTYPE_BOOL)
+        # find the labels present, then find all of those together
+        found = isin(labels, index.values)
+        positions_found = _index_positions_bulk(index, labels[found])
+        if positions_found is not None:
+            positions = np.zeros(len(labels), dtype=DTYPE_INT_DEFAULT)
+            positions[found] = positions_found
+            return positions, found
+
+    positions = np.zeros(len(labels), dtype=DTYPE_INT_DEFAULT)
+    found = np.full(len(labels), False, dtype=DTYPE_BOOL)
+    for i, label in enumerate(labels):
+        try:
+            pos = index.loc_to_iloc(label)
+        except (KeyError, TypeError, ValueError):
+            # labels that cannot be converted to the type of the index (such as a string that is not a date) are not found
+            continue
+        if isinstance(pos, INT_TYPES):
+            positions[i] = pos
+            found[i] = True
+    return positions, found
+
+
+def keys_for_labels(
+        indices: tp.Sequence[Index],
+        labels: tp.Sequence[np.ndarray],
+        ) -> tp.Optional[tp.Tuple[np.ndarray, np.ndarray]]:
+    '''
+    Given a sequence of arrays of labels of equal length, one per depth, return the positions of those labels in ``indices`` combined into a single integer key, as well as a Boolean array identifying which labels were found at all depths; keys of labels not found are undefined. Return None if keys cannot be formed.
+    '''
+    multipliers = radix_multipliers(indices)
+    if multipliers is None:
+        return None
+    return _keys_for_labels(indices, labels, multipliers)
+
+
+def _keys_for_labels(
+        indices: tp.Sequence[Index],
+        labels: tp.Sequence[np.ndarray],
+        multipliers: tp.Sequence[int],
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    Implementation of ``keys_for_labels`` given the ``multipliers`` of positions at each depth.
+    '''
+    positions, found = index_positions(indices[0], labels[0])
+    keys = positions * multipliers[0]
+    for index, labels_depth, multiplier in zip(indices[1:], labels[1:], multipliers[1:]):
+        positions, found_depth = index_positions(index, labels_depth)
+        keys += positions * multiplier
+        found = found & found_depth
+    return keys, found
+
+
+class IndexCodes:
+    '''
+    A flat representation of the labels of an :obj:`IndexHierarchy`: for each depth, an :obj:`Index` of the unique labels found at that depth, and an array of integer codes, one for each label of the hierarchy, giving positions in that :obj:`Index`.
+
+    Unique labels are ordered by first appearance, such that the codes at each depth increase in the order labels are observed.
+    '''
+
+    __slots__ = (
+            'indices',
+            'codes',
+            '_keys',
+            '_keys_sorted',
+            '_keys_sorter',
+            )
+
+    indices: tp.List[Index]
+    codes: tp.List[np.ndarray]
+    _keys: tp.Optional[np.ndarray]
+    _keys_sorted: tp.Optional[bool]
+    _keys_sorter: tp.Optional[tp.Tuple[np.ndarray, np.ndarray]]
+
+    @classmethod
+    def from_arrays(cls,
+            arrays: tp.Iterable[np.ndarray],
+            *,
+            index_constructors: tp.Optional[IndexConstructors] = None,
+            ) -> 'IndexCodes':
+        '''
+        Given an iterable of 1D arrays of equal length, one per depth, factorize each into an :obj:`Index` of unique labels and codes.
+        '''
+        indices: tp.List[Index] = []
+        codes = []
+        for depth, array in enumerate(arrays):
+            unique, codes_depth = array_to_codes(array)
+            unique.flags.writeable = False
+            if index_constructors:
+                index = tp.cast(Index, index_constructors[depth](unique))
+                if not index.STATIC:
+                    index = tp.cast(Index, index._IMMUTABLE_CONSTRUCTOR(index))
+            else:
+                index = Index(unique)
+            indices.append(index)
+            codes.append(codes_depth)
+        return cls(indices, codes)
+
+    @classmethod
+    def from_product(cls, indices: tp.Sequence[Index]) -> 'IndexCodes':
+        '''
+        Given a sequence of immutable :obj:`Index`, one per depth, derive codes for the product of their labels.
+        '''
+        lengths = [len(index) for index in indices]
+        codes = []
+        for depth, length in enumerate(lengths):
+            outer = int(np.prod(lengths[:depth], dtype=DTYPE_INT_DEFAULT))
+            inner = int(np.prod(lengths[depth + 1:], dtype=DTYPE_INT_DEFAULT))
+            codes_depth = np.arange(length, dtype=codes_dtype(length))
+            codes.append(np.tile(codes_depth.repeat(inner), outer))
+        return cls(list(indices), codes)
+
+    @classmethod
+    def from_index_level(cls, level: IndexLevel) -> 'IndexCodes':
+        '''
+        Given an :obj:`IndexLevel`, derive the labels at each depth from the indices of each level, and factorize them, retaining the :obj:`Index` class found at each depth.
+        '''
+        depth_count = next(level.depths())
+        parts: tp.List[tp.List[np.ndarray]] = [[] for _ in range(depth_count)]
+
+        def collect(level: IndexLevel, depth: int) -> int:
+            labels = level.index.values
+            if level.targets is None:
+                parts[depth].append(labels)
+                return len(labels)
+            widths = [collect(target, depth + 1) for target in level.targets]
+            parts[depth].append(labels.repeat(widths))
+            return sum(widths)
+
+        size = collect(level, 0)
+
+        arrays = []
+        for depth_parts in parts:
+            if len(depth_parts) == 1:
+                arrays.append(depth_parts[0])
+                continue
+            array = np.empty(size, dtype=resolve_dtype_iter(p.dtype for p in depth_parts))
+            start = 0
+            for part in depth_parts:
+                end = start + len(part)
+                array[start: end] = part
+                start = end
+            arrays.append(array)
+
+        index_types = [index_type if index_type.STATIC else index_type._IMMUTABLE_CONSTRUCTOR
+                for index_type in level.index_types()]
+        return cls.from_arrays(arrays, index_constructors=index_types)
+
+    def __init__(self,
+            indices: tp.List[Index],
+            codes: tp.List[np.ndarray],
+            ) -> None:
+        '''
+        Args:
+            indices: a list of :obj:`Index`, one per depth, of unique labels.
+            codes: a list of 1D integer arrays, one per depth, of positions in the corresponding :obj:`Index`.
+        '''
+        self.indices = indices
+        self.codes = []
+        for index, codes_depth in zip(indices, codes):
+            codes_depth = codes_depth.astype(codes_dtype(len(index)), copy=False)
+            codes_depth.flags.writeable = False
+            self.codes.append(codes_depth)
+        self._keys = None
+        self._keys_sorted = None
+        self._keys_sorter = None
+
+    #---------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.codes[0])
+
+    @property
+    def depth(self) -> int:
+        return len(self.indices)
+
+    def values_at_depth(self, depth: int) -> np.ndarray:
+        '''
+        Return an immutable 1D array of the labels at ``depth``, of the dtype of the :obj:`Index` at that depth.
+        '''
+        array = self.indices[depth].values[self.codes[depth]]
+        array.flags.writeable = False
+        return array
+
+    def keys(self) -> tp.Optional[np.ndarray]:
+        '''
+        Return an immutable array of integers, one per label, that combine the codes at all depths (as digits of a mixed-radix number) into a single key; if the number of combinations of codes cannot be represented by a 64-bit integer, return None.
+        '''
+        if self._keys is None:
+            multipliers = self._multipliers()
+            if multipliers is None:
+                return None
+            keys = np.zeros(len(self), dtype=DTYPE_INT_DEFAULT)
+            for codes_depth, multiplier in zip(self.codes, multipliers):
+                keys += codes_depth.astype(DTYPE_INT_DEFAULT) * multiplier
+            keys.flags.writeable = False
+            self._keys = keys
+        return self._keys
+
+    def _multipliers(self) -> tp.Optional[tp.List[int]]:
+        return radix_multipliers(self.indices)
+
+    def positions_at_depth(self,
+            depth: int,
+            labels: np.ndarray,
+            ) -> tp.Tuple[np.ndarray, np.ndarray]:
+        '''
+        Given an array of labels, return the codes of those labels at ``depth``, as well as a Boolean array identifying which labels were found; codes of labels not found are undefined.
+        '''
+        return index_positions(self.indices[depth], labels)
+
+    def keys_for_labels(self,
+            labels: tp.Sequence[np.ndarray],
+            ) -> tp.Optional[tp.Tuple[np.ndarray, np.ndarray]]:
+        '''
+        Given a sequence of arrays of labels of equal length, one per depth, return the keys formed from the codes of those labels, as well as a Boolean array identifying which labels were found at all depths; keys of labels not found are undefined. Return None if keys cannot be formed.
+        '''
+        return keys_for_labels(self.indices, labels)
+
+    def positions_for_labels(self,
+            labels: tp.Sequence[np.ndarray],
+            ) -> tp.Optional[tp.Tuple[np.ndarray, np.ndarray]]:
+        '''
+        Given a sequence of arrays of labels of equal length, one per depth, return the integer positions of those labels in the hierarchy, as well as a Boolean array identifying which labels were found; positions of labels not found are undefined. Return None if keys cannot be formed.
+        '''
+        keys = self.keys()
+        post = self.keys_for_labels(labels)
+        if keys is None or post is None:
+            return None
+        keys_other, found = post
+
+        if self._keys_sorted is None:
+            self._keys_sorted = is_strictly_ascending(keys)
+            if not self._keys_sorted:
+                self._keys_sorter = searchable_sorter(keys)
+
+        if self._keys_sorted and len(keys) == len(IndexProduct(self.indices)):
+            # all combinations of codes are present in ascending order: keys are positions
+            return keys_other, found
+
+        positions, found_keys = searchsorted_positions(keys,
+                keys_other,
+                sorter=self._keys_sorter,
+                )
+        return positions, found & found_keys
+
+    #---------------------------------------------------------------------------
+
+    def isin(self, labels: tp.Sequence[np.ndarray]) -> tp.Optional[np.ndarray]:
+        '''
+        Given a sequence of arrays of labels of equal length, one per depth, return a Boolean array, one per label of the hierarchy, that is True where that label is found in ``labels``. Return None if keys cannot be formed.
+        '''
+        keys = self.keys()
+        post = self.keys_for_labels(labels)
+        if keys is None or post is None:
+            return None
+        keys_other, found = post
+        return np.isin(keys, keys_other[found])
+
+    def sort_order(self) -> np.ndarray:
+        '''
+        Return the integer positions that sort the labels of the hierarchy in ascending order, ordering by labels at outer depths first.
+        '''
+        ranks = []
+        for index, codes_depth in zip(self.indices, self.codes):
+            # sort the small arrays of unique labels to find the rank of each code
+            order = np.argsort(index.values, kind=DEFAULT_SORT_KIND)
+            rank = np.empty(len(order), dtype=DTYPE_INT_DEFAULT)
+            rank[order] = np.arange(len(order))
+            ranks.append(rank[codes_depth])
+        # lexsort sorts by the last key first
+        return np.lexsort(ranks[::-1])
+
+    def leaf_changes(self, depth_count: int) -> np.ndarray:
+        '''
+        Return a Boolean array, one per label of the hierarchy, that is True where the labels of the outermost ``depth_count`` depths differ from those of the previous label.
+        '''
+        changes = np.empty(len(self), dtype=DTYPE_BOOL)
+        if len(changes):
+            changes[0] = True
+            changes[1:] = False
+            for codes_depth in self.codes[:depth_count]:
+                changes[1:] |= codes_depth[1:] != codes_depth[:-1]
+        return changes
+
+
+class IndexProduct:
+    '''
+    A representation of the labels of an :obj:`IndexHierarchy` formed from the product of the labels of an :obj:`Index` at each depth. The position of a label is derived from the positions of its components at each depth (as digits of a mixed-radix number), such that neither labels nor a tree of :obj:`IndexLevel` need be created to perform lookups.
+    '''
+
+    __slots__ = (
+            'indices',
+            'multipliers',
+            )
+
+    indices: tp.List[Index]
+    multipliers: tp.Optional[tp.List[int]]
+
+    def __init__(self, indices: tp.Iterable[Index]) -> None:
+        '''
+        Args:
+            indices: an iterable of :obj:`Index`, one per depth, the product of which defines the labels; mutable :obj:`Index` are converted to immutable.
+        '''
+        self.indices = [immutable_index_filter(index) for index in indices]
+        # if None, positions cannot be represented by 64-bit integers
+        self.multipliers = radix_multipliers(self.indices)
+
+    #---------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        count = 1
+        for index in self.indices:
+            count *= len(index)
+        return count
+
+    @property
+    def depth(self) -> int:
+        return len(self.indices)
+
+    def _repeats(self, depth: int) -> tp.Tuple[int, int]:
+        '''
+        Return the number of times the labels at ``depth`` are tiled (the count of labels of outer depths), and the number of times each label is repeated (the count of labels of inner depths).
+        '''
+        outer = 1
+        for index in self.indices[:depth]:
+            outer *= len(index)
+        inner = 1
+        for index in self.indices[depth + 1:]:
+            inner *= len(index)
+        return outer, inner
+
+    def _multipliers(self) -> tp.List[int]:
+        '''
+        Return the multiplier of positions at each depth, raising if positions cannot be represented by 64-bit integers.
+        '''
+        if self.multipliers is None:
+            raise NotImplementedError('no support for positions of a product of more than 2**63 - 1 labels')
+        return self.multipliers
+
+    def dtypes(self) -> tp.Iterator[np.dtype]:
+        for index in self.indices:
+            yield index.values.dtype
+
+    def index_types(self) -> tp.Iterator[tp.Type[Index]]:
+        for index in self.indices:
+            yield index.__class__
+
+    def __contains__(self, key: tp.Iterable[tp.Hashable]) -> bool:
+        '''Given an iterable of single-element level keys (a leaf loc), return a bool.
+        '''
+        key = tuple(key)
+        if len(key) != len(self.indices):
+            return False
+        return all(index.__contains__(k) for index, k in zip(self.indices, key))
+
+    def iter(self, depth_level: int) -> tp.Iterator[tp.Hashable]:
+        '''Given a depth position, return the labels at that depth, once for each label of outer depths.
+        '''
+        if not 0 <= depth_level < len(self.indices):
+            return # as with IndexLevel, there are no labels at other depths
+        outer, _ = self._repeats(depth_level)
+        index = self.indices[depth_level]
+        for _ in range(outer):
+            yield from index
+
+    def label_widths_at_depth(self,
+            depth_level: int = 0
+            ) -> tp.Iterator[tp.Tuple[tp.Hashable, int]]:
+        '''
+        Generator of pairs of label, width, for all labels found at a specified level.
+        '''
+        if not 0 <= depth_level < len(self.indices):
+            return
+        outer, inner = self._repeats(depth_level)
+        index = self.indices[depth_level]
+        for _ in range(outer):
+            for label in index:
+                yield label, inner
+
+    def values_at_depth(self, depth: int) -> np.ndarray:
+        '''
+        Return an immutable 1D array of the labels at ``depth``, of the dtype of the :obj:`Index` at that depth.
+        '''
+        outer, inner = self._repeats(depth)
+        array = np.tile(self.indices[depth].values.repeat(inner), outer)
+        array.flags.writeable = False
+        return array
+
+    def get_labels(self) -> np.ndarray:
+        '''
+        Return an immutable NumPy 2D array of all labels.
+        '''
+        dtype = resolve_dtype_iter(self.dtypes())
+        labels = np.empty((len(self), len(self.indices)), dtype=dtype)
+        for depth in range(len(self.indices)):
+            labels[:, depth] = self.values_at_depth(depth)
+        labels.flags.writeable = False
+        return labels
+
+    #---------------------------------------------------------------------------
+
+    def leaf_loc_to_iloc(self,
+            key: tp.Union[tp.Iterable[tp.Hashable], ILoc]
+            ) -> int:
+        '''Given an iterable of single-element level keys (a leaf loc), return the iloc value.
+        '''
+        if isinstance(key, ILoc):
+            return key.key # type: ignore
+        key = tuple(key)
+        if len(key) != len(self.indices):
+            raise KeyError(f'Invalid key length {len(key)}; must be length {len(self.indices)}.')
+
+        multipliers = self._multipliers()
+
+        pos = 0
+        for k, index, multiplier in zip(key, self.indices, multipliers):
+            if isinstance(k, KEY_MULTIPLE_TYPES):
+                raise RuntimeError(f'slices cannot be used in a leaf selection into an IndexHierarchy; try HLoc[{key}].')
+            iloc = index.loc_to_iloc(k)
+            if not isinstance(iloc, INT_TYPES):
+                raise KeyError(key)
+            pos += int(iloc) * multiplier
+        return pos
+
+    def loc_to_iloc(self, key: GetItemKeyTypeCompound) -> GetItemKeyType:
+        '''
+        Given a leaf loc, a slice or iterable of leaf locs, or an :obj:`HLoc`, return integer positions; as with :obj:`IndexLevel`, Boolean arrays are passed through.
+        '''
+        if isinstance(key, slice):
+            return slice(*LocMap.map_slice_args(self.leaf_loc_to_iloc, key))
+
+        if isinstance(key, KEY_ITERABLE_TYPES):
+            if isinstance(key, np.ndarray) and key.dtype == bool:
+                return key # keep as Boolean
+            return [self.leaf_loc_to_iloc(x) for x in key]
+
+        if not isinstance(key, HLoc):
+            # assume it is a leaf loc tuple
+            if not isinstance(key, tuple):
+                raise KeyError(f'{key} cannot be used for loc selection from IndexHierarchy; try HLoc')
+            return self.leaf_loc_to_iloc(key)
+
+        multipliers = self._multipliers()
+
+        # resolve the selection at each depth to positions within the index of that depth
+        positions = []
+        scalar = True
+        for depth, index in enumerate(self.indices):
+            try:
+                iloc = index.loc_to_iloc(key[depth])
+            except KeyError:
+                raise KeyError('no matching keys across all levels') from None
+            if isinstance(iloc, INT_TYPES):
+                positions.append(np.array((iloc,), dtype=DTYPE_INT_DEFAULT))
+            else:
+                scalar = False
+                positions.append(PositionsAllocator.get(len(index))[iloc])
+
+        if scalar:
+            return sum(int(p[0]) * m for p, m in zip(positions, multipliers))
+
+        if any(not len(p) for p in positions):
+            if all(len(p) for p in positions[:-1]):
+                return EMPTY_ARRAY_INT # only the selection of leaves is empty
+            raise KeyError('no matching keys across all levels')
+
+        # if inner depths are fully selected, a contiguous selection at the next outer depth, within a single label of all outer depths, is a slice
+        depth = len(positions) - 1
+        while depth > 0 and positions_to_slice(positions[depth]) == slice(0, len(self.indices[depth])):
+            depth -= 1
+        part = positions_to_slice(positions[depth])
+        if part is not None and all(len(p) == 1 for p in positions[:depth]):
+            start = sum(int(p[0]) * m for p, m in zip(positions[:depth], multipliers))
+            multiplier = multipliers[depth]
+            return slice(start + part.start * multiplier, start + part.stop * multiplier)
+
+        ilocs = np.zeros(1, dtype=DTYPE_INT_DEFAULT)
+        for positions_depth, multiplier in zip(positions, multipliers):
+            ilocs = (ilocs[:, np.newaxis] + positions_depth * multiplier).ravel()
+        return positions_to_slice(ilocs) or ilocs
+
+    def positions_for_labels(self,
+            labels: tp.Sequence[np.ndarray],
+            ) -> tp.Tuple[np.ndarray, np.ndarray]:
+        '''
+        Given a sequence of arrays of labels of equal length, one per depth, return the integer positions of those labels, as well as a Boolean array identifying which labels were found; positions of labels not found are undefined.
+        '''
+        return _keys_for_labels(self.indices, labels, self._multipliers())
+
+    def isin(self, labels: tp.Sequence[np.ndarray]) -> np.ndarray:
+        '''
+        Given a sequence of arrays of labels of equal length, one per depth, return a Boolean array, one per label of the product, that is True where that label is found in ``labels``.
+        '''
+        positions, found = self.positions_for_labels(labels)
+        post = np.full(len(self), False, dtype=DTYPE_BOOL)
+        post[positions[found]] = True
+        return post
+
+    #---------------------------------------------------------------------------
+
+    def to_index_codes(self) -> IndexCodes:
+        return IndexCodes.from_product(self.indices)
+
+    def to_index_level(self,
+            cls: tp.Type[IndexLevel] = IndexLevel,
+            ) -> IndexLevel:
+        '''
+        Return a tree of :obj:`IndexLevel` of class ``cls`` (which determines if indices are mutable) for the product.
+        '''
+        targets_previous = None
+
+        # need to walk up from bottom to top
+        depth = len(self.indices) - 1
+        while depth > 0:
+            index = self.indices[depth]
+            index_up = self.indices[depth - 1]
+            # for each label in the next-up index, we need a reference to this index with an offset of that index (or level)
+            targets = np.empty(len(index_up), dtype=object)
+            # all levels at a depth are of the same length
+            _, width = self._repeats(depth - 1)
+
+            for idx in range(len(index_up)):
+                targets[idx] = cls(index=index,
+                        offset=idx * width,
+                        targets=targets_previous)
+            targets_previous = ArrayGO(targets, own_iterable=True)
+            depth -= 1
+
+        return cls(index=self.indices[0], targets=targets_previous)
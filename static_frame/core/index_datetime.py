@@ -74,6 +74,9 @@ class IndexDatetime(Index):
     def __contains__(self, value: object) -> bool:
         '''Return True if value in the labels. Will only return True for an exact match to the type of dates stored within.
         '''
+        if self._map is None:
+            self._update_map_cache()
+        assert self._map is not None
         return self._map.__contains__(to_datetime64(value))
 
     #---------------------------------------------------------------------------
@@ -132,18 +135,39 @@ class IndexDatetime(Index):
 class _IndexDatetimeGOMixin(_IndexGOMixin):
 
     _DTYPE: tp.Optional[np.dtype]
-    _map: tp.Dict[tp.Hashable, tp.Any]
-    __slots__ = () # define in derived class
+    if tp.TYPE_CHECKING:
+        # slots are defined in derived classes; declared here only for type checking, as non-empty slots on both bases conflict
+        __slots__ = (
+                '_sorted',
+                '_regular',
+                '_sorter',
+                '_positions_mutable_count',
+                '_recache',
+                )
+    else:
+        __slots__ = () # define in derived class
 
     def append(self, value: tp.Hashable) -> None:
         '''Specialize for fixed-typed indices: convert `value` argument; do not need to resolve_dtype with each addition; do not need to check for _loc_is_iloc.
         '''
         value = to_datetime64(value, self._DTYPE)
+        if self._map is None:
+            self._update_map_cache()
+        # grow-only indices are always mapped with a dict
+        assert isinstance(self._map, dict)
         if value in self._map:
             raise KeyError(f'duplicate key append attempted: {value}')
+        count = self._positions_mutable_count
         # the new value is the count
-        self._map[value] = self._positions_mutable_count
-        self._labels_mutable.append(value)
+        self._map[value] = count
+        if self._sorted and count:
+            self._sorted = value > self._labels_mutable[count - 1] #pylint: disable=E0237
+        if self._regular:
+            self._regular = (value - self._labels_mutable[count - 1]
+                    == self._labels_mutable[count - 1] - self._labels_mutable[count - 2]) #pylint: disable=E0237
+        self._sorter = None #pylint: disable=E0237
+        self._labels_mutable_dtype = self._DTYPE
+        self._labels_mutable_append(value, self._DTYPE)
         self._positions_mutable_count += 1 #pylint: disable=E0237
         self._recache = True #pylint: disable=E0237
 
@@ -24,7 +24,13 @@ from static_frame.core.util import union2d
 from static_frame.core.util import array2d_to_tuples
 from static_frame.core.util import name_filter
 from static_frame.core.util import isin
+from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import iterable_to_array_2d
+from static_frame.core.util import INT_TYPES
+from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_OBJECT
+from static_frame.core.util import KEY_MULTIPLE_TYPES
+from static_frame.core.util import array_to_codes
 
 
 from static_frame.core.selector_node import InterfaceGetItem
@@ -35,6 +41,7 @@ from static_frame.core.util import KEY_ITERABLE_TYPES
 from static_frame.core.util import CallableOrMapping
 from static_frame.core.util import DepthLevelSpecifier
 from static_frame.core.util import array_shift
+from static_frame.core.util import resolve_dtype_iter
 
 
 from static_frame.core.container_util import matmul
@@ -57,6 +64,8 @@ from static_frame.core.hloc import HLoc
 from static_frame.core.index_level import IndexLevel
 
 from static_frame.core.index_level import IndexLevelGO
+from static_frame.core.index_codes import IndexCodes
+from static_frame.core.index_codes import IndexProduct
 from static_frame.core.exception import ErrorInitIndex
 from static_frame.core.doc_str import doc_inject
 
@@ -76,18 +85,22 @@ class IndexHierarchy(IndexBase):
     A hierarchy of :obj:`static_frame.Index` objects, defined as strict tree of uniform depth across all branches.
     '''
     __slots__ = (
-            '_levels',
+            '_levels_tree',
+            '_product',
             '_labels',
             '_depth',
             '_recache',
-            '_name'
+            '_name',
+            '_codes',
             )
-    _levels: IndexLevel
+    _levels_tree: tp.Optional[IndexLevel]
+    _product: tp.Optional[IndexProduct]
     _lables: np.ndarray
     _depth: int
     _keys: KeysView
     _recache: bool
     _name: tp.Hashable
+    _codes: tp.Optional[IndexCodes]
 
     # Temporary type overrides, until indices are generic.
     __getitem__: tp.Callable[['IndexHierarchy', tp.Hashable], tp.Tuple[tp.Hashable, ...]]
@@ -112,7 +125,7 @@ class IndexHierarchy(IndexBase):
             name: tp.Hashable = None
             ) -> IH: # tp.Iterable[tp.Hashable]
         '''
-        Given groups of iterables, return an ``IndexHierarchy`` made of the product of a values in those groups, where the first group is the top-most hierarchy.
+        Given groups of iterables, return an ``IndexHierarchy`` made of the product of a values in those groups, where the first group is the top-most hierarchy. Lookups are performed arithmetically on the indices of each group; labels are only created when needed.
 
         Returns:
             :obj:`static_frame.IndexHierarchy`
@@ -133,31 +146,11 @@ class IndexHierarchy(IndexBase):
             if any(n is None for n in name):
                 name = None
 
-        targets_previous = None
-
-        # need to walk up from bottom to top
-        # get depth pairs and iterate over those
-        depth = len(indices) - 1
-        while depth > 0:
-            index = indices[depth]
-            index_up = indices[depth - 1]
-            # for each label in the next-up index, we need a reference to this index with an offset of that index (or level)
-            targets = np.empty(len(index_up), dtype=object)
-
-            offset = 0
-            for idx, _ in enumerate(index_up):
-                # this level does not have targets, only an index (as a leaf)
-                level = cls._LEVEL_CONSTRUCTOR(index=index,
-                        offset=offset,
-                        targets=targets_previous)
-
-                targets[idx] = level
-                offset += len(level)
-            targets_previous = ArrayGO(targets, own_iterable=True)
-            depth -= 1
-
-        level = cls._LEVEL_CONSTRUCTOR(index=index_up, targets=targets_previous)
-        return cls(level, name=name)
+        product = IndexProduct(indices)
+        if product.multipliers is None:
+            # positions cannot be represented by 64-bit integers
+            return cls(product.to_index_level(cls._LEVEL_CONSTRUCTOR), name=name)
+        return cls(product, name=name)
 
     @classmethod
     def _tree_to_index_level(cls,
@@ -256,6 +249,16 @@ class IndexHierarchy(IndexBase):
                     )
             return index
 
+        if (isinstance(labels, np.ndarray)
+                and labels.ndim == 2
+                and continuation_token is CONTINUATION_TOKEN_INACTIVE):
+            # group labels by depth with array operations
+            return cls.from_values_per_depth(
+                    [labels[:, d] for d in range(labels.shape[1])],
+                    name=name,
+                    index_constructors=index_constructors,
+                    )
+
         labels_iter = iter(labels)
         try:
             first = next(labels_iter)
@@ -326,6 +329,116 @@ class IndexHierarchy(IndexBase):
                 index_constructors=index_constructors
                 ), name=name)
 
+    @classmethod
+    def from_values_per_depth(cls: tp.Type[IH],
+            values: tp.Sequence[tp.Iterable[tp.Hashable]],
+            *,
+            name: tp.Hashable = None,
+            index_constructors: tp.Optional[IndexConstructors] = None,
+            ) -> IH:
+        '''
+        Construct an ``IndexHierarchy`` from a sequence of iterables (such as arrays) of equal length, one for each depth, giving the component label at that depth for each label. Labels must be in tree-form: the labels of outer depths must be contiguous.
+
+        Args:
+            values: a sequence of iterables, one per depth.
+
+        Returns:
+            :obj:`static_frame.IndexHierarchy`
+        '''
+        arrays = [iterable_to_array_1d(v)[0] for v in values]
+        depth = len(arrays)
+        # minimum permitted depth is 2
+        if depth < 2:
+            raise ErrorInitIndex('cannot create an IndexHierarchy from only one level.')
+        if index_constructors and len(index_constructors) != depth:
+            raise ErrorInitIndex('if providing index constructors, number of index constructors must equal depth of IndexHierarchy.')
+
+        size = len(arrays[0])
+        if any(len(a) != size for a in arrays):
+            raise ErrorInitIndex('values for each depth must be of equal length.')
+        if size == 0:
+            # if empty, return empty index
+            return cls(levels=cls._LEVEL_CONSTRUCTOR(
+                    cls._INDEX_CONSTRUCTOR(())
+                    ), name=name)
+
+        # factorize each depth; codes of the labels of outer depths (prefixes) are combined to find contiguous runs of each prefix
+        uniques = []
+        codes = []
+        starts = [] # for each prefix depth, the first position of each run of that prefix
+        prefix = None
+        for d, array in enumerate(arrays):
+            unique, codes_depth = array_to_codes(array)
+            if unique.dtype == DTYPE_OBJECT:
+                # resolve a type from the unique values, as would be done from iterables of labels
+                unique_typed, _ = iterable_to_array_1d(unique.tolist())
+                if unique_typed.dtype != DTYPE_OBJECT:
+                    unique = unique_typed
+                    array = unique[codes_depth]
+                    arrays[d] = array
+            uniques.append(unique)
+            codes.append(codes_depth)
+
+            if prefix is None:
+                prefix = codes_depth
+            else:
+                # combined codes are less than size * len(unique), and are renumbered to be less than size
+                prefix = array_to_codes(prefix * len(unique) + codes_depth)[1]
+
+            changes = np.empty(size, dtype=DTYPE_BOOL)
+            changes[0] = True
+            changes[1:] = prefix[1:] != prefix[:-1]
+            starts_depth = np.flatnonzero(changes)
+            count_unique = prefix.max() + 1
+            if d < depth - 1:
+                if len(starts_depth) != count_unique:
+                    raise ErrorInitIndex('invalid tree-form for IndexHierarchy: labels of outer depths are not contiguous.')
+            elif count_unique != size:
+                raise ErrorInitIndex(f'labels ({size}) have non-unique values ({count_unique})')
+            starts.append(starts_depth)
+
+        def get_index(labels: np.ndarray, depth: int) -> Index:
+            if index_constructors:
+                explicit_constructor = index_constructors[depth]
+            else:
+                explicit_constructor = None
+            return index_from_optional_constructor(labels,
+                    default_constructor=cls._INDEX_CONSTRUCTOR,
+                    explicit_constructor=explicit_constructor)
+
+        # build levels from the inner-most depth outward; the levels of depth d are defined by the runs of the prefix of depth d - 1
+        targets_previous = None
+        for d in range(depth - 1, 0, -1):
+            starts_parent = starts[d - 1]
+            labels = arrays[d][starts[d]]
+            bounds = np.append(starts[d].searchsorted(starts_parent), len(starts[d]))
+            # offsets are relative to the start of the parent level
+            if d == 1:
+                offsets = starts_parent
+            else:
+                starts_grandparent = starts[d - 2]
+                offsets = starts_parent - starts_grandparent[
+                        starts_grandparent.searchsorted(starts_parent, side='right') - 1]
+
+            targets = np.empty(len(starts_parent), dtype=object)
+            for i, (start, end, offset) in enumerate(zip(bounds[:-1], bounds[1:], offsets)):
+                targets[i] = cls._LEVEL_CONSTRUCTOR(
+                        index=get_index(labels[start: end], depth=d),
+                        offset=int(offset),
+                        targets=(None if targets_previous is None
+                                else ArrayGO(targets_previous[start: end], own_iterable=True)),
+                        )
+            targets_previous = targets
+
+        level = cls._LEVEL_CONSTRUCTOR(
+                index=get_index(arrays[0][starts[0]], depth=0),
+                targets=ArrayGO(targets_previous, own_iterable=True),
+                )
+        index = cls(level, name=name)
+        if not index_constructors:
+            index._codes = IndexCodes([Index(unique) for unique in uniques], codes)
+        return index
+
 
 # NOTE: this alternative implementation works, but is shown to be slower than the implementation used above
     # @classmethod
@@ -502,40 +615,65 @@ class IndexHierarchy(IndexBase):
 
     #---------------------------------------------------------------------------
     def __init__(self,
-            levels: tp.Union[IndexLevel, 'IndexHierarchy'],
+            levels: tp.Union[IndexLevel, IndexProduct, 'IndexHierarchy'],
             *,
             name: tp.Hashable = None
             ):
         '''
         Args:
-            levels: IndexLevels instance, or, optionally, an IndexHierarchy to be used to construct a new IndexHierarchy.
+            levels: IndexLevels instance, an IndexProduct instance, or, optionally, an IndexHierarchy to be used to construct a new IndexHierarchy.
             labels: a client can optionally provide the labels used to construct the levels, as an optional optimization in forming the IndexHierarchy.
         '''
 
         if issubclass(levels.__class__, IndexHierarchy):
             # handle construction from another IndexHierarchy
-            if self.STATIC and levels.STATIC:
-                self._levels = levels._levels
+            if levels._product is not None:
+                # a product is immutable, and levels (mutable if necessary) are derived from it when needed
+                self._levels_tree = None
+                self._product = levels._product
+            elif self.STATIC and levels.STATIC:
+                self._levels_tree = levels._levels
+                self._product = None
             else:
                 # must deepcopy labels if not static; passing level constructor ensures we get a mutable if the parent is mutable
-                self._levels = levels._levels.to_index_level(
+                self._levels_tree = levels._levels.to_index_level(
                         cls=self._LEVEL_CONSTRUCTOR
                         )
+                self._product = None
 
-            self._labels = levels.values
-            self._depth = levels.depth
-            self._recache = False
+            if self._product is not None and levels._recache:
+                # labels of a product are deferred
+                self._labels = None
+                self._depth = None
+                self._recache = True
+            else:
+                self._labels = levels.values
+                self._depth = levels.depth
+                self._recache = False
+            # codes are never mutated (a grow-only index discards them on append), and can be shared
+            self._codes = levels._codes
 
             if name is None and levels.name is not None:
                 name = levels.name
 
+        elif isinstance(levels, IndexProduct):
+            # levels, as well as values, are derived from the product when needed
+            self._levels_tree = None
+            self._product = levels
+            self._labels = None
+            self._depth = None
+            self._recache = True
+            self._codes = None
+
         elif isinstance(levels, IndexLevel):
             # always assume ownership of passed in IndexLevel
-            self._levels = levels
+            self._levels_tree = levels
+            self._product = None
             # vlaues derived from levels are deferred
             self._labels = None
             self._depth = None
             self._recache = True
+            self._codes = None
 
         else:
             raise NotImplementedError(f'no handling for creation from {levels}')
@@ -544,10 +682,24 @@ class IndexHierarchy(IndexBase):
 
 
     #---------------------------------------------------------------------------
+    def __getstate__(self) -> tp.Tuple[None, tp.Dict[str, tp.Any]]:
+        '''
+        Exclude labels, which are derived from levels when needed; if levels can be derived from a product, only the product is retained.
+        '''
+        return None, dict(
+                _levels_tree=self._levels_tree if self._product is None else None,
+                _product=self._product,
+                _depth=self._depth,
+                _recache=True,
+                _name=self._name,
+                )
+
     def __setstate__(self, state):
         '''
         Ensure that reanimated NP arrays are set not writeable.
         '''
+        self._labels = None
+        self._codes = None
         for key, value in state[1].items():
             setattr(self, key, value)
         if self._labels is not None:
@@ -579,10 +731,11 @@ class IndexHierarchy(IndexBase):
 
 
     def _iter_label(self, depth_level: int = 0):
-        yield from self._levels.iter(depth_level=depth_level)
+        levels = self._levels if self._product is None else self._product
+        yield from levels.iter(depth_level=depth_level)
 
     def _iter_label_items(self, depth_level: int = 0):
-        yield from enumerate(self._levels.iter(depth_level=depth_level))
+        yield from enumerate(self._iter_label(depth_level=depth_level))
 
     @property
     def iter_label(self) -> IterNodeDepthLevel:
@@ -610,17 +763,37 @@ class IndexHierarchy(IndexBase):
 
     #---------------------------------------------------------------------------
 
+    @property
+    def _levels(self) -> IndexLevel:
+        # a product-backed index derives levels only when they are needed
+        if self._levels_tree is None:
+            self._levels_tree = self._product.to_index_level(self._LEVEL_CONSTRUCTOR)
+        return self._levels_tree
+
     def _update_array_cache(self):
-        # extract all features from self._levels
-        self._depth = next(self._levels.depths())
-        self._labels = self._levels.get_labels()
+        # extract all features from self._levels, or from the product if defined
+        if self._product is not None:
+            self._depth = self._product.depth
+            self._labels = self._product.get_labels()
+        else:
+            self._depth = next(self._levels.depths())
+            self._labels = self._levels.get_labels()
         self._recache = False
 
+    def _update_codes_cache(self):
+        # derive a flat representation, of codes per depth, from self._levels
+        if self._product is not None:
+            self._codes = self._product.to_index_codes()
+        else:
+            self._codes = IndexCodes.from_index_level(self._levels)
+
     #---------------------------------------------------------------------------
 
     def __len__(self) -> int:
         if self._recache:
-            # faster to just get from levels instead of recaching
+            # faster to just get from levels (or the product) instead of recaching
+            if self._product is not None:
+                return self._product.__len__()
             return self._levels.__len__()
         return len(self._labels)
 
@@ -677,6 +850,8 @@ class IndexHierarchy(IndexBase):
     @property
     def depth(self) -> int:
         if self._recache:
+            if self._product is not None:
+                return self._product.depth
             return next(self._levels.depths())
             # self._update_array_cache()
         return self._depth
@@ -690,12 +865,14 @@ class IndexHierarchy(IndexBase):
         Args:
             depth_level: a single depth level, or iterable depth of depth levels.
         '''
-        if isinstance(depth_level, int):
-            sel = depth_level
-        else:
-            sel = list(depth_level)
-        # NOTE: thes values could have different types if we concatenate the values from each of the composed arrays, but outer layers would have to be multiplied
-        return self.values[:, sel]
+        if isinstance(depth_level, INT_TYPES):
+            if self._product is not None:
+                return self._product.values_at_depth(depth_level)
+            # a single depth is expanded from codes, retaining the dtype of that depth
+            if self._codes is None:
+                self._update_codes_cache()
+            return self._codes.values_at_depth(depth_level)
+        return self.values[:, list(depth_level)]
 
 
     @doc_inject()
@@ -709,7 +886,8 @@ class IndexHierarchy(IndexBase):
             raise NotImplementedError('selection from iterables is not implemented')
             # sel = list(depth_level)
 
-        yield from self._levels.label_widths_at_depth(depth_level=depth_level)
+        levels = self._levels if self._product is None else self._product
+        yield from levels.label_widths_at_depth(depth_level=depth_level)
 
 
 
@@ -727,7 +905,8 @@ class IndexHierarchy(IndexBase):
             labels = self._name
         else:
             labels = None
-        return Series(self._levels.dtypes(), index=labels)
+        levels = self._levels if self._product is None else self._product
+        return Series(levels.dtypes(), index=labels)
 
 
     @property
@@ -743,6 +922,11 @@ class IndexHierarchy(IndexBase):
             labels = self._name
         else:
             labels = None
+        if self._product is not None:
+            # indices of a product are immutable; levels of a mutable hierarchy use mutable indices
+            index_types = (index_type if self.STATIC else index_type._MUTABLE_CONSTRUCTOR
+                    for index_type in self._product.index_types())
+            return Series(index_types, index=labels)
         return Series(self._levels.index_types(), index=labels)
 
     #---------------------------------------------------------------------------
@@ -751,6 +935,8 @@ class IndexHierarchy(IndexBase):
         '''
         Return a new IndexHierarchy. This is not a deep copy.
         '''
+        if self._product is not None:
+            return self.__class__(levels=self._product, name=self._name)
         return self.__class__(levels=self._levels, name=self._name)
 
 
@@ -781,10 +967,13 @@ class IndexHierarchy(IndexBase):
         '''
         Return a new `IndexHierarchy` that conforms to the new depth assignments given be `depth_map`.
         '''
+        if self._codes is None:
+            self._update_codes_cache()
         index, _ = rehierarch_and_map(
                 labels=self.values,
                 index_constructor=self.__class__.from_labels,
                 depth_map=depth_map,
+                codes=self._codes.codes,
                 )
         return index
 
@@ -805,8 +994,14 @@ class IndexHierarchy(IndexBase):
             key = key.values
 
         if isinstance(key, IndexHierarchy):
+            if key.depth == self.depth:
+                post = self._leaves_to_iloc(
+                        [key.values_at_depth(d) for d in range(key.depth)])
+                if post is not None:
+                    return post
             # default iteration of IH is as tuple
-            return [self._levels.leaf_loc_to_iloc(k) for k in key]
+            levels = self._levels if self._product is None else self._product
+            return [levels.leaf_loc_to_iloc(k) for k in key]
 
         if isinstance(key, Series):
             if key.dtype == bool:
@@ -819,9 +1014,63 @@ class IndexHierarchy(IndexBase):
                 # For all other Series types, we simply assume that the values are to be used as keys in the IH. This ignores the index, but it does not seem useful to require the Series, used like this, to have a matching index value, as the index and values would need to be identical to have the desired selection.
                 key = key.values
 
+        labels = self._leaves_to_labels(key)
+        if labels is not None:
+            post = self._leaves_to_iloc(labels)
+            if post is not None:
+                return post
+
         # if an HLoc, will pass on to loc_to_iloc
+        if self._product is not None:
+            # positions are derived arithmetically from positions at each depth
+            return self._product.loc_to_iloc(key)
         return self._levels.loc_to_iloc(key)
 
+    def _leaves_to_labels(self,
+            key: GetItemKeyType,
+            ) -> tp.Optional[tp.List[np.ndarray]]:
+        '''
+        If ``key`` is a 2D array, or a list or 1D object array of tuples, of leaf labels, return an array of labels for each depth; otherwise, return None.
+        '''
+        depth = self.depth
+        if isinstance(key, np.ndarray) and key.ndim == 2:
+            if key.shape[1] != depth or key.dtype == DTYPE_BOOL:
+                return None
+            labels = [key[:, d] for d in range(depth)]
+        elif ((isinstance(key, list)
+                or (isinstance(key, np.ndarray) and key.dtype == DTYPE_OBJECT and key.ndim == 1))
+                and len(key)
+                and all(isinstance(k, tuple) and len(k) == depth for k in key)):
+            labels = [iterable_to_array_1d(labels_depth)[0] for labels_depth in zip(*key)]
+        else:
+            return None
+        for labels_depth in labels:
+            # selections within a depth cannot be used in a leaf selection
+            if (labels_depth.dtype == DTYPE_OBJECT
+                    and any(isinstance(k, KEY_MULTIPLE_TYPES) for k in labels_depth)):
+                return None
+        return labels
+
+    def _leaves_to_iloc(self,
+            labels: tp.Sequence[np.ndarray],
+            ) -> tp.Optional[np.ndarray]:
+        '''
+        Given an array of labels for each depth, return the integer positions of all leaf labels, or None if positions cannot be found with codes.
+        '''
+        if self._product is not None:
+            post = self._product.positions_for_labels(labels)
+        else:
+            if self._codes is None:
+                self._update_codes_cache()
+            post = self._codes.positions_for_labels(labels)
+        if post is None:
+            return None
+        positions, found = post
+        if not found.all():
+            missing = np.flatnonzero(~found)[0]
+            raise KeyError(tuple(labels_depth[missing] for labels_depth in labels))
+        return positions
+
     def _extract_iloc(self, key) -> tp.Union['IndexHierarchy', tp.Tuple[tp.Hashable]]:
         '''Extract a new index given an iloc key
         '''
@@ -965,6 +1214,8 @@ class IndexHierarchy(IndexBase):
         '''Determine if a leaf loc is contained in this Index.
         '''
         # levels only, no need to recache as this is what has been mutated
+        if self._product is not None:
+            return self._product.__contains__(value)
         return self._levels.__contains__(value)
 
 
@@ -990,9 +1241,12 @@ class IndexHierarchy(IndexBase):
         '''
         if self._recache:
             self._update_array_cache()
+        if self._codes is None:
+            self._update_codes_cache()
 
         v = self._labels
-        order = np.lexsort([v[:, i] for i in range(v.shape[1]-1, -1, -1)])
+        # sort the unique labels of each depth, then all labels by the ranks of their codes
+        order = self._codes.sort_order()
 
         if not ascending:
             order = order[::-1]
@@ -1006,9 +1260,6 @@ class IndexHierarchy(IndexBase):
         '''
         Return a Boolean array showing True where one or more of the passed in iterable of labels is found in the index.
         '''
-        if self._recache:
-            self._update_array_cache()
-
         matches = []
         for seq in other:
             if not hasattr(seq, '__iter__'):
@@ -1022,6 +1273,15 @@ class IndexHierarchy(IndexBase):
         if not matches:
             return np.full(self.__len__(), False, dtype=bool)
 
+        # compare combined integer keys of codes in place of tuples
+        labels = [iterable_to_array_1d(labels_depth)[0] for labels_depth in zip(*matches)]
+        if self._product is not None:
+            return self._product.isin(labels)
+        if self._codes is None:
+            self._update_codes_cache()
+        post = self._codes.isin(labels)
+        if post is not None:
+            return post
         return isin(self.flat().values, matches)
 
 
@@ -1089,45 +1349,37 @@ class IndexHierarchy(IndexBase):
     def drop_level(self, count: int = 1) -> tp.Union[Index, 'IndexHierarchy']:
         '''Return an IndexHierarchy with one or more leaf levels removed. This might change the size of the index if the resulting levels are not unique.
         '''
+        if count == 0:
+            raise NotImplementedError('no handling for a 0 count drop level.')
+
+        if self._recache:
+            self._update_array_cache()
+        if self._codes is None:
+            self._update_codes_cache()
+
+        index_types = list(self._levels.index_types())
+        depth = self._depth
 
         if count < 0:
-            levels = self._levels.to_index_level()
-            for _ in range(abs(count)):
-                levels_stack = [levels]
-                while levels_stack:
-                    level = levels_stack.pop()
-                    # check to see if children of this target are leaves
-                    if level.targets[0].targets is None:
-                        level.targets = None
-                    else:
-                        levels_stack.extend(level.targets)
-                if levels.targets is None:
-                    # if our root level has no targets, we are at the root
-                    break
-            if levels.targets is None:
-                # fall back to 1D index
-                return levels.index
-            return self.__class__(levels, name=self._name)
-
-        elif count > 0:
-            level = self._levels.to_index_level()
-            for _ in range(count):
-                # NOTE: do not need this check as we look ahead, below
-                # if level.targets is None:
-                #     return level.index
-                targets = []
-                labels = []
-                for target in level.targets:
-                    labels.extend(target.index)
-                    if target.targets is not None:
-                        targets.extend(target.targets)
-                index = level.index.__class__(labels)
-                if not targets:
-                    return index
-                level = level.__class__(index=index, targets=targets)
-            return self.__class__(level, name=self._name)
+            # retain outer depths; as labels of outer depths are contiguous, only the first of each run of outer labels is kept
+            depth_retained = max(depth + count, 1)
+            sel = slice(0, depth_retained)
+            keep = self._codes.leaf_changes(depth_retained)
+            if depth_retained == 1:
+                return index_types[0](self._codes.values_at_depth(0)[keep])
+            labels = self._labels[keep, sel]
         else:
-            raise NotImplementedError('no handling for a 0 count drop level.')
+            depth_start = min(count, depth - 1)
+            sel = slice(depth_start, depth)
+            if depth_start == depth - 1:
+                return index_types[depth_start](self._codes.values_at_depth(depth_start))
+            labels = self._labels[:, sel]
+
+        labels.flags.writeable = False
+        return self.__class__.from_labels(labels,
+                index_constructors=index_types[sel],
+                name=self._name,
+                )
 
 
 
@@ -1145,15 +1397,22 @@ class IndexHierarchyGO(IndexHierarchy):
     _INDEX_CONSTRUCTOR = IndexGO
 
     __slots__ = (
-            '_levels', # IndexLevel
-            '_labels',
-            '_depth',
             '_keys',
             '_length',
-            '_recache',
-            '_name'
+            '_labels_mutable',
             )
 
+    _labels_mutable: tp.Optional[np.ndarray]
+
+    def __init__(self,
+            levels: tp.Union[IndexLevel, IndexHierarchy],
+            *,
+            name: tp.Hashable = None
+            ):
+        IndexHierarchy.__init__(self, levels, name=name)
+        # storage of labels, grown by doubling capacity on append, of which labels are a view; None if labels have not been derived from levels
+        self._labels_mutable = self._labels
+
     # @classmethod
     # def from_pandas(cls, value) -> 'IndexHierarchyGO':
     #     '''
@@ -1161,24 +1420,61 @@ class IndexHierarchyGO(IndexHierarchy):
     #     '''
     #     return IndexBase.from_pandas(value, is_static=False)
 
+    def __setstate__(self, state):
+        IndexHierarchy.__setstate__(self, state)
+        self._labels_mutable = self._labels
+
+    def _update_array_cache(self):
+        IndexHierarchy._update_array_cache(self)
+        self._labels_mutable = self._labels
+
     def append(self, value: tuple):
         '''
         Append a single label to this index.
         '''
         self._levels.append(value)
-        self._recache = True
+        # levels are now mutated, and no longer a product
+        self._product = None
+        self._codes = None
+        if self._recache:
+            return # labels will be derived from levels
+
+        count = len(self._labels)
+        storage = self._labels_mutable
+        row = tuple(self._levels.labels_last())
+        dtype = resolve_dtype_iter(chain(
+                (storage.dtype,),
+                (label.dtype for label in row)))
+        if (count == len(storage)
+                or not storage.flags.writeable
+                or storage.dtype != dtype):
+            capacity = max(count * 2, len(storage), 8)
+            storage_new = np.empty((capacity, self._depth), dtype=dtype)
+            storage_new[:count] = storage[:count]
+            storage = storage_new
+            self._labels_mutable = storage
+        for depth, label in enumerate(row):
+            storage[count:count + 1, depth] = label
+        # as storage is only written beyond the view, the view is never mutated
+        self._labels = storage[:count + 1]
+        self._labels.flags.writeable = False
 
     def extend(self, other: IndexHierarchy):
         '''
         Extend this IndexHiearchy in-place
         '''
         self._levels.extend(other._levels)
+        self._product = None
+        self._labels_mutable = None
+        self._codes = None
         self._recache = True
 
     def copy(self: IH) -> IH:
         '''
         Return a new IndexHierarchy. This is not a deep copy.
         '''
+        if self._product is not None:
+            return self.__class__(levels=self._product, name=self._name)
         return self.__class__(
                 levels=self._levels.to_index_level(),
                 name=self._name
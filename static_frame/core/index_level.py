@@ -16,6 +16,9 @@ from static_frame.core.util import KEY_MULTIPLE_TYPES
 from static_frame.core.util import KEY_ITERABLE_TYPES
 from static_frame.core.util import INT_TYPES
 from static_frame.core.util import GetItemKeyType
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import EMPTY_ARRAY_INT
+from static_frame.core.util import positions_to_slice
 
 from static_frame.core.util import resolve_dtype_iter
 from static_frame.core.util import GetItemKeyTypeCompound
@@ -333,19 +336,39 @@ class IndexLevel:
             # drop to a single iloc selection
             return ilocs[0]
 
-        # NOTE: might be able to combine contiguous ilocs into a single slice
-        iloc_flat: tp.List[GetItemKeyType] = [] # combine into one flat iloc
+        # as hierarchies are grouped by outer labels, matches are generally one or few contiguous ranges; combine them into a single slice (permitting selection by views) where possible; otherwise, into a single array of integers
         length = self.__len__()
+        parts: tp.List[tp.Union[slice, np.ndarray]] = []
         for part in ilocs:
             if isinstance(part, slice):
-                iloc_flat.extend(range(*part.indices(length)))
-            # just look for ints
+                start, stop, step = part.indices(length)
+                if step == 1:
+                    part = slice(start, max(start, stop))
+                else:
+                    part = np.arange(start, stop, step)
             elif isinstance(part, INT_TYPES):
-                iloc_flat.append(part)
-            else: # assume it is an iterable
+                part = slice(part, part + 1)
+            else: # assume it is an iterable of integers
                 assert part is not None
-                iloc_flat.extend(part)
-        return iloc_flat
+                part = np.asarray(part, dtype=DTYPE_INT_DEFAULT)
+                part = positions_to_slice(part) or part
+            if isinstance(part, slice) and part.start == part.stop:
+                continue # empty selection
+            if (parts
+                    and isinstance(part, slice)
+                    and isinstance(parts[-1], slice)
+                    and parts[-1].stop == part.start):
+                parts[-1] = slice(parts[-1].start, part.stop)
+            else:
+                parts.append(part)
+
+        if len(parts) == 1 and isinstance(parts[0], slice):
+            return parts[0]
+        if not parts:
+            return EMPTY_ARRAY_INT
+        return np.concatenate([
+                np.arange(part.start, part.stop) if isinstance(part, slice) else part
+                for part in parts])
 
     def get_labels(self) -> np.ndarray:
         '''
@@ -385,6 +408,17 @@ class IndexLevel:
         labels.flags.writeable = False
         return labels
 
+    def labels_last(self) -> tp.Iterator[np.ndarray]:
+        '''
+        For each depth, yield a one-element array of the label of the last leaf.
+        '''
+        level = self
+        while True:
+            yield level.index.values[-1:]
+            if level.targets is None:
+                return
+            level = level.targets[-1]
+
 
     # def values_at_depth(self,
     #         depth_level: int
@@ -15,6 +15,10 @@ from static_frame.core.util import resolve_dtype
 from static_frame.core.util import isna_array
 from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import array_to_groups_and_locations
+from static_frame.core.util import locations_to_selections
+from static_frame.core.util import locations_to_order
+from static_frame.core.util import array_group_reduce
+from static_frame.core.util import array_window_reduce
 from static_frame.core.util import array_to_duplicated
 from static_frame.core.util import full_for_fill
 from static_frame.core.util import mloc
@@ -77,6 +81,7 @@ from static_frame.core.index_base import IndexBase
 from static_frame.core.container_util import index_from_optional_constructor
 from static_frame.core.container_util import matmul
 from static_frame.core.container_util import axis_window_items
+from static_frame.core.container_util import axis_window_bounds
 from static_frame.core.container_util import rehierarch_and_map
 
 from static_frame.core.index_auto import IndexAutoFactory
@@ -1279,8 +1284,8 @@ class Series(ContainerOperand):
             raise AxisInvalid(f'invalid axis {axis}')
 
         groups, locations = array_to_groups_and_locations(self.values)
-        for idx, g in enumerate(groups):
-            selection = locations == idx
+        for g, selection in zip(groups,
+                locations_to_selections(locations, len(groups))):
             yield g, self._extract_iloc(selection)
 
     def _axis_group(self, *,
@@ -1311,8 +1316,8 @@ class Series(ContainerOperand):
         groups, locations = array_to_groups_and_locations(
                 values)
 
-        for idx, g in enumerate(groups):
-            selection = locations == idx
+        for g, selection in zip(groups,
+                locations_to_selections(locations, len(groups))):
             if group_to_tuple:
                 g = tuple(g)
             yield g, self._extract_iloc(selection)
@@ -1715,6 +1720,108 @@ class Series(ContainerOperand):
         '''
         return argmax_1d(self.values, skipna=skipna)
 
+    def group_labels_reduce(self,
+            depth_level: DepthLevelSpecifier = 0,
+            func: str = 'sum',
+            *,
+            skipna: bool = True,
+            ) -> 'Series':
+        '''
+        Group by the labels of one or more depths of the index, and reduce values by group, returning a Series with a label for each group. This is equivalent to, but much faster than, applying a reduction with ``iter_group_labels``.
+
+        Args:
+            depth_level: one or more depths of the index to group by.
+            func: one of 'sum', 'mean', 'min', 'max', 'count', 'std', 'first', or 'last'.
+            skipna: if True, missing values are excluded.
+        '''
+        groups, locations = array_to_groups_and_locations(
+                self._index.values_at_depth(depth_level))
+        order, locations, counts = locations_to_order(locations, len(groups))
+
+        values = self.values if order is None else self.values[order]
+        values = array_group_reduce(values,
+                locations=locations,
+                counts=counts,
+                func=func,
+                skipna=skipna)
+        values.flags.writeable = False
+
+        if groups.ndim == 2 and groups.shape[1] == 1:
+            groups = groups[:, 0]
+        if groups.ndim == 2:
+            index = IndexHierarchy.from_labels(groups)
+        else:
+            index = Index(groups)
+
+        return self.__class__(values,
+                index=index,
+                name=self._name,
+                own_index=True)
+
+    def window_reduce(self,
+            size: int,
+            func: str = 'mean',
+            *,
+            step: int = 1,
+            window_sized: bool = True,
+            label_shift: int = 0,
+            start_shift: int = 0,
+            size_increment: int = 0,
+            skipna: bool = True,
+            ) -> 'Series':
+        '''
+        Reduce values by window, returning a Series with a label for each window. Windows are determined as with ``iter_window``, to which this is equivalent, but much faster than, applying a reduction.
+
+        Args:
+            size: integer greater than 0.
+            func: one of 'sum', 'mean', 'min', 'max', 'count', or 'std'.
+            step: integer greater than or equal to 0 to determine the step size between windows.
+            window_sized: if True, windows that do not meet the size are skipped.
+            label_shift: shift, relative to the right-most data point contained in the window, to derive the label to be paired with the window.
+            start_shift: shift from 0 to determine where the collection of windows begins.
+            size_increment: value to be added to each window after the first, so as to, in combination with setting the step size to 0, permit expanding windows.
+            skipna: if True, missing values are excluded.
+        '''
+        starts, stops, label_ilocs = axis_window_bounds(
+                count=len(self._index),
+                size=size,
+                step=step,
+                window_sized=window_sized,
+                label_shift=label_shift,
+                start_shift=start_shift,
+                size_increment=size_increment)
+        values = array_window_reduce(self.values,
+                starts=starts,
+                stops=stops,
+                func=func,
+                skipna=skipna)
+        values.flags.writeable = False
+
+        return self.__class__(values,
+                index=self._index._extract_iloc(label_ilocs),
+                name=self._name,
+                own_index=True)
+
+    def expanding_reduce(self,
+            func: str = 'mean',
+            *,
+            size: int = 1,
+            skipna: bool = True,
+            ) -> 'Series':
+        '''
+        Reduce values by expanding window, where the first window includes the first ``size`` values and each subsequent window one more, returning a Series labelled by the last label of each window. This is equivalent to, but much faster than, applying a reduction with ``iter_window`` with a ``step`` of 0 and a ``size_increment`` of 1.
+
+        Args:
+            func: one of 'sum', 'mean', 'min', 'max', 'count', or 'std'.
+            size: integer greater than 0; the size of the first window.
+            skipna: if True, missing values are excluded; otherwise, all windows after a missing value are missing.
+        '''
+        return self.window_reduce(size,
+                func,
+                step=0,
+                size_increment=1,
+                skipna=skipna)
+
 
     #---------------------------------------------------------------------------
     # utility function to numpy array
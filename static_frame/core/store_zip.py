@@ -145,7 +145,9 @@ class StoreZipPickle(_StoreZip):
             for label, frame in items:
                 if isinstance(frame, FrameGO):
                     raise NotImplementedError('convert FrameGO to Frame before pickling.')
-                zf.writestr(label + self._EXT_CONTAINED, pickle.dumps(frame))
+                # protocol 4 is the highest protocol readable by all supported Python versions, keeping archives portable
+                zf.writestr(label + self._EXT_CONTAINED,
+                        pickle.dumps(frame, protocol=4))
 
 
 
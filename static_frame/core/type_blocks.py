@@ -18,7 +18,7 @@ from static_frame.core.util import DTYPE_BOOL
 from static_frame.core.util import INT_TYPES
 from static_frame.core.util import KEY_ITERABLE_TYPES
 from static_frame.core.util import KEY_MULTIPLE_TYPES
-# from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_INT_DEFAULT
 from static_frame.core.util import DTYPE_NAN_KIND
 
 from static_frame.core.util import GetItemKeyType
@@ -36,8 +36,14 @@ from static_frame.core.util import resolve_dtype
 from static_frame.core.util import resolve_dtype_iter
 from static_frame.core.util import dtype_to_na
 from static_frame.core.util import array_to_groups_and_locations
+from static_frame.core.util import locations_to_selections
+from static_frame.core.util import array_group_reduce
+from static_frame.core.util import array_window_reduce
+from static_frame.core.util import locations_to_order
 from static_frame.core.util import isna_array
 from static_frame.core.util import slice_to_ascending_slice
+from static_frame.core.util import positions_to_slice
+from static_frame.core.util import DTYPE_INT_KIND
 from static_frame.core.util import binary_transition
 from static_frame.core.util import ufunc_axis_skipna
 from static_frame.core.util import shape_filter
@@ -70,15 +76,37 @@ class TypeBlocks(ContainerOperand):
     __slots__ = (
             '_blocks',
             '_dtypes',
-            '_index',
+            '_index_block',
+            '_index_column',
+            '_index_mutable',
             '_shape',
             '_row_dtype',
+            '_consolidate_count',
             'iloc',
             )
 
+    # policy for automatic consolidation, applied lazily before row-wise operations: blocks are consolidated if there are at least CONSOLIDATE_BLOCK_COUNT_MIN blocks (None disables automatic consolidation), and if consolidation would remove at least CONSOLIDATE_FRAGMENTATION_MIN of those blocks
+    CONSOLIDATE_BLOCK_COUNT_MIN: tp.Optional[int] = 32
+    CONSOLIDATE_FRAGMENTATION_MIN: float = 0.5
+
     #---------------------------------------------------------------------------
     # constructors
 
+    @staticmethod
+    def _widths_to_index(
+            widths: tp.Sequence[int],
+            ) -> tp.Tuple[np.ndarray, np.ndarray]:
+        '''
+        Given the count of columns in each block, return immutable arrays giving, for each column, the block index and the column within that block.
+        '''
+        widths = np.array(widths, dtype=DTYPE_INT_DEFAULT)
+        index_block = np.arange(len(widths), dtype=DTYPE_INT_DEFAULT).repeat(widths)
+        starts = np.cumsum(widths) - widths
+        index_column = np.arange(len(index_block), dtype=DTYPE_INT_DEFAULT) - starts.repeat(widths)
+        index_block.flags.writeable = False
+        index_column.flags.writeable = False
+        return index_block, index_column
+
     @classmethod
     def from_blocks(cls,
             raw_blocks: tp.Iterable[np.ndarray],
@@ -96,8 +124,7 @@ class TypeBlocks(ContainerOperand):
         '''
         blocks: tp.List[np.ndarray] = [] # ordered blocks
         dtypes: tp.List[np.dtype] = [] # column position to dtype
-        index: tp.List[tp.Tuple[int, int]] = [] # columns position to blocks key
-        block_count = 0
+        widths: tp.List[int] = [] # block position to count of columns
 
         row_count: tp.Optional[int]
 
@@ -109,15 +136,16 @@ class TypeBlocks(ContainerOperand):
             row_count, column_count = shape_filter(raw_blocks)
             if column_count == 0:
                 # set shape but do not store array
+                index_block, index_column = cls._widths_to_index(widths)
                 return cls(blocks=blocks,
                         dtypes=dtypes,
-                        index=index,
+                        index_block=index_block,
+                        index_column=index_column,
                         shape=(row_count, column_count)
                         )
             blocks.append(immutable_filter(raw_blocks))
-            for i in range(column_count):
-                index.append((block_count, i))
-                dtypes.append(raw_blocks.dtype)
+            widths.append(column_count)
+            dtypes.extend([raw_blocks.dtype] * column_count)
 
         else: # an iterable of blocks
             row_count = None
@@ -143,14 +171,9 @@ class TypeBlocks(ContainerOperand):
                     continue
 
                 blocks.append(immutable_filter(block))
-
-                # store position to key of block, block columns
-                for i in range(c):
-                    index.append((block_count, i))
-                    dtypes.append(block.dtype)
-
+                widths.append(c)
+                dtypes.extend([block.dtype] * c)
                 column_count += c
-                block_count += 1
 
         # blocks cam be empty
         if row_count is None:
@@ -160,10 +183,12 @@ class TypeBlocks(ContainerOperand):
             else:
                 raise ErrorInitTypeBlocks('cannot derive a row_count from blocks; provide a shape reference')
 
+        index_block, index_column = cls._widths_to_index(widths)
         return cls(
                 blocks=blocks,
                 dtypes=dtypes,
-                index=index,
+                index_block=index_block,
+                index_column=index_column,
                 shape=(row_count, column_count),
                 )
 
@@ -206,27 +231,39 @@ class TypeBlocks(ContainerOperand):
             return cls.from_blocks(a)
 
         # for arrays with no width, favor storing shape alone and not creating an array object; the shape will be binding for future appending
-        return cls(blocks=list(), dtypes=list(), index=list(), shape=shape)
+        index_block, index_column = cls._widths_to_index(())
+        return cls(blocks=list(),
+                dtypes=list(),
+                index_block=index_block,
+                index_column=index_column,
+                shape=shape)
 
     #---------------------------------------------------------------------------
 
     def __init__(self, *,
             blocks: tp.List[np.ndarray],
             dtypes: tp.List[np.dtype],
-            index: tp.List[tp.Tuple[int, int]],
+            index_block: np.ndarray,
+            index_column: np.ndarray,
             shape: tp.Tuple[int, int]
             ) -> None:
         '''
         Args:
             blocks: A list of one or two-dimensional NumPy arrays
             dtypes: list of dtypes per external column
-            index: list of pairs, where the first element is the block index, the second elemetns is the intra-block column
+            index_block: immutable integer array giving, for each external column, the block index
+            index_column: immutable integer array giving, for each external column, the intra-block column
             shape: two-element tuple defining row and column count. A (0, 0) shape is permitted for empty TypeBlocks.
         '''
         self._blocks = blocks
         self._dtypes = dtypes
-        self._index = index # list where index, as column, gets block, offset
+        self._index_block = index_block
+        self._index_column = index_column
+        # storage of index_block and index_column, grown by doubling capacity on append, of which both are views; None until the first append
+        self._index_mutable = None
         self._shape = shape
+        # the count of blocks when the consolidation policy was last evaluated
+        self._consolidate_count = 0
 
         if self._blocks:
             self._row_dtype = resolve_dtype_iter(b.dtype for b in self._blocks)
@@ -237,9 +274,15 @@ class TypeBlocks(ContainerOperand):
         self.iloc = InterfaceGetItem(self._extract_iloc)
 
     #---------------------------------------------------------------------------
+    def __getstate__(self) -> tp.Tuple[None, tp.Dict[str, tp.Any]]:
+        '''
+        Exclude state that can be derived from blocks.
+        '''
+        return None, dict(_blocks=self._blocks, _shape=self._shape)
+
     def __setstate__(self, state: tp.Tuple[object, tp.Mapping[str, tp.Any]]) -> None:
         '''
-        Ensure that reanimated NP arrays are set not writeable.
+        Ensure that reanimated NP arrays are set not writeable; derive excluded state from blocks.
         '''
         for key, value in state[1].items():
             setattr(self, key, value)
@@ -247,14 +290,26 @@ class TypeBlocks(ContainerOperand):
         for b in self._blocks:
             b.flags.writeable = False
 
+        if '_index_block' not in state[1]:
+            tb = self.from_blocks(self._blocks, shape_reference=self._shape)
+            self._dtypes = tb._dtypes
+            self._index_block = tb._index_block
+            self._index_column = tb._index_column
+            self._index_mutable = None
+            self._consolidate_count = 0
+            self._row_dtype = tb._row_dtype
+            self.iloc = InterfaceGetItem(self._extract_iloc)
+
     def copy(self) -> 'TypeBlocks':
         '''
         Return a new TypeBlocks. Underlying arrays are not copied.
         '''
+        # the immutable index arrays can be shared, as storage is only written beyond them, and the new instance allocates its own storage on append
         return self.__class__(
                 blocks=[b for b in self._blocks],
                 dtypes=self._dtypes.copy(), # list
-                index=self._index.copy(),
+                index_block=self._index_block,
+                index_column=self._index_column,
                 shape=self._shape)
 
     #---------------------------------------------------------------------------
@@ -297,6 +352,17 @@ class TypeBlocks(ContainerOperand):
     def unified(self) -> bool:
         return len(self._blocks) <= 1
 
+    @property
+    def fragmentation(self) -> float:
+        '''
+        Return the fraction of blocks that would be removed by consolidating adjacent blocks of the same dtype.
+        '''
+        count = len(self._blocks)
+        if count <= 1:
+            return 0.0
+        count_consolidated = sum(1 for _ in self._reblock_signature())
+        return 1 - count_consolidated / count
+
     #---------------------------------------------------------------------------
     # common NP-style properties
 
@@ -373,6 +439,7 @@ class TypeBlocks(ContainerOperand):
     def values(self) -> np.ndarray:
         '''Returns a consolidated NP array of the all blocks.
         '''
+        self._consolidate_by_policy()
         # always return a 2D array
         return self._blocks_to_array(
                 blocks=self._blocks,
@@ -390,6 +457,7 @@ class TypeBlocks(ContainerOperand):
             axis: 0 iterates over columns, 1 iterates over rows
         '''
         if axis == 1: # iterate over rows
+            self._consolidate_by_policy()
             unified = self.unified
             # iterate over rows; might be faster to create entire values
             if not reverse:
@@ -426,9 +494,13 @@ class TypeBlocks(ContainerOperand):
 
         elif axis == 0: # iterate over columns
             if not reverse:
-                block_column_iter: tp.Iterable[tp.Tuple[int, int]] = self._index
+                block_column_iter: tp.Iterable[tp.Tuple[int, int]] = zip(
+                        self._index_block.tolist(),
+                        self._index_column.tolist())
             else:
-                block_column_iter = reversed(self._index)
+                block_column_iter = zip(
+                        self._index_block[::-1].tolist(),
+                        self._index_column[::-1].tolist())
 
             for block_idx, column in block_column_iter:
                 b = self._blocks[block_idx]
@@ -445,7 +517,8 @@ class TypeBlocks(ContainerOperand):
         Generator of pairs of iloc locations, values accross entire TypeBlock.
         '''
         for iloc in np.ndindex(self._shape):
-            block_idx, column = self._index[iloc[1]]
+            block_idx = self._index_block[iloc[1]]
+            column = self._index_column[iloc[1]]
             b = self._blocks[block_idx]
             if b.ndim == 1:
                 yield iloc, b[iloc[0]]
@@ -494,16 +567,12 @@ class TypeBlocks(ContainerOperand):
         elif axis is not None and self.shape[axis] != other.shape[axis]:
             return False
 
-        for a, b in zip_longest(self._blocks, other._blocks, fillvalue=None):
-            if a is None or b is None:
-                return False
-            if axis is None:
-                if shape_filter(a) != shape_filter(b):
-                    return False
-            else:
-                if shape_filter(a)[axis] != shape_filter(b)[axis]:
-                    return False
-        return True
+        if len(self._blocks) != len(other._blocks):
+            return False
+        if axis == 0: # all blocks have the same count of rows
+            return True
+        # as blocks without columns are not stored, the same column-to-block map defines the same block widths
+        return bool((self._index_block == other._index_block).all())
 
     def reblock_compatible(self, other: 'TypeBlocks') -> bool:
         '''
@@ -577,6 +646,25 @@ class TypeBlocks(ContainerOperand):
                 yield cls._concatenate_blocks(group, group_dtype)
 
 
+    def _consolidate_by_policy(self) -> None:
+        '''
+        If the blocks are fragmented as defined by the consolidation policy, replace them with consolidated blocks; as blocks are immutable and columns (and their dtypes) are unchanged, this is not an observable mutation. The policy is only evaluated again after blocks are appended.
+        '''
+        count = len(self._blocks)
+        if (self.CONSOLIDATE_BLOCK_COUNT_MIN is None
+                or count < self.CONSOLIDATE_BLOCK_COUNT_MIN
+                or count == self._consolidate_count):
+            return
+        self._consolidate_count = count
+        if self.fragmentation < self.CONSOLIDATE_FRAGMENTATION_MIN:
+            return
+
+        self._blocks = list(self.consolidate_blocks(raw_blocks=self._blocks))
+        self._index_block, self._index_column = self._widths_to_index(
+                [shape_filter(b)[1] for b in self._blocks])
+        self._index_mutable = None
+        self._consolidate_count = len(self._blocks)
+
     def _reblock(self) -> tp.Iterator[np.ndarray]:
         '''Generator of new block that consolidate adjacent types that are the same.
         '''
@@ -589,6 +677,36 @@ class TypeBlocks(ContainerOperand):
         return self.from_blocks(self.consolidate_blocks(raw_blocks=self._blocks))
 
 
+    def take_rows_fill(self,
+            positions: np.ndarray,
+            fill_value: tp.Any,
+            ) -> 'TypeBlocks':
+        '''
+        Return a TypeBlocks of the rows at the integer ``positions``, where a position of -1 is a row filled with ``fill_value``. Used for Frame.join().
+        '''
+        if self._shape[1] == 0:
+            return self.from_zero_size_shape((len(positions), 0))
+
+        missing = positions < 0
+        if not missing.any():
+            missing = None
+        else:
+            found = ~missing
+            positions_found = positions[found]
+
+        def blocks() -> tp.Iterator[np.ndarray]:
+            for b in self._blocks:
+                if missing is None:
+                    values = b[positions]
+                else:
+                    values = full_for_fill(b.dtype, (len(positions),) + b.shape[1:], fill_value)
+                    values[found] = b[positions_found]
+                values.flags.writeable = False
+                yield values
+
+        return self.from_blocks(blocks())
+
+
     def resize_blocks(self, *,
             index_ic: tp.Optional[IndexCorrespondence],
             columns_ic: tp.Optional[IndexCorrespondence],
@@ -637,7 +755,8 @@ class TypeBlocks(ContainerOperand):
                     )
                     for idx in range(columns_ic.size):
                         if idx in dst_to_src:
-                            block_idx, block_col = self._index[dst_to_src[idx]]
+                            block_idx = self._index_block[dst_to_src[idx]]
+                            block_col = self._index_column[dst_to_src[idx]]
                             b = self._blocks[block_idx]
                             if b.ndim == 1:
                                 yield b
@@ -677,7 +796,8 @@ class TypeBlocks(ContainerOperand):
 
                     for idx in range(columns_ic.size):
                         if idx in columns_dst_to_src:
-                            block_idx, block_col = self._index[columns_dst_to_src[idx]]
+                            block_idx = self._index_block[columns_dst_to_src[idx]]
+                            block_col = self._index_column[columns_dst_to_src[idx]]
                             b = self._blocks[block_idx]
 
                             if index_ic.is_subset:
@@ -712,7 +832,7 @@ class TypeBlocks(ContainerOperand):
             key: iloc selector on opposite axis
 
         Returns:
-            Generator of group, selection pairs, where selection is an np.ndaarray. Returned is as an np.ndarray if key is more than one column.
+            Generator of group, selection, TypeBlocks triples, where selection is a slice where the group is contiguous, otherwise an np.ndarray of integer positions. Returned is as an np.ndarray if key is more than one column.
         '''
         # in worse case this will make a copy of the values extracted; this is probably still cheaper than iterating manually through rows/columns
         unique_axis = None
@@ -734,6 +854,9 @@ class TypeBlocks(ContainerOperand):
                 group_source,
                 unique_axis)
 
+        selections = locations_to_selections(locations,
+                groups.shape[unique_axis] if unique_axis is not None else len(groups))
+
         if unique_axis is not None:
             # make the groups hashable for usage in index construction
             if axis == 0:
@@ -741,13 +864,135 @@ class TypeBlocks(ContainerOperand):
             elif axis == 1:
                 groups = array2d_to_tuples(groups.T)
 
-        for idx, g in enumerate(groups):
-            selection = locations == idx
+        for g, selection in zip(groups, selections):
             if axis == 0: # return row extractions
                 yield g, selection, self._extract(row_key=selection)
             elif axis == 1: # return columns extractions
                 yield g, selection, self._extract(column_key=selection)
 
+    def group_reduce(self,
+            axis: int,
+            key: GetItemKeyTypeCompound,
+            func: str,
+            skipna: bool,
+            ) -> tp.Tuple[np.ndarray, 'TypeBlocks']:
+        '''
+        Reduce all groups in a single pass per block, rather than extracting each group.
+
+        Args:
+            key: iloc selector on opposite axis
+            func: one of ``GROUP_REDUCE_FUNCS``.
+
+        Returns:
+            The groups, as a 2D array (one group per row) if key is more than one column, and a TypeBlocks of the reductions of all positions not in key, with groups on the grouped axis.
+        '''
+        if axis == 0:
+            group_source = self._extract_array(column_key=key)
+            unique_axis = 0 if group_source.ndim > 1 else None
+            remain = np.full(self._shape[1], True, dtype=DTYPE_BOOL)
+        elif axis == 1:
+            group_source = self._extract_array(row_key=key)
+            if group_source.ndim > 1 and group_source.shape[0] > 1:
+                unique_axis = 1
+            else:
+                unique_axis = None
+            remain = np.full(self._shape[0], True, dtype=DTYPE_BOOL)
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        groups, locations = array_to_groups_and_locations(
+                group_source,
+                unique_axis)
+        if unique_axis == 1:
+            groups = groups.T
+
+        remain[key] = False
+        if axis == 0:
+            tb = self._extract(column_key=remain)
+        else:
+            tb = self._extract(row_key=remain)
+
+        return groups, tb.group_locations_reduce(
+                axis=axis,
+                locations=locations,
+                count=len(groups),
+                func=func,
+                skipna=skipna)
+
+    def group_locations_reduce(self,
+            axis: int,
+            locations: np.ndarray,
+            count: int,
+            func: str,
+            skipna: bool,
+            ) -> 'TypeBlocks':
+        '''
+        Reduce groups, given the group position of each row (or column, if ``axis`` is 1), returning a TypeBlocks with a row (or column) per group.
+
+        Args:
+            locations: group positions, as returned by ``array_to_groups_and_locations``.
+            count: the count of groups.
+            func: one of ``GROUP_REDUCE_FUNCS``.
+        '''
+        order, locations, counts = locations_to_order(locations, count)
+
+        def reduce(array: np.ndarray) -> np.ndarray:
+            if order is not None:
+                array = array[order]
+            post = array_group_reduce(array,
+                    locations=locations,
+                    counts=counts,
+                    func=func,
+                    skipna=skipna)
+            post.flags.writeable = False
+            return post
+
+        if axis == 0:
+            if self._shape[1] == 0:
+                return self.from_zero_size_shape((count, 0))
+            return self.from_blocks(reduce(b) for b in self._blocks)
+        elif axis == 1:
+            if self._shape[0] == 0:
+                return self.from_zero_size_shape((0, count))
+            # columns are grouped, and reduced within each row
+            return self.from_blocks(reduce(self.values.T).T)
+        raise AxisInvalid(f'invalid axis: {axis}')
+
+    def window_reduce(self,
+            axis: int,
+            starts: np.ndarray,
+            stops: np.ndarray,
+            func: str,
+            skipna: bool,
+            ) -> 'TypeBlocks':
+        '''
+        Reduce windows of rows (or columns, if ``axis`` is 1), given the start and stop positions of each window, returning a TypeBlocks with a row (or column) per window.
+
+        Args:
+            func: one of ``WINDOW_REDUCE_FUNCS``.
+        '''
+        count = len(starts)
+
+        def reduce(array: np.ndarray) -> np.ndarray:
+            post = array_window_reduce(array,
+                    starts=starts,
+                    stops=stops,
+                    func=func,
+                    skipna=skipna)
+            post.flags.writeable = False
+            return post
+
+        if axis == 0:
+            if self._shape[1] == 0:
+                return self.from_zero_size_shape((count, 0))
+            return self.from_blocks(reduce(b) for b in self._blocks)
+        elif axis == 1:
+            if self._shape[0] == 0:
+                return self.from_zero_size_shape((0, count))
+            # windows are taken over columns, and reduced within each row
+            return self.from_blocks(reduce(self.values.T).T)
+        raise AxisInvalid(f'invalid axis: {axis}')
+
 
     #---------------------------------------------------------------------------
     # transformations resulting in reduced dimensionality
@@ -772,6 +1017,8 @@ class TypeBlocks(ContainerOperand):
         '''
         if axis < 0 or axis > 1:
             raise RuntimeError(f'invalid axis: {axis}')
+        if axis == 1:
+            self._consolidate_by_policy()
 
         func = partial(ufunc_axis_skipna,
                 skipna=skipna,
@@ -911,54 +1158,38 @@ class TypeBlocks(ContainerOperand):
     # extraction utilities
 
     @staticmethod
-    def _cols_to_slice(indices: tp.Sequence[int]) -> slice:
-        '''Translate an iterable of contiguous integers into a slice. Integers are assumed to be intentionally ordered and contiguous.
-        '''
-        start_idx = indices[0]
-        # single column as a single slice
-        if len(indices) == 1:
-            return slice(start_idx, start_idx + 1)
-
-        stop_idx = indices[-1]
-        if stop_idx > start_idx: # ascending indices
-            return slice(start_idx, stop_idx + 1)
-
-        if stop_idx == 0:
-            return slice(start_idx, None, -1)
-        # stop is less than start, need to reduce by 1 to cover range
-        return slice(start_idx, stop_idx - 1, -1)
-
-
-    @classmethod
-    def _indices_to_contiguous_pairs(cls, indices: tp.Iterable[tp.Tuple[int, int]]
-        ) -> tp.Iterator[tp.Tuple[int, slice]]:
-        '''Indices are pairs of (block_idx, value); convert these to pairs of (block_idx, slice) when we identify contiguous indices within a block (these are block slices)
-
-        Args:
-            indices: can be a generator
-        '''
-        # store pairs of block idx, ascending col list
-        last = None
-        for block_idx, col in indices:
-            if not last:
-                last = (block_idx, col)
-                bundle = [col]
-                continue
-            if last[0] == block_idx and abs(col - last[1]) == 1:
-                # if contiguous, update last, add to bundle
-                last = (block_idx, col)
-                # do not need to store all col, only the last, however probably easier to just accumulate all
-                bundle.append(col)
-                continue
-            # either new block, or not contiguous on same block
-            yield (last[0], cls._cols_to_slice(bundle))
-            # start a new bundle
-            bundle = [col]
-            last = (block_idx, col)
-
-        # last can be None
-        if last and bundle:
-            yield (last[0], cls._cols_to_slice(bundle))
+    def _indices_to_contiguous_pairs(
+            index_block: np.ndarray,
+            index_column: np.ndarray,
+            ) -> tp.Iterator[tp.Tuple[int, slice]]:
+        '''Given arrays of block index and intra-block column for a selection of columns, yield pairs of (block_idx, slice) for each run of contiguous columns within a block (these are block slices).
+        '''
+        count = len(index_block)
+        if not count:
+            return
+
+        # a column continues a run if in the same block, and adjacent to the previous column
+        step = index_column[1:] - index_column[:-1]
+        adjacent = (index_block[1:] == index_block[:-1]) & ((step == 1) | (step == -1))
+        # a run must continue in one direction
+        continues = adjacent.copy()
+        continues[1:] &= ~(adjacent[:-1] & (step[1:] != step[:-1]))
+
+        starts = np.flatnonzero(~continues) + 1
+        starts = np.concatenate((np.zeros(1, dtype=starts.dtype), starts))
+        ends = np.append(starts[1:], count) - 1
+
+        for block_idx, first, last in zip(
+                index_block[starts].tolist(),
+                index_column[starts].tolist(),
+                index_column[ends].tolist(),
+                ):
+            if last >= first: # ascending, or a single column
+                yield block_idx, slice(first, last + 1)
+            elif last == 0:
+                yield block_idx, slice(first, None, -1)
+            else: # stop is less than start, need to reduce by 1 to cover range
+                yield block_idx, slice(first, last - 1, -1)
 
     def _all_block_slices(self) -> tp.Iterator[tp.Tuple[int, slice]]:
         '''
@@ -989,27 +1220,27 @@ class TypeBlocks(ContainerOperand):
         else:
             if isinstance(key, INT_TYPES):
                 # the index has the pair block, column integer
-                yield self._index[key]
+                yield int(self._index_block[key]), int(self._index_column[key])
             else: # all cases where we try to get contiguous slices
                 if isinstance(key, slice):
                     #  slice the index; null slice already handled
                     if not retain_key_order:
                         key = slice_to_ascending_slice(key, self._shape[1])
-                    indices: tp.Iterable[tp.Tuple[int, int]] = self._index[key]
                 elif isinstance(key, np.ndarray) and key.dtype == bool:
-                    # NOTE: if self._index was an array we could use Boolean selection directly
-                    indices = (self._index[idx] for idx, v in enumerate(key) if v)
+                    pass # Boolean arrays select from the index directly
                 elif isinstance(key, KEY_ITERABLE_TYPES):
-                    # an iterable of keys, may not have contiguous regions; provide in the order given; set as a generator; self._index is a list, not an np.array, so cannot slice self._index; requires iteration in passed generator so probably this is as fast as it can be.
-                    if retain_key_order:
-                        indices = (self._index[x] for x in key)
-                    else:
-                        indices = (self._index[x] for x in sorted(key))
+                    # an iterable of keys, may not have contiguous regions; provide in the order given
+                    if not isinstance(key, np.ndarray):
+                        key = np.array(key, dtype=DTYPE_INT_DEFAULT)
+                    if not retain_key_order:
+                        key = np.sort(key)
                 elif key is None: # get all
-                    indices = self._index
+                    key = NULL_SLICE
                 else:
                     raise NotImplementedError('Cannot handle key', key)
-                yield from self._indices_to_contiguous_pairs(indices)
+                yield from self._indices_to_contiguous_pairs(
+                        self._index_block[key],
+                        self._index_column[key])
 
 
     #---------------------------------------------------------------------------
@@ -1243,7 +1474,8 @@ class TypeBlocks(ContainerOperand):
         elif not wrap and column_shift == 0 and row_shift == 0:
             yield from self._blocks
         else:
-            block_start_idx, block_start_column = self._index[index_start_pos]
+            block_start_idx = self._index_block[index_start_pos]
+            block_start_column = self._index_column[index_start_pos]
             block_start = self._blocks[block_start_idx]
 
             if block_start_column == 0:
@@ -1609,7 +1841,8 @@ class TypeBlocks(ContainerOperand):
         '''
         # identifying column_key as integer, then we only access one block, and can return directly without iterating over blocks
         if isinstance(column_key, INT_TYPES):
-            block_idx, column = self._index[column_key]
+            block_idx = self._index_block[column_key]
+            column = self._index_column[column_key]
             b = self._blocks[block_idx]
             if b.ndim == 1:
                 if row_key is None:
@@ -1661,9 +1894,16 @@ class TypeBlocks(ContainerOperand):
         Returns:
             TypeBlocks, or a single element if both are coordinats
         '''
+        if (isinstance(row_key, np.ndarray)
+                and row_key.dtype.kind in DTYPE_INT_KIND
+                and row_key.ndim == 1):
+            # contiguous, ascending positions can be selected as views
+            row_key = positions_to_slice(row_key) or row_key
+
         # identifying column_key as integer, then we only access one block, and can return directly without iterating over blocks
         if isinstance(column_key, INT_TYPES):
-            block_idx, column = self._index[column_key]
+            block_idx = self._index_block[column_key]
+            column = self._index_column[column_key]
             b = self._blocks[block_idx]
             row_key_null = (row_key is None or
                     (isinstance(row_key, slice)
@@ -2429,6 +2669,29 @@ class TypeBlocks(ContainerOperand):
     #---------------------------------------------------------------------------
     # mutate
 
+    def _index_append(self, block_idx: int, block_columns: int) -> None:
+        '''
+        Extend the index with ``block_columns`` columns of the block at ``block_idx``, and update the shape. Storage is grown by doubling its capacity, such that appends are amortized constant time.
+        '''
+        count = self._shape[1]
+        count_new = count + block_columns
+        storage = self._index_mutable
+        if storage is None or count_new > storage.shape[1]:
+            capacity = max(count * 2, count_new, 8)
+            storage = np.empty((2, capacity), dtype=DTYPE_INT_DEFAULT)
+            storage[0, :count] = self._index_block
+            storage[1, :count] = self._index_column
+            self._index_mutable = storage
+        storage[0, count: count_new] = block_idx
+        storage[1, count: count_new] = np.arange(block_columns)
+        # as storage is only written beyond the views, the views are never mutated
+        self._index_block = storage[0, :count_new]
+        self._index_column = storage[1, :count_new]
+        self._index_block.flags.writeable = False
+        self._index_column.flags.writeable = False
+        # extend shape, or define it if not yet set
+        self._shape = (self._shape[0], count_new)
+
     def append(self, block: np.ndarray) -> None:
         '''Add a block; an array copy will not be made unless the passed in block is not immutable'''
         # NOTE: shape can be 0, 0 if empty, or any one dimension can be 0. if columns is 0 and rows is non-zero, that row count is binding for appending (though the array need no tbe appended); if columns is > 0 and rows is zero, that row is binding for appending (and the array should be appended).
@@ -2448,14 +2711,10 @@ class TypeBlocks(ContainerOperand):
                 # do not append 0 width arrays
                 return
 
-        # extend shape, or define it if not yet set
-        self._shape = (row_count, self._shape[1] + block_columns)
 
         # add block, dtypes, index
-        block_idx = len(self._blocks) # next block
-        for i in range(block_columns):
-            self._index.append((block_idx, i))
-            self._dtypes.append(block.dtype)
+        self._index_append(len(self._blocks), block_columns)
+        self._dtypes.extend([block.dtype] * block_columns)
 
         # make immutable copy if necessary before appending
         self._blocks.append(immutable_filter(block))
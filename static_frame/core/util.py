@@ -54,10 +54,20 @@ DEFAULT_STABLE_SORT_KIND = 'mergesort'
 DTYPE_STR_KIND = ('U', 'S') # S is np.bytes_
 DTYPE_INT_KIND = ('i', 'u') # signed and unsigned
 DTYPE_NAN_KIND = ('f', 'c') # kinds that support NaN values
+DTYPE_NA_KIND = ('f', 'c', 'O', 'M', 'm') # kinds that can hold missing values
 DTYPE_DATETIME_KIND = 'M'
 DTYPE_TIMEDELTA_KIND = 'm'
 DTYPE_COMPLEX_KIND = 'c'
 DTYPE_NAT_KIND = ('M', 'm')
+DTYPE_NUMERIC_REAL_KIND = ('i', 'u', 'f')
+# kinds that, when strictly ascending, permit label lookup by binary search
+DTYPE_SEARCHABLE_KIND = ('i', 'u', 'f', 'U', 'S', 'M', 'm')
+# kinds that, when ascending by a constant step, permit label lookup by arithmetic
+DTYPE_REGULAR_KIND = ('i', 'u', 'M', 'm')
+# minimum count of values, searched in an ascending array, for which ordering values first is beneficial
+SEARCHSORTED_ORDER_KEY_MIN = 10_000
+# minimum size of an array of labels, relative to the count of unsorted labels, for which sorting those labels is cheaper than mapping lookups
+SORTER_KEY_FRACTION_MIN = 0.05
 # DTYPE_BOOL_KIND = ('b',)
 
 DTYPE_OBJECT = np.dtype(object)
@@ -376,6 +386,16 @@ def resolve_dtype(dt1: np.dtype, dt2: np.dtype) -> np.dtype:
     # if not a string or an object, can use result type
     return np.result_type(dt1, dt2)
 
+def dtype_from_element(value: tp.Any) -> np.dtype:
+    '''
+    Return the dtype of an array that can hold a single element; values that NumPy interprets as sequences, such as tuples, require an object dtype.
+    '''
+    array = np.array(value)
+    if array.ndim == 0:
+        return array.dtype
+    return DTYPE_OBJECT
+
+
 def resolve_dtype_iter(dtypes: tp.Iterable[np.dtype]) -> np.dtype:
     '''Given an iterable of one or more dtypes, do pairwise comparisons to determine compatible overall type. Once we get to object we can stop checking and return object.
 
@@ -553,6 +573,179 @@ def ufunc_unique(
     return np.unique(array, axis=axis)
 
 
+def ufunc_unique_and_locations(
+        array: np.ndarray,
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    Factorize a 1D array, or the rows of a 2D array, returning the unique values (or rows) in the order of ``ufunc_unique``, i.e., sorted if orderable, otherwise in order of first appearance, and the position of each value (or row) in the unique values.
+    '''
+    post = _int_to_groups_and_locations(array)
+    if post is not None:
+        return post
+
+    if array.dtype.kind != 'O':
+        # the axis argument, needed for 2D, is much slower for 1D
+        unique, locations = np.unique(array,
+                return_inverse=True,
+                axis=0 if array.ndim == 2 else None)
+        return unique, locations
+
+    if array.ndim == 1:
+        try:
+            unique, locations = np.unique(array, return_inverse=True)
+            return unique, locations
+        except TypeError: # if unorderable types
+            pass
+        array_iter = array
+    else:
+        array_iter = array2d_to_tuples(array)
+
+    mapping: tp.Dict[tp.Hashable, int] = {}
+    locations = np.fromiter((mapping.setdefault(v, len(mapping)) for v in array_iter),
+            count=len(array),
+            dtype=DTYPE_INT_DEFAULT)
+    unique = np.empty((len(mapping),) + array.shape[1:], dtype=DTYPE_OBJECT)
+    for i, v in enumerate(mapping):
+        unique[i] = v
+    return unique, locations
+
+
+JOIN_HOWS = ('inner', 'left', 'right', 'outer')
+
+def _join_matches(
+        codes_src: np.ndarray,
+        codes_dst: np.ndarray,
+        count: int,
+        keep_unmatched: bool,
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    For each source code, in order, find the positions of all destination rows with the same code, in order; return arrays of source and destination positions for each pair, where, if ``keep_unmatched``, source rows without matches are paired with -1.
+    '''
+    order_dst = np.argsort(codes_dst, kind=DEFAULT_SORT_KIND)
+    counts_dst = np.bincount(codes_dst, minlength=count)
+    starts_dst = np.cumsum(counts_dst) - counts_dst
+
+    repeats = counts_dst[codes_src]
+    emit = np.maximum(repeats, 1) if keep_unmatched else repeats
+    total = emit.sum()
+    src = np.repeat(np.arange(len(codes_src)), emit)
+    # position of each pair within the matches of its source row
+    offsets = np.arange(total) - np.repeat(np.cumsum(emit) - emit, emit)
+    positions = np.repeat(starts_dst[codes_src], emit) + offsets
+
+    if keep_unmatched and total != repeats.sum():
+        dst = np.full(total, -1, dtype=DTYPE_INT_DEFAULT)
+        matched = np.repeat(repeats > 0, emit)
+        dst[matched] = order_dst[positions[matched]]
+    else:
+        dst = order_dst[positions]
+    return src, dst
+
+
+def join_locations(
+        left: tp.Sequence[np.ndarray],
+        right: tp.Sequence[np.ndarray],
+        how: str,
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    Given, for each key, a 1D array of left key values and of right key values, return arrays of left and right row positions for each row of the join, where -1 denotes a missing row. Keys are factorized together and combined into a single integer code per row, such that rows are matched without per-row Python work.
+
+    Rows of inner and left joins are in the order of left rows, rows of right joins in the order of right rows, and rows of outer joins in the order of left rows followed by unmatched right rows; where a row has many matches, matches are in the order of the other side.
+
+    Args:
+        how: one of ``JOIN_HOWS``.
+    '''
+    if how not in JOIN_HOWS:
+        raise NotImplementedError(f'no support for join: {how}')
+    if len(left) != len(right) or not len(left):
+        raise RuntimeError('left and right must have the same number of keys, and at least one key')
+
+    count_left = len(left[0])
+    codes = ufunc_unique_and_locations(concat_resolved((left[0], right[0])))[1]
+    for array_left, array_right in zip(left[1:], right[1:]):
+        unique, codes_key = ufunc_unique_and_locations(
+                concat_resolved((array_left, array_right)))
+        # combined codes are renumbered to be less than the count of rows
+        codes = ufunc_unique_and_locations(codes * len(unique) + codes_key)[1]
+
+    codes_left = codes[:count_left]
+    codes_right = codes[count_left:]
+    count = codes.max() + 1 if len(codes) else 0
+
+    if how == 'right':
+        positions_right, positions_left = _join_matches(
+                codes_right, codes_left, count, True)
+        return positions_left, positions_right
+
+    positions_left, positions_right = _join_matches(
+            codes_left, codes_right, count, how != 'inner')
+    if how == 'outer':
+        unmatched = np.flatnonzero(
+                np.bincount(codes_left, minlength=count)[codes_right] == 0)
+        if len(unmatched):
+            positions_left = np.concatenate((positions_left,
+                    np.full(len(unmatched), -1, dtype=DTYPE_INT_DEFAULT)))
+            positions_right = np.concatenate((positions_right, unmatched))
+    return positions_left, positions_right
+
+
+def join_asof_locations(
+        left: np.ndarray,
+        right: np.ndarray,
+        *,
+        left_by: tp.Sequence[np.ndarray] = (),
+        right_by: tp.Sequence[np.ndarray] = (),
+        tolerance: tp.Any = None,
+        ) -> np.ndarray:
+    '''
+    Given 1D arrays of left and right labels (i.e., timestamps), return, for each left label, the position of the last right row with a label at or before that label, or -1 if there is none. If ``left_by`` and ``right_by`` keys are given, only right rows with the same keys are considered; if ``tolerance`` is given, right labels before the left label by more than the tolerance are not considered.
+    '''
+    dtype = resolve_dtype(left.dtype, right.dtype)
+    left = left.astype(dtype, copy=False)
+    right = right.astype(dtype, copy=False)
+
+    if not len(left_by) and (len(right) < 2 or (right[1:] >= right[:-1]).all()):
+        # right labels are sorted and can be searched directly
+        positions = np.searchsorted(right, left, side='right') - 1
+        order = None
+    else:
+        if len(left_by):
+            # factorize labels and keys together, such that a combined code sorts by keys, then by labels
+            count_left = len(left)
+            ranks = ufunc_unique_and_locations(concat_resolved((left, right)))[1]
+            rank_count = ranks.max() + 1 if len(ranks) else 0
+            codes = ufunc_unique_and_locations(
+                    concat_resolved((left_by[0], right_by[0])))[1]
+            for array_left, array_right in zip(left_by[1:], right_by[1:]):
+                unique, codes_key = ufunc_unique_and_locations(
+                        concat_resolved((array_left, array_right)))
+                codes = ufunc_unique_and_locations(
+                        codes * len(unique) + codes_key)[1]
+            codes_left = codes[:count_left]
+            codes_right = codes[count_left:]
+            key_left = codes_left * rank_count + ranks[:count_left]
+            key_right = codes_right * rank_count + ranks[count_left:]
+        else:
+            key_left = left
+            key_right = right
+
+        # a stable sort retains, for equal right labels, the last row as the last position
+        order = np.argsort(key_right, kind=DEFAULT_SORT_KIND)
+        positions = np.searchsorted(key_right[order], key_left, side='right') - 1
+        if len(left_by):
+            found = positions >= 0
+            found[found] = codes_right[order[positions[found]]] == codes_left[found]
+            positions[~found] = -1
+
+    found = positions >= 0
+    if order is not None:
+        positions[found] = order[positions[found]]
+    if tolerance is not None:
+        found[found] = (left[found] - right[positions[found]]) <= tolerance
+        positions[~found] = -1
+    return positions
+
+
 def roll_1d(array: np.ndarray,
             shift: int
             ) -> np.ndarray:
@@ -899,6 +1092,23 @@ def slice_to_ascending_slice(
     return slice(start, stop, -key.step)
 
 
+def positions_to_slice(
+        positions: np.ndarray,
+        ) -> tp.Optional[slice]:
+    '''
+    Given a 1D array of integer positions, return an equivalent slice if the positions are contiguous and ascending (such that selection can be done with a view); otherwise, return None.
+    '''
+    count = len(positions)
+    if count == 0:
+        return None
+    start = int(positions[0])
+    if start < 0 or int(positions[-1]) - start != count - 1:
+        return None
+    if count > 2 and not (positions[1:] - positions[:-1] == 1).all():
+        return None
+    return slice(start, start + count)
+
+
 
 
 
@@ -1012,11 +1222,36 @@ def key_to_datetime_key(
 
 #-------------------------------------------------------------------------------
 
+def _int_to_groups_and_locations(
+        array: np.ndarray,
+        ) -> tp.Optional[tp.Tuple[np.ndarray, np.ndarray]]:
+    '''
+    Factorize a 1D integer array by counting rather than sorting, if the span of its values is no greater than its size; otherwise, return None.
+    '''
+    if array.ndim != 1 or array.dtype.kind not in DTYPE_INT_KIND or not len(array):
+        return None
+    low = array.min()
+    span = int(array.max()) - int(low) + 1
+    if span > len(array):
+        return None
+    offsets = (array - low).astype(DTYPE_INT_DEFAULT)
+    present = np.bincount(offsets, minlength=span) > 0
+    groups = (np.flatnonzero(present) + low).astype(array.dtype)
+    locations = (present.cumsum() - 1)[offsets]
+    return groups, locations
+
+
 def array_to_groups_and_locations(
         array: np.ndarray,
         unique_axis: tp.Optional[int] = 0) -> tp.Tuple[np.ndarray, np.ndarray]:
     '''Locations are index positions for each group.
     '''
+    if array.ndim == 1 and array.dtype.kind != 'O':
+        # the axis argument is not needed, and is much slower, for 1D; object arrays retain the axis argument, which groups them by string representation
+        unique_axis = None
+        post = _int_to_groups_and_locations(array)
+        if post is not None:
+            return post
     try:
         groups, locations = np.unique(
                 array,
@@ -1030,11 +1265,516 @@ def array_to_groups_and_locations(
                 return_inverse=True,
                 axis=unique_axis)
         # groups here are the strings; need to restore to values
-        groups = array[group_index]
+        groups = np.take(array, group_index, axis=unique_axis)
 
     return groups, locations
 
 
+def locations_to_selections(
+        locations: np.ndarray,
+        count: int,
+        ) -> tp.Iterator[tp.Union[slice, np.ndarray]]:
+    '''
+    Given locations (the group position for each element, as returned by ``array_to_groups_and_locations``) and the count of groups, yield, in group order, an iloc selection of the elements of each group. Where the positions of a group are contiguous, a slice is yielded; otherwise, an array of ascending integer positions.
+    '''
+    counts = np.bincount(locations, minlength=count)
+    ends = counts.cumsum()
+    starts = ends - counts
+
+    if len(locations) < 2 or (locations[:-1] <= locations[1:]).all():
+        # already sorted: every group is a contiguous range
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            yield slice(start, end)
+        return
+
+    # a stable sort retains ascending positions within each group
+    order = np.argsort(locations, kind='mergesort')
+    order.flags.writeable = False
+
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        positions = order[start: end]
+        first = int(positions[0])
+        if positions[-1] - first == end - start - 1:
+            yield slice(first, first + end - start)
+        else:
+            yield positions
+
+
+def locations_to_order(
+        locations: np.ndarray,
+        count: int,
+        ) -> tp.Tuple[tp.Optional[np.ndarray], np.ndarray, np.ndarray]:
+    '''
+    Given locations and the count of groups, return the stable order that sorts elements by group (or None if already sorted), the sorted locations, and the count of elements in each group.
+    '''
+    counts = np.bincount(locations, minlength=count)
+    if len(locations) > 1 and (locations[:-1] > locations[1:]).any():
+        order = np.argsort(locations, kind='mergesort')
+        return order, locations[order], counts
+    return None, locations, counts
+
+
+GROUP_REDUCE_FUNCS = ('sum', 'mean', 'min', 'max', 'count', 'std', 'first', 'last')
+
+# functions of an array that have an equivalent group reduction, mapped to the reduction and its skipna
+UFUNC_TO_GROUP_REDUCE: tp.Dict[AnyCallable, tp.Tuple[str, bool]] = {
+        np.sum: ('sum', False),
+        np.nansum: ('sum', True),
+        np.mean: ('mean', False),
+        np.nanmean: ('mean', True),
+        np.min: ('min', False),
+        np.nanmin: ('min', True),
+        np.max: ('max', False),
+        np.nanmax: ('max', True),
+        np.std: ('std', False),
+        np.nanstd: ('std', True),
+        len: ('count', False),
+        }
+
+def group_reduce_supported(dtype: np.dtype, func: str) -> bool:
+    '''
+    Return True if values of ``dtype`` can be reduced by group with ``func``.
+    '''
+    kind: str = dtype.kind
+    if func == 'mean' or func == 'std':
+        if kind in DTYPE_STR_KIND or kind == DTYPE_DATETIME_KIND:
+            return False
+        return func == 'mean' or kind != DTYPE_TIMEDELTA_KIND
+    if func == 'sum':
+        return kind != DTYPE_DATETIME_KIND
+    return True
+
+
+def _group_reduce(
+        array: np.ndarray,
+        starts: np.ndarray,
+        counts: np.ndarray,
+        func: str,
+        ) -> np.ndarray:
+    '''
+    Reduce groups of an array without missing values, where each group is a contiguous, non-empty range of rows beginning at ``starts``.
+    '''
+    if func == 'first':
+        return array[starts]
+    if func == 'last':
+        return array[starts + counts - 1]
+    if func == 'count':
+        if array.ndim == 1:
+            return counts
+        return np.repeat(counts.reshape(-1, 1), array.shape[1], axis=1)
+
+    counts_div = counts if array.ndim == 1 else counts.reshape(-1, 1)
+    kind = array.dtype.kind
+
+    if func == 'min' or func == 'max':
+        if kind in DTYPE_STR_KIND:
+            array = array.astype(DTYPE_OBJECT)
+        ufunc = np.minimum if func == 'min' else np.maximum
+        return ufunc.reduceat(array, starts, axis=0)
+
+    if func == 'sum':
+        if kind in DTYPE_STR_KIND:
+            array = array.astype(DTYPE_OBJECT)
+        elif kind == 'b':
+            array = array.astype(DTYPE_INT_DEFAULT)
+        return np.add.reduceat(array, starts, axis=0)
+
+    if kind in DTYPE_INT_KIND or kind == 'b' or kind == 'O':
+        array = array.astype(DTYPE_FLOAT_DEFAULT)
+    mean = np.add.reduceat(array, starts, axis=0) / counts_div
+    if func == 'mean':
+        return mean
+
+    # std, with zero degrees of freedom, as np.std
+    deviations = np.abs(array - np.repeat(mean, counts, axis=0)) ** 2
+    return np.sqrt(np.add.reduceat(deviations, starts, axis=0) / counts_div)
+
+
+def array_group_reduce(
+        array: np.ndarray,
+        *,
+        locations: np.ndarray,
+        counts: np.ndarray,
+        func: str,
+        skipna: bool,
+        ) -> np.ndarray:
+    '''
+    Reduce, for every group at once, a 1D or 2D array whose rows are sorted by group, returning an array with a row per group.
+
+    Args:
+        locations: the (sorted) group position of each row.
+        counts: the count of rows in each group; no group can be empty.
+        func: one of ``GROUP_REDUCE_FUNCS``.
+        skipna: if True, missing values are excluded; groups that have no values return 0 for sum and count, and NaN otherwise.
+    '''
+    if func not in GROUP_REDUCE_FUNCS:
+        raise NotImplementedError(f'no support for group reduction: {func}')
+    if not group_reduce_supported(array.dtype, func):
+        raise NotImplementedError(f'no support for group reduction {func} of dtype: {array.dtype}')
+
+    if len(counts) == 0:
+        dtype = DTYPE_INT_DEFAULT if func == 'count' else array.dtype
+        return np.empty((0,) + array.shape[1:], dtype=dtype)
+
+    starts = counts.cumsum() - counts
+
+    if not skipna or array.dtype.kind not in DTYPE_NA_KIND:
+        return _group_reduce(array, starts, counts, func)
+
+    isna = isna_array(array)
+    if not isna.any():
+        return _group_reduce(array, starts, counts, func)
+
+    if array.ndim == 2:
+        # as missing values differ by column, reduce columns independently
+        columns = [array_group_reduce(array[:, i],
+                locations=locations,
+                counts=counts,
+                func=func,
+                skipna=skipna) for i in range(array.shape[1])]
+        post = np.empty((len(counts), len(columns)),
+                dtype=resolve_dtype_iter(c.dtype for c in columns))
+        for i, column in enumerate(columns):
+            post[:, i] = column
+        return post
+
+    valid = ~isna
+    counts_valid = np.bincount(locations[valid], minlength=len(counts))
+    if func == 'count':
+        return counts_valid
+
+    found = counts_valid > 0
+    reduced = _group_reduce(array[valid],
+            counts_valid.cumsum()[found] - counts_valid[found],
+            counts_valid[found],
+            func)
+    if found.all():
+        return reduced
+
+    if func == 'sum':
+        fill_value = reduced.dtype.type(0)
+    elif reduced.dtype.kind in DTYPE_NAT_KIND:
+        fill_value = reduced.dtype.type('nat')
+    else:
+        fill_value = np.nan
+    post = np.full(len(counts),
+            fill_value,
+            dtype=resolve_dtype(reduced.dtype, np.array(fill_value).dtype))
+    post[found] = reduced
+    return post
+
+
+WINDOW_REDUCE_FUNCS = ('sum', 'mean', 'min', 'max', 'count', 'std')
+
+def array_window_reduce(
+        array: np.ndarray,
+        *,
+        starts: np.ndarray,
+        stops: np.ndarray,
+        func: str,
+        skipna: bool,
+        ) -> np.ndarray:
+    '''
+    Reduce, for all windows at once, a 1D or 2D array along axis 0, where each window is the range of rows from ``starts`` up to (but not including) ``stops``; returns an array with a row per window. Counts are derived from cumulative sums; all other reductions use only the values within each window.
+
+    Args:
+        func: one of ``WINDOW_REDUCE_FUNCS``.
+        skipna: if True, missing values are excluded; otherwise, windows with missing values return NaN (or NaT). Windows without values return 0 for sum and count, and NaN (or NaT) otherwise.
+    '''
+    if func not in WINDOW_REDUCE_FUNCS:
+        raise NotImplementedError(f'no support for window reduction: {func}')
+
+    kind = array.dtype.kind
+    if kind in DTYPE_STR_KIND:
+        if func != 'count' and func != 'min' and func != 'max':
+            raise NotImplementedError(f'no support for window reduction {func} of dtype: {array.dtype}')
+        array = array.astype(DTYPE_OBJECT)
+    elif kind == 'b' and func != 'min' and func != 'max':
+        array = array.astype(DTYPE_INT_DEFAULT)
+
+    def window_diff(values: np.ndarray) -> np.ndarray:
+        # differences of cumulative counts, where the count before the first row is 0
+        cumulative = np.empty((len(values) + 1,) + values.shape[1:], dtype=DTYPE_INT_DEFAULT)
+        cumulative[0] = 0
+        np.cumsum(values, axis=0, out=cumulative[1:])
+        return cumulative[stops] - cumulative[starts]
+
+    counts = stops - starts
+    if array.ndim == 2:
+        counts = np.repeat(counts.reshape(-1, 1), array.shape[1], axis=1)
+
+    isna = isna_array(array) if kind in DTYPE_NA_KIND else None
+    if isna is not None and not isna.any():
+        isna = None
+
+    missing = None # windows that are missing as they include missing values
+    if isna is not None:
+        if skipna:
+            counts = window_diff(~isna)
+        else:
+            missing = window_diff(isna) > 0
+
+    if func == 'count':
+        return counts
+
+    try:
+        if func == 'min' or func == 'max':
+            post = _array_window_extrema(array, starts, stops, func, isna)
+            empty = counts == 0
+        else:
+            values = array if isna is None else np.where(isna, 0, array)
+            if func != 'sum' and values.dtype.kind == 'O':
+                values = values.astype(DTYPE_FLOAT_DEFAULT)
+            count_inf = None
+            if kind == 'f':
+                isinf = np.isinf(values)
+                if isinf.any():
+                    # infinities do not combine with finite values: count them and exclude them from reductions
+                    values = np.where(isinf, 0, values)
+                    count_inf = (window_diff(isinf & (array > 0)), window_diff(isinf & (array < 0)))
+
+            if func == 'std':
+                post = _array_window_std(values,
+                        None if isna is None else ~isna,
+                        starts,
+                        stops)
+            else:
+                post = _array_window_accumulate(values, starts, stops, np.add)
+                if func == 'mean':
+                    # empty windows are replaced below
+                    post = post / np.maximum(counts, 1)
+
+            if count_inf is not None:
+                post = post.astype(resolve_dtype(post.dtype, DTYPE_FLOAT_DEFAULT))
+                has_pos = count_inf[0] > 0
+                has_neg = count_inf[1] > 0
+                if func == 'std':
+                    post[has_pos | has_neg] = np.nan
+                else:
+                    post[has_pos] = np.inf
+                    post[has_neg] = -np.inf
+                    post[has_pos & has_neg] = np.nan
+
+            empty = counts == 0
+            if func == 'sum':
+                # sums of empty windows are 0
+                if empty.any():
+                    post[empty] = 0
+                empty = None
+    except (TypeError, ValueError) as e:
+        if kind != 'O':
+            raise
+        raise TypeError(f'no support for window reduction {func} of the values of an object array') from e
+
+    if missing is not None:
+        empty = missing if empty is None else (empty | missing)
+    if empty is not None and empty.any():
+        if post.dtype.kind in DTYPE_NAT_KIND:
+            post[empty] = post.dtype.type('nat')
+        else:
+            post = post.astype(resolve_dtype(post.dtype, DTYPE_FLOAT_DEFAULT))
+            post[empty] = np.nan
+    return post
+
+
+def _window_blocks(
+        count: int,
+        starts: np.ndarray,
+        stops: np.ndarray,
+        ) -> tp.Tuple[int, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    '''
+    Following van Herk and Gil-Werman, partition rows into blocks as long as the longest window, such that a window is either within one block or spans two. Returns the block width, the first and last rows of each window (empty windows are given one row), and Boolean arrays of windows within one block that begin at a block's first row, that end at a block's last row, and that do neither.
+    '''
+    width = max(int((stops - starts).max()), 1)
+    starts = np.minimum(starts, count - 1)
+    lasts = np.maximum(stops - 1, starts)
+
+    within = (starts // width) == (lasts // width)
+    at_left = within & (starts % width == 0)
+    at_right = within & ~at_left & (lasts % width == width - 1)
+    inner = within & ~at_left & ~at_right
+    return width, starts, lasts, at_left, at_right, inner
+
+
+def _window_block_pad(values: np.ndarray, width: int) -> np.ndarray:
+    '''
+    Extend rows to a multiple of ``width`` by repeating the last row, and reshape into blocks; extended rows are never in a window.
+    '''
+    count = len(values)
+    count_block = -(-count // width)
+    if count_block * width > count:
+        pad = np.repeat(values[-1:], count_block * width - count, axis=0)
+        values = np.concatenate((values, pad))
+    return values.reshape((count_block, width) + values.shape[1:])
+
+
+def _array_window_accumulate(
+        values: np.ndarray,
+        starts: np.ndarray,
+        stops: np.ndarray,
+        ufunc: np.ufunc,
+        ) -> np.ndarray:
+    '''
+    Reduce each window of rows with ``ufunc``, using only the rows in that window; results for windows without values are undefined. Within each block (see ``_window_blocks``), values are accumulated from the left and from the right, such that a window that spans two blocks is the combination of two accumulations.
+    '''
+    count = len(values)
+    if not count or not len(starts):
+        return np.zeros((len(starts),) + values.shape[1:], dtype=values.dtype)
+
+    width, starts, lasts, at_left, at_right, inner = _window_blocks(count, starts, stops)
+    blocked = _window_block_pad(values, width)
+    shape = (-1,) + values.shape[1:]
+    left = ufunc.accumulate(blocked, axis=1).reshape(shape)
+    right = ufunc.accumulate(blocked[:, ::-1], axis=1)[:, ::-1].reshape(shape)
+
+    post = ufunc(right[starts], left[lasts])
+    post[at_left] = left[lasts[at_left]]
+    post[at_right] = right[starts[at_right]]
+    if inner.any():
+        # reduce pairs of positions; the last row is repeated so that a stop can be the length of the array
+        values = np.concatenate((values, values[count - 1:]))
+        indices = np.empty(inner.sum() * 2, dtype=DTYPE_INT_DEFAULT)
+        indices[0::2] = starts[inner]
+        indices[1::2] = lasts[inner] + 1
+        post[inner] = ufunc.reduceat(values, indices, axis=0)[0::2]
+    return post
+
+
+def _array_window_extrema(
+        array: np.ndarray,
+        starts: np.ndarray,
+        stops: np.ndarray,
+        func: str,
+        isna: tp.Optional[np.ndarray],
+        ) -> np.ndarray:
+    '''
+    Return the minimum or maximum of each window of rows; results for windows without values are undefined.
+    '''
+    values = array
+    if array.dtype.kind in DTYPE_NAT_KIND:
+        # NaT is the minimum integer
+        values = array.view(DTYPE_INT_DEFAULT)
+        info = np.iinfo(DTYPE_INT_DEFAULT)
+        fill = info.max if func == 'min' else info.min
+    else:
+        fill = np.inf if func == 'min' else -np.inf
+    if isna is not None: # missing values are replaced by values that never prevail
+        values = np.where(isna, fill, values)
+
+    post = _array_window_accumulate(values,
+            starts,
+            stops,
+            np.minimum if func == 'min' else np.maximum)
+
+    if array.dtype.kind in DTYPE_NAT_KIND:
+        return post.view(array.dtype)
+    return post
+
+
+def _array_window_std(
+        values: np.ndarray,
+        valid: tp.Optional[np.ndarray],
+        starts: np.ndarray,
+        stops: np.ndarray,
+        ) -> np.ndarray:
+    '''
+    Return the standard deviation (with zero degrees of freedom, as ``np.std``) of each window of rows, where invalid values are excluded; results for windows without values are undefined.
+
+    Windows are partitioned into blocks as in ``_array_window_accumulate``. Sums and sums of squares are accumulated from the left after shifting by the first row of each block, and from the right after shifting by the last row of each block; as these rows are in every window that uses the accumulation, the loss of precision in differences of squares is limited. A window that spans two blocks combines the moments of both accumulations (following Chan, Golub, and LeVeque); windows within a block that use neither accumulation are reduced directly.
+    '''
+    count = len(values)
+    shape_post = (len(starts),) + values.shape[1:]
+    if not count or not len(starts):
+        return np.zeros(shape_post, dtype=DTYPE_FLOAT_DEFAULT)
+
+    values = values.astype(DTYPE_FLOAT_DEFAULT, copy=False)
+    if valid is None:
+        valid = np.full(values.shape, True, dtype=DTYPE_BOOL)
+
+    width, starts, lasts, at_left, at_right, inner = _window_blocks(count, starts, stops)
+    blocked = _window_block_pad(values, width)
+    blocked_valid = _window_block_pad(valid, width)
+    shape = (-1,) + values.shape[1:]
+
+    def moments(reverse: bool) -> tp.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # count, shift, sum of shifted values, and sum of squares of shifted values, accumulated within blocks
+        shift = blocked[:, -1:] if reverse else blocked[:, :1]
+        shifted = np.where(blocked_valid, blocked - shift, 0)
+        parts = [blocked_valid.astype(DTYPE_INT_DEFAULT), shifted, shifted * shifted]
+        if reverse:
+            parts = [np.cumsum(p[:, ::-1], axis=1)[:, ::-1] for p in parts]
+        else:
+            parts = [np.cumsum(p, axis=1) for p in parts]
+        shift = np.repeat(shift, width, axis=1)
+        return parts[0].reshape(shape), shift.reshape(shape), parts[1].reshape(shape), parts[2].reshape(shape)
+
+    def part(
+            moments: tp.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+            rows: np.ndarray,
+            ) -> tp.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # count, mean, and sum of squared deviations from the mean
+        n = moments[0][rows]
+        n_div = np.maximum(n, 1)
+        sums = moments[2][rows]
+        mean = moments[1][rows] + sums / n_div
+        squares = np.maximum(moments[3][rows] - sums * sums / n_div, 0)
+        return n, mean, squares
+
+    n_right, mean_right, squares_right = part(moments(True), starts)
+    n_left, mean_left, squares_left = part(moments(False), lasts)
+
+    n = n_right + n_left
+    delta = mean_left - mean_right
+    combined = (n_right > 0) & (n_left > 0)
+    squares = squares_right + squares_left + np.where(combined,
+            delta * delta * n_right * n_left / np.maximum(n, 1),
+            0)
+
+    squares[at_left] = squares_left[at_left]
+    n[at_left] = n_left[at_left]
+    squares[at_right] = squares_right[at_right]
+    n[at_right] = n_right[at_right]
+
+    if inner.any():
+        # gather the rows of each window and compute deviations from each window's mean
+        lengths = lasts[inner] - starts[inner] + 1
+        offsets = lengths.cumsum() - lengths
+        rows = np.arange(lengths.sum()) - np.repeat(offsets, lengths) + np.repeat(starts[inner], lengths)
+        gathered = np.where(valid[rows], values[rows], 0)
+        n_inner = np.add.reduceat(valid[rows].astype(DTYPE_INT_DEFAULT), offsets, axis=0)
+        mean = np.add.reduceat(gathered, offsets, axis=0) / np.maximum(n_inner, 1)
+        deviations = np.where(valid[rows], gathered - np.repeat(mean, lengths, axis=0), 0)
+        squares[inner] = np.add.reduceat(deviations * deviations, offsets, axis=0)
+        n[inner] = n_inner
+
+    return np.sqrt(squares / np.maximum(n, 1))
+
+
+def array_to_codes(array: np.ndarray) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    Factorize a 1D array, returning an array of unique values in the order of their first appearance, and an array of integer codes giving, for each value, the position of that value in the unique values.
+    '''
+    try:
+        unique, first, inverse = np.unique(array,
+                return_index=True,
+                return_inverse=True)
+    except TypeError:
+        # values are not orderable; collect unique values by hashing
+        mapping: tp.Dict[tp.Hashable, int] = {}
+        codes = np.fromiter((mapping.setdefault(v, len(mapping)) for v in array),
+                count=len(array),
+                dtype=DTYPE_INT_DEFAULT)
+        unique = np.empty(len(mapping), dtype=DTYPE_OBJECT)
+        for i, v in enumerate(mapping):
+            unique[i] = v
+        return unique, codes
+
+    order = np.argsort(first, kind=DEFAULT_SORT_KIND)
+    rank = np.empty(len(order), dtype=DTYPE_INT_DEFAULT)
+    rank[order] = np.arange(len(order))
+    return unique[order], rank[inverse]
+
+
 def isna_element(value: tp.Any) -> bool:
     '''Return Boolean if value is an NA.
     '''
@@ -1710,6 +2450,227 @@ def isin(
     return result
 
 
+#-------------------------------------------------------------------------------
+# binary search on ascending or argsorted arrays
+
+def is_strictly_ascending(array: np.ndarray) -> bool:
+    '''
+    Return True if a 1D array, of a kind that supports binary search, has unique values in ascending order. NaN and NaT values are never ascending.
+    '''
+    if (array.ndim != 1
+            or array.dtype.kind not in DTYPE_SEARCHABLE_KIND
+            or not array.dtype.isnative): # NumPy can misorder values of a non-native byte order
+        return False
+    if len(array) < 2:
+        return True
+    return bool((array[1:] > array[:-1]).all())
+
+
+def is_unique_sortable(array: np.ndarray) -> bool:
+    '''
+    Return True if a 1D array of a non-object dtype has no duplicated values, determined by sorting rather than hashing. As with hashing of NumPy scalars, NaN and NaT values are never duplicates.
+    '''
+    if len(array) < 2:
+        return True
+    array_sorted = np.sort(array, kind=DEFAULT_SORT_KIND)
+    return not (array_sorted[1:] == array_sorted[:-1]).any()
+
+
+def is_regular_ascending(array: np.ndarray) -> bool:
+    '''
+    Return True if a 1D array, of integer, datetime64, or timedelta64 kind, has at least two values that ascend by a constant, positive step. NaT values are never regular.
+    '''
+    if (array.ndim != 1
+            or array.dtype.kind not in DTYPE_REGULAR_KIND
+            or not array.dtype.isnative
+            or len(array) < 2):
+        return False
+    if array.dtype.kind in DTYPE_NAT_KIND:
+        if np.isnat(array[0]): # if ascending, NaT can only be first
+            return False
+        array = array.view(DTYPE_INT_DEFAULT)
+    step = array[1] - array[0]
+    if step <= 0:
+        return False
+    return bool((np.diff(array) == step).all())
+
+
+def regular_label_to_pos(
+        array: np.ndarray,
+        label: tp.Any,
+        ) -> tp.Optional[int]:
+    '''
+    Given an ``array`` for which ``is_regular_ascending`` is True, find the position of ``label`` by arithmetic, returning None if not found.
+    '''
+    if not searchable_element_match(array.dtype, label):
+        return None
+    if array.dtype.kind in DTYPE_NAT_KIND:
+        # compare integer representations in Python to avoid overflow
+        start, second = array[:2].view(DTYPE_INT_DEFAULT).tolist()
+        value = int(label.astype(DTYPE_INT_DEFAULT))
+    else:
+        if isinstance(label, FLOAT_TYPES) and not float(label).is_integer():
+            return None # includes NaN and inf
+        start, second = array[:2].tolist()
+        value = int(label)
+    pos, remainder = divmod(value - start, second - start)
+    if remainder or pos < 0 or pos >= len(array):
+        return None
+    # confirm, as NaT is never equal to NaT
+    if array[pos] != label:
+        return None
+    return int(pos)
+
+
+def regular_positions(
+        array: np.ndarray,
+        key: np.ndarray,
+        ) -> tp.Optional[tp.Tuple[np.ndarray, np.ndarray]]:
+    '''
+    Given an ``array`` for which ``is_regular_ascending`` is True, return the integer positions of all values in ``key`` found by arithmetic, as well as a Boolean array identifying which values were found; positions of values not found are undefined. If ``key`` cannot be compared by integer representation, return None.
+    '''
+    if array.dtype.kind in DTYPE_NAT_KIND:
+        if key.dtype != array.dtype:
+            return None
+        array_int = array.view(DTYPE_INT_DEFAULT)
+        key_int = key.view(DTYPE_INT_DEFAULT)
+    elif key.dtype.kind in DTYPE_INT_KIND and (key.dtype.kind == 'u') == (array.dtype.kind == 'u'):
+        # integers of the same signedness can be widened without changing values
+        dtype = np.uint64 if key.dtype.kind == 'u' else DTYPE_INT_DEFAULT
+        array_int = array.astype(dtype, copy=False)
+        key_int = key.astype(dtype, copy=False)
+    else:
+        return None
+
+    start = array_int[0]
+    pos, remainder = np.divmod(key_int - start, array_int[1] - start)
+    found = (remainder == 0) & (key_int >= start) & (pos < len(array))
+    pos = pos.astype(DTYPE_INT_DEFAULT)
+    pos[~found] = 0
+    # confirm, as values may wrap on subtraction, and NaT is never equal to NaT
+    found &= array[pos] == key
+    return pos, found
+
+
+def searchable_sorter(array: np.ndarray) -> tp.Optional[tp.Tuple[np.ndarray, np.ndarray]]:
+    '''
+    For a 1D array of a kind that supports binary search, return the integer positions that sort it and the sorted array, for use as the ``sorter`` argument to ``searchsorted_positions``; otherwise, return None.
+    '''
+    if (array.ndim != 1
+            or array.dtype.kind not in DTYPE_SEARCHABLE_KIND
+            or not array.dtype.isnative):
+        return None
+    order = np.argsort(array, kind=DEFAULT_SORT_KIND)
+    order.flags.writeable = False
+    array_sorted = array[order]
+    array_sorted.flags.writeable = False
+    return order, array_sorted
+
+
+def searchable_dtype_match(dtype: np.dtype, key_dtype: np.dtype) -> bool:
+    '''
+    Return True if values of ``key_dtype`` can be found in an ascending array of ``dtype`` with a binary search, producing the same result as a hash lookup.
+    '''
+    if not (dtype.isnative and key_dtype.isnative):
+        # NumPy can misorder values of a non-native byte order
+        return False
+    kind: str = dtype.kind
+    if kind in DTYPE_NUMERIC_REAL_KIND:
+        key_kind: str = key_dtype.kind
+        if key_kind not in DTYPE_NUMERIC_REAL_KIND:
+            return False
+        if kind in DTYPE_INT_KIND and key_kind in DTYPE_INT_KIND:
+            # mixing signed and unsigned integers can promote to float64, losing precision
+            return (kind == 'u') == (key_kind == 'u')
+        if kind in DTYPE_INT_KIND:
+            # integers compared to floats are converted to float, which only represents integers up to 2**53 exactly; this is assured for integers of fewer than 64 bits
+            return bool(dtype.itemsize < 8)
+        if key_kind in DTYPE_INT_KIND:
+            return bool(key_dtype.itemsize < 8)
+        return True
+    if kind in DTYPE_NAT_KIND:
+        # units must match, as datetime64 of different units are never hash equal
+        return bool(dtype == key_dtype)
+    return bool(kind == key_dtype.kind)
+
+
+def searchable_element_match(dtype: np.dtype, element: tp.Any) -> bool:
+    '''
+    Element-wise alternative to ``searchable_dtype_match``, used to avoid coercion of elements of incompatible types in a binary search.
+    '''
+    kind = dtype.kind
+    if kind in DTYPE_NUMERIC_REAL_KIND:
+        return isinstance(element, (INT_TYPES, FLOAT_TYPES, BOOL_TYPES))
+    if kind in DTYPE_NAT_KIND:
+        return (isinstance(element, (np.datetime64, np.timedelta64))
+                and element.dtype == dtype)
+    if kind == 'U':
+        return isinstance(element, str)
+    if kind == 'S':
+        return isinstance(element, bytes)
+    return False
+
+
+def searchsorted_positions(
+        array: np.ndarray,
+        key: np.ndarray,
+        sorter: tp.Optional[tp.Tuple[np.ndarray, np.ndarray]] = None,
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    Given an ``array`` that is strictly ascending, or the integer positions that sort it and sorted array as returned by ``searchable_sorter``, return the integer positions of all values in ``key``, as well as a Boolean array identifying which values were found. Positions of values not found are undefined.
+    '''
+    if len(array) == 0:
+        return (np.zeros(len(key), dtype=DTYPE_INT_DEFAULT),
+                np.full(len(key), False, dtype=DTYPE_BOOL))
+
+    array_search = array if sorter is None else sorter[1]
+
+    if len(key) >= SEARCHSORTED_ORDER_KEY_MIN:
+        # binary search of many values is faster when the values are ordered, as memory access becomes sequential
+        key_order = np.argsort(key, kind=DEFAULT_SORT_KIND)
+        pos = np.empty(len(key), dtype=DTYPE_INT_DEFAULT)
+        pos[key_order] = array_search.searchsorted(key[key_order])
+    else:
+        pos = array_search.searchsorted(key)
+
+    # values greater than the last value are given the length; point them to the last position, where they will fail the match below
+    np.minimum(pos, len(array) - 1, out=pos)
+    if sorter is not None:
+        pos = sorter[0][pos]
+
+    found = array[pos] == key
+    if array.dtype.kind in DTYPE_NAN_KIND and key.dtype.kind in DTYPE_NAN_KIND:
+        # NaN sorts last, so a NaN key is positioned at a NaN value, if any
+        isnan = np.isnan(key)
+        if isnan.any():
+            found |= isnan & np.isnan(array[pos])
+    return pos, found
+
+
+def union_sorted(array: np.ndarray, other: np.ndarray) -> np.ndarray:
+    '''
+    Return the union of two strictly ascending 1D arrays of the same dtype, itself strictly ascending. As the concatenation is two ascending runs, a stable sort merges them in linear time.
+    '''
+    post = np.concatenate((array, other))
+    post.sort(kind=DEFAULT_SORT_KIND)
+    if len(post) > 1:
+        unique = np.empty(len(post), dtype=DTYPE_BOOL)
+        unique[0] = True
+        unique[1:] = post[1:] != post[:-1]
+        post = post[unique]
+    return post
+
+
+def intersect_sorted(array: np.ndarray, other: np.ndarray) -> np.ndarray:
+    '''
+    Return the intersection of two strictly ascending 1D arrays of the same dtype, itself strictly ascending, by binary search of the values of the shorter array in the longer.
+    '''
+    if len(other) < len(array):
+        array, other = other, array
+    _, found = searchsorted_positions(other, array)
+    return array[found]
+
+
 #-------------------------------------------------------------------------------
 
 def slices_from_targets(
@@ -1186,6 +1186,199 @@ class FrameFloat_H2D_add_series_partial(PerfTest):
         assert f1.sum().sum() == 2970.0
 
 
+class FrameFloat_fragmented_sum_axis1(PerfTest):
+    '''Row-wise reduction of a frame built one column at a time.
+    '''
+    NUMBER = 10
+
+    @classmethod
+    def sf(cls) -> None:
+        f1 = sf.FrameGO(index=range(1000))
+        for col in range(200):
+            f1[col] = np.arange(1000) * .1
+        post = f1.sum(axis=1)
+        assert post.shape == (1000,)
+
+    @classmethod
+    def pd(cls) -> None:
+        f1 = pd.DataFrame(index=range(1000))
+        for col in range(200):
+            f1[col] = np.arange(1000) * .1
+        post = f1.sum(axis=1)
+        assert post.shape == (1000,)
+
+
+class FrameFloat_pivot(PerfTest):
+    '''Pivot into a table of many cells.
+    '''
+    NUMBER = 5
+    _index = np.random.RandomState(0).randint(0, 1_000, 200_000)
+    _columns = np.random.RandomState(1).randint(0, 100, 200_000)
+    _values = np.random.RandomState(2).rand(200_000)
+
+    @classmethod
+    def sf(cls) -> None:
+        f1 = sf.Frame.from_dict(dict(i=cls._index, c=cls._columns, v=cls._values))
+        post = f1.pivot('i', 'c', 'v', fill_value=0.0)
+        assert post.shape == (1_000, 100)
+
+    @classmethod
+    def pd(cls) -> None:
+        f1 = pd.DataFrame(dict(i=cls._index, c=cls._columns, v=cls._values))
+        post = f1.pivot_table(index='i', columns='c', values='v', aggfunc='sum', fill_value=0.0)
+        assert post.shape == (1_000, 100)
+
+
+class FrameFloat_group_reduce_sum(PerfTest):
+    '''Grouped sum over many groups.
+    '''
+    NUMBER = 5
+    _values = np.random.RandomState(0).rand(200_000, 4)
+    _keys = np.random.RandomState(1).randint(0, 20_000, 200_000)
+
+    @classmethod
+    def sf(cls) -> None:
+        f1 = sf.FrameGO(cls._values)
+        f1[4] = cls._keys
+        post = f1.group_reduce(4, 'sum')
+        assert post.shape[1] == 4
+
+    @classmethod
+    def pd(cls) -> None:
+        f1 = pd.DataFrame(cls._values)
+        f1[4] = cls._keys
+        post = f1.groupby(4).sum()
+        assert post.shape[1] == 4
+
+
+class FrameFloat_window_reduce_mean(PerfTest):
+    '''Rolling mean over many rows and columns.
+    '''
+    NUMBER = 5
+    _values = np.random.RandomState(0).rand(10_000, 500)
+
+    @classmethod
+    def sf(cls) -> None:
+        f1 = sf.Frame(cls._values)
+        post = f1.window_reduce(252, 'mean')
+        assert post.shape == (9_749, 500)
+
+    @classmethod
+    def pd(cls) -> None:
+        f1 = pd.DataFrame(cls._values)
+        post = f1.rolling(252).mean().iloc[251:]
+        assert post.shape == (9_749, 500)
+
+
+class SeriesFloat_expanding_reduce_mean(PerfTest):
+    '''Expanding mean over many values.
+    '''
+    NUMBER = 5
+    _values = np.random.RandomState(0).rand(1_000_000)
+
+    @classmethod
+    def sf(cls) -> None:
+        s1 = sf.Series(cls._values)
+        post = s1.expanding_reduce('mean')
+        assert len(post) == 1_000_000
+
+    @classmethod
+    def pd(cls) -> None:
+        s1 = pd.Series(cls._values)
+        post = s1.expanding().mean()
+        assert len(post) == 1_000_000
+
+
+class FrameFloat_join_left(PerfTest):
+    '''Left join on a composite key.
+    '''
+    NUMBER = 2
+    _keys = np.random.RandomState(0).randint(0, 1_000, (1_000_000, 2))
+    _values = np.random.RandomState(1).rand(1_000_000)
+
+    @classmethod
+    def sf(cls) -> None:
+        f1 = sf.Frame.from_dict(dict(k1=cls._keys[:, 0], k2=cls._keys[:, 1], v=cls._values))
+        f2 = sf.Frame.from_dict(dict(k1=cls._keys[:100_000, 1], k2=cls._keys[:100_000, 0], w=cls._values[:100_000]))
+        post = f1.join(f2, how='left', left_columns=['k1', 'k2'], right_columns=['k1', 'k2'])
+        assert post.shape[1] == 4
+
+    @classmethod
+    def pd(cls) -> None:
+        f1 = pd.DataFrame(dict(k1=cls._keys[:, 0], k2=cls._keys[:, 1], v=cls._values))
+        f2 = pd.DataFrame(dict(k1=cls._keys[:100_000, 1], k2=cls._keys[:100_000, 0], w=cls._values[:100_000]))
+        post = f1.merge(f2, how='left', on=['k1', 'k2'])
+        assert post.shape[1] == 4
+
+
+class FrameFloat_join_asof(PerfTest):
+    '''As-of join of sorted nanosecond indices.
+    '''
+    NUMBER = 2
+    _labels_left = np.datetime64('2020-01-01', 'ns') + np.arange(1_000_000) * 1_000
+    _labels_right = np.datetime64('2020-01-01', 'ns') + np.arange(0, 1_000_000_000, 7_000) + 3
+    _values = np.random.RandomState(0).rand(len(_labels_right))
+
+    @classmethod
+    def sf(cls) -> None:
+        f1 = sf.Frame.from_dict(dict(v=np.arange(len(cls._labels_left))),
+                index=sf.IndexNanosecond(cls._labels_left))
+        f2 = sf.Frame.from_dict(dict(w=cls._values),
+                index=sf.IndexNanosecond(cls._labels_right))
+        post = f1.join_asof(f2)
+        assert post.shape == (1_000_000, 2)
+
+    @classmethod
+    def pd(cls) -> None:
+        f1 = pd.DataFrame(dict(v=np.arange(len(cls._labels_left))), index=cls._labels_left)
+        f2 = pd.DataFrame(dict(w=cls._values), index=cls._labels_right)
+        post = pd.merge_asof(f1, f2, left_index=True, right_index=True)
+        assert post.shape == (1_000_000, 2)
+
+
+class FrameMixed_from_concat_daily(PerfTest):
+    '''Vertical concatenation of many small frames with the same columns.
+    '''
+    NUMBER = 5
+    _values = np.random.RandomState(0).rand(5_000, 3, 4)
+
+    @classmethod
+    def sf(cls) -> None:
+        frames = [sf.Frame.from_dict(
+                dict(a=v[:, 0], b=v[:, 1], c=v[:, 2] > 0.5, d=v[:, 3]),
+                index=(i * 3, i * 3 + 1, i * 3 + 2))
+                for i, v in enumerate(cls._values)]
+        post = sf.Frame.from_concat(frames)
+        assert post.shape == (15_000, 4)
+
+    @classmethod
+    def pd(cls) -> None:
+        frames = [pd.DataFrame(
+                dict(a=v[:, 0], b=v[:, 1], c=v[:, 2] > 0.5, d=v[:, 3]),
+                index=(i * 3, i * 3 + 1, i * 3 + 2))
+                for i, v in enumerate(cls._values)]
+        post = pd.concat(frames)
+        assert post.shape == (15_000, 4)
+
+
+class FrameMixed_from_records_tuples(PerfTest):
+    '''Records of Python values with no dtypes given.
+    '''
+    NUMBER = 5
+    _records = [(i, i * 0.5, str(i % 100), bool(i % 2), None if i % 10 else 'x')
+            for i in range(100_000)]
+
+    @classmethod
+    def sf(cls) -> None:
+        post = sf.Frame.from_records(cls._records)
+        assert post.shape == (100_000, 5)
+
+    @classmethod
+    def pd(cls) -> None:
+        post = pd.DataFrame.from_records(cls._records)
+        assert post.shape == (100_000, 5)
+
+
 class FrameObj_isin(PerfTest):
     '''isin with objects.
     Will noticeably underperform pandas due to pandas' use of C at a constant rate
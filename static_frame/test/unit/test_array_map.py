@@ -0,0 +1,131 @@
+
+import unittest
+import numpy as np
+
+from static_frame import Index
+from static_frame import IndexGO
+from static_frame import IndexDate
+
+from static_frame.core.array_map import ArrayMap
+from static_frame.core.array_map import ARRAY_MAP_SIZE_MIN
+
+from static_frame.test.test_case import TestCase
+
+
+class TestUnit(TestCase):
+
+    def test_array_map_init_a(self) -> None:
+        labels = np.array([30, -4, 2**40, 0, 7])
+        am = ArrayMap(labels)
+        self.assertEqual(len(am), 5)
+        self.assertEqual(am._table.dtype, np.int32)
+        self.assertEqual(len(am._table), 16)
+        self.assertEqual(sorted(am._table[am._table >= 0].tolist()), [0, 1, 2, 3, 4])
+
+    def test_array_map_get_a(self) -> None:
+        labels = np.array([30, -4, 2**40, 0, 7])
+        am = ArrayMap(labels)
+
+        self.assertEqual([am[x] for x in labels], [0, 1, 2, 3, 4])
+        self.assertEqual(am.get(7), 4)
+        self.assertEqual(am.get(7.0), 4)
+        self.assertEqual(am.get(False), 3)
+        self.assertEqual(am.get(7.5), None)
+        self.assertEqual(am.get(np.nan), None)
+        self.assertEqual(am.get('7'), None)
+        self.assertEqual(am.get(2**70), None)
+        self.assertEqual(am.get(8, -1), -1)
+
+        self.assertTrue(-4 in am)
+        self.assertFalse(4 in am)
+
+        with self.assertRaises(KeyError):
+            am[31]
+
+    def test_array_map_get_b(self) -> None:
+        labels = np.array([2**64 - 1, 3], dtype=np.uint64)
+        am = ArrayMap(labels)
+        self.assertEqual(am.get(-1), None)
+        self.assertEqual(am.get(2**64 - 1), 0)
+
+        labels = np.array([-1, 5], dtype=np.int8)
+        am = ArrayMap(labels)
+        self.assertEqual(am.get(-1), 0)
+        self.assertEqual(am.get(255), None)
+
+    def test_array_map_get_c(self) -> None:
+        labels = np.array(['2020-01-03', 'NaT', '2019-12-31'], dtype='datetime64[D]')
+        am = ArrayMap(labels)
+        self.assertEqual(am.get(np.datetime64('2019-12-31')), 2)
+        # as with a dictionary of NumPy scalars, different units do not match
+        self.assertEqual(am.get(np.datetime64('2019-12-31T00', 'h')), None)
+        # NaT is never equal to NaT
+        self.assertEqual(am.get(np.datetime64('NaT', 'D')), None)
+
+    def test_array_map_get_positions_a(self) -> None:
+        labels = np.arange(1000) * 3 - 1500
+        np.random.seed(0)
+        np.random.shuffle(labels)
+        am = ArrayMap(labels)
+
+        key = labels[[999, 0, 500, 3]]
+        post = am.get_positions(key)
+        assert post is not None
+        pos, found = post
+        self.assertEqual(pos.tolist(), [999, 0, 500, 3])
+        self.assertTrue(found.all())
+
+        post = am.get_positions(np.array([labels[10], 1, -1500], dtype=np.int16))
+        assert post is not None
+        pos, found = post
+        self.assertEqual(found.tolist(), [True, False, True])
+
+        self.assertEqual(am.get_positions(np.array([1.0])), None)
+        self.assertEqual(am.get_positions(np.array([1], dtype=np.uint8)), None)
+
+    def test_array_map_get_positions_b(self) -> None:
+        labels = np.array(['2020-01-03', 'NaT', '2019-12-31'], dtype='datetime64[D]')
+        am = ArrayMap(labels)
+        post = am.get_positions(labels[[2, 1, 0]])
+        assert post is not None
+        pos, found = post
+        self.assertEqual(found.tolist(), [True, False, True])
+        self.assertEqual(pos[found].tolist(), [2, 0])
+
+        self.assertEqual(am.get_positions(labels.astype('datetime64[h]')), None)
+
+    def test_array_map_index_a(self) -> None:
+        labels = np.arange(ARRAY_MAP_SIZE_MIN)[::-1] * 2
+        index = Index(labels)
+        self.assertIs(index._map, None)
+
+        self.assertEqual(index.loc_to_iloc(0), ARRAY_MAP_SIZE_MIN - 1)
+        self.assertTrue(isinstance(index._map, ArrayMap))
+        self.assertTrue(2 in index)
+        self.assertFalse(3 in index)
+
+        # no sorter is necessary for array lookups
+        post = index.loc_to_iloc(np.array([4, 2, 0]))
+        assert isinstance(post, np.ndarray)
+        self.assertEqual(post.tolist(), [ARRAY_MAP_SIZE_MIN - 3, ARRAY_MAP_SIZE_MIN - 2, ARRAY_MAP_SIZE_MIN - 1])
+        self.assertIs(index._sorter, None)
+        self.assertEqual(np.asarray(index.loc_to_iloc([2, 0])).tolist(), [ARRAY_MAP_SIZE_MIN - 2, ARRAY_MAP_SIZE_MIN - 1])
+
+        with self.assertRaises(KeyError):
+            index.loc_to_iloc(np.array([4, 3]))
+
+        # grow-only indices use a dictionary
+        index_go = IndexGO(index)
+        self.assertTrue(2 in index_go)
+        self.assertTrue(isinstance(index_go._map, dict))
+
+    def test_array_map_index_b(self) -> None:
+        labels = np.arange(ARRAY_MAP_SIZE_MIN).astype('datetime64[D]')[::-1]
+        index = IndexDate(labels)
+        self.assertTrue('1970-01-02' in index)
+        self.assertTrue(isinstance(index._map, ArrayMap))
+        self.assertEqual(index.loc_to_iloc(np.datetime64('1970-01-01')), ARRAY_MAP_SIZE_MIN - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import typing as tp
 
 import numpy as np
 
@@ -7,6 +8,10 @@ from static_frame.core.container_util import is_static
 from static_frame.core.container_util import index_from_optional_constructor
 from static_frame.core.container_util import matmul
 from static_frame.core.container_util import key_to_ascending_key
+from static_frame.core.container_util import axis_window_bounds
+from static_frame.core.container_util import axis_window_items
+from static_frame.core.container_util import arrays_from_records
+from static_frame.core.container_util import array_from_value_iter
 
 from static_frame import Series
 from static_frame import Frame
@@ -268,5 +273,88 @@ class TestUnit(TestCase):
         f2 = key_to_ascending_key(f1, f1.shape[1])
         self.assertEqual(f2.columns.values.tolist(), ['a', 'b']) # type: ignore
 
+    def test_axis_window_bounds_a(self) -> None:
+        s1 = Series(range(7), index=tuple('abcdefg'))
+
+        for size, step, window_sized, label_shift, start_shift, size_increment in (
+                (3, 1, True, 0, 0, 0),
+                (3, 2, False, -1, -2, 0),
+                (2, 0, True, 1, 1, 0),
+                (9, 1, False, 0, 0, 0),
+                (1, 3, True, 0, -4, 0),
+                (1, 0, True, 0, 0, 1),
+                (2, 1, False, 0, -1, 2),
+                (5, 1, True, 0, 0, -2),
+                ):
+            starts, stops, label_ilocs = axis_window_bounds(count=len(s1),
+                    size=size,
+                    step=step,
+                    window_sized=window_sized,
+                    label_shift=label_shift,
+                    start_shift=start_shift,
+                    size_increment=size_increment)
+            post = [(s1.index.values[i], list(range(start, stop)))
+                    for start, stop, i in zip(starts, stops, label_ilocs)]
+            expected = [(label, window.tolist()) for label, window in axis_window_items(
+                    source=s1,
+                    size=size,
+                    step=step,
+                    window_sized=window_sized,
+                    label_shift=label_shift,
+                    start_shift=start_shift,
+                    size_increment=size_increment,
+                    as_array=True)]
+            self.assertEqual(post, expected)
+
+        with self.assertRaises(RuntimeError):
+            axis_window_bounds(count=3, size=0)
+        with self.assertRaises(RuntimeError):
+            axis_window_bounds(count=3, size=1, step=-1)
+    def test_arrays_from_records_a(self) -> None:
+        records = [
+                (1, True, 'a', b'x', None),
+                (2, 3, 'bb', b'yy', 1.5),
+                (1.5, False, 'ccc', 1, 2),
+                (2 ** 61, 0, 'd', b'z', 'e'),
+                (0.25, 1, 'e', b'z', 3),
+                ]
+        get_value_iter = lambda key: (r[key] for r in records)
+
+        for chunk_size in range(1, 6):
+            post = list(arrays_from_records(records,
+                    keys=range(5),
+                    get_chunk_columns=lambda chunk: list(zip(*chunk)),
+                    get_value_iter=get_value_iter,
+                    get_col_dtype=None,
+                    row_count=len(records),
+                    chunk_size=chunk_size,
+                    ))
+            for key, array in enumerate(post):
+                expected = array_from_value_iter(key=key,
+                        idx=key,
+                        get_value_iter=get_value_iter,
+                        get_col_dtype=None,
+                        row_count=len(records),
+                        )
+                self.assertEqual(array.dtype, expected.dtype)
+                self.assertEqual(array.tolist(), expected.tolist())
+                self.assertEqual([type(v) for v in array.tolist()],
+                        [type(v) for v in expected.tolist()])
+                self.assertFalse(array.flags.writeable)
+
+    def test_arrays_from_records_b(self) -> None:
+        records = [(1, 'a'), (2, 'b'), (3.5, 'c')]
+        post = list(arrays_from_records(records,
+                keys=range(2),
+                get_chunk_columns=lambda chunk: list(zip(*chunk)),
+                get_value_iter=lambda key: (r[tp.cast(int, key)] for r in records),
+                get_col_dtype=(np.int16, 'U2').__getitem__,
+                row_count=len(records),
+                chunk_size=2,
+                ))
+        self.assertEqual([a.dtype for a in post], [np.dtype(np.int16), np.dtype('<U2')])
+        self.assertEqual(post[0].tolist(), [1, 2, 3])
+
+
 if __name__ == '__main__':
     unittest.main()
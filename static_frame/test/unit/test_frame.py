@@ -20,6 +20,7 @@ from static_frame import IndexHierarchy
 from static_frame import IndexHierarchyGO
 from static_frame import IndexYearMonth
 from static_frame import IndexYearGO
+from static_frame import IndexSecond
 
 from static_frame import Series
 from static_frame import Frame
@@ -41,6 +42,7 @@ from static_frame.test.test_case import skip_win
 from static_frame.test.test_case import temp_file
 from static_frame.core.exception import ErrorInitFrame
 from static_frame.core.exception import AxisInvalid
+from static_frame.core.exception import ErrorInitIndex
 
 nan = np.nan
 
@@ -1220,6 +1222,21 @@ class TestUnit(TestCase):
                 ((('A', 1), (('x', 1), ('y', 30))), (('A', 2), (('x', 2), ('y', 50))), (('B', 1), (('x', 'a'), ('y', 'b'))), (('B', 2), (('x', False), ('y', True))), (('C', 1), (('x', 3), ('y', 3))), (('C', 2), (('x', False), ('y', False))))
                 )
 
+    def test_frame_setitem_k(self) -> None:
+
+        f1 = FrameGO(index=('x', 'y', 'z'))
+        s1 = Series((1, 2, 3), index=('x', 'y', 'z'))
+        s2 = Series((30, 10), index=('z', 'x'))
+
+        for i in range(10):
+            f1[i] = s1 if i % 2 else s2
+
+        # aligned values are not reindexed
+        self.assertIs(f1._blocks._blocks[1], s1.values)
+        self.assertEqual(f1.columns.values.tolist(), list(range(10)))
+        self.assertEqual(f1[0].fillna(0).values.tolist(), [10, 0, 30])
+        self.assertEqual(f1[9].values.tolist(), [1, 2, 3])
+
     #---------------------------------------------------------------------------
 
     def test_frame_extend_items_a(self) -> None:
@@ -3025,6 +3042,24 @@ class TestUnit(TestCase):
         self.assertEqual(post.to_pairs(0),
             ((0, ((0, True), (1, True), (2, True))),))
 
+    def test_frame_binary_operator_j(self) -> None:
+
+        f1 = Frame.from_dict(dict(a=(1, 2), b=(3, 4)), index=('x', 'y'))
+        f2 = Frame.from_dict(dict(a=(10, 20), b=(30, 40)), index=('x', 'y'))
+
+        # aligned frames are not reindexed, and share indices with the result
+        post = f1 + f2
+        self.assertIs(post.index, f1.index)
+        self.assertIs(post.columns, f1.columns)
+        self.assertEqual(post.to_pairs(0),
+                (('a', (('x', 11), ('y', 22))), ('b', (('x', 33), ('y', 44)))))
+
+        f3 = Frame.from_dict(dict(b=(30, 40), c=(1, 1)), index=('y', 'z'))
+        post = f1 + f3
+        self.assertEqual(post.columns.values.tolist(), ['a', 'b', 'c'])
+        self.assertEqual(post.index.values.tolist(), ['x', 'y', 'z'])
+        self.assertEqual(post['b'].values.tolist()[1], 34)
+
 
     def test_frame_isin_a(self) -> None:
         # reindex both axis
@@ -6028,6 +6063,28 @@ class TestUnit(TestCase):
         self.assertEqual((0,),  f5.index.shape)
         self.assertEqual('f5',  f5.name)
 
+    def test_frame_from_concat_y(self) -> None:
+        columns = IndexYearMonth(('2020-01', '2020-02', '2020-03'), name='foo')
+        frames = [Frame.from_records(((i, i * 0.5, str(i)),),
+                columns=columns,
+                index=(f'r{i}',))
+                for i in range(4)]
+
+        # identical columns are retained, and blocks are concatenated without realignment
+        f1 = Frame.from_concat(frames)
+        self.assertIs(f1.columns, columns)
+        self.assertEqual(f1.index.values.tolist(), ['r0', 'r1', 'r2', 'r3'])
+        self.assertEqual(f1.dtypes.values.tolist(),
+                [np.dtype(int), np.dtype(float), np.dtype('<U1')])
+        self.assertEqual(f1.iloc[:, 1].values.tolist(), [0.0, 0.5, 1.0, 1.5])
+
+        # blocks of different types are resolved
+        f2 = Frame.from_concat((frames[0], frames[1].astype(object)))
+        self.assertEqual(f2.dtypes.values.tolist(), [np.dtype(object)] * 3)
+
+        with self.assertRaises(ErrorInitFrame):
+            Frame.from_concat((frames[0], frames[0]))
+
 
     #---------------------------------------------------------------------------
 
@@ -6404,6 +6461,38 @@ class TestUnit(TestCase):
                 )
 
 
+    def test_frame_from_records_q(self) -> None:
+        # values that require promotion across row chunks
+        records = ([(i, True, 'a', i) for i in range(2000)]
+                + [(0.5, 3, 'bcd', None)]
+                + [(i, False, 'e', i) for i in range(2000)]
+                )
+        f1 = sf.Frame.from_records(records, columns=('a', 'b', 'c', 'd'))
+        self.assertEqual(f1.shape, (4001, 4))
+        self.assertEqual(f1.dtypes.values.tolist(),
+                [np.dtype(float), np.dtype(int), np.dtype('<U3'), np.dtype(object)])
+        self.assertEqual(f1.iloc[1999:2002].to_pairs(0),
+                (('a', ((1999, 1999.0), (2000, 0.5), (2001, 0.0))), ('b', ((1999, 1), (2000, 3), (2001, 0))), ('c', ((1999, 'a'), (2000, 'bcd'), (2001, 'e'))), ('d', ((1999, 1999), (2000, None), (2001, 0))))
+                )
+        self.assertEqual(f1['d'].values[:3].tolist(), [0, 1, 2])
+
+        # str and numbers in different chunks resolve to object
+        f2 = sf.Frame.from_records([(i,) for i in range(2000)] + [('x',)])
+        self.assertEqual(f2.dtypes.values.tolist(), [np.dtype(object)])
+        self.assertEqual(f2[0].values[[0, -1]].tolist(), [0, 'x'])
+
+    def test_frame_from_records_r(self) -> None:
+        records = [(i % 100, str(i)) for i in range(3000)]
+        f1 = sf.Frame.from_records(records, dtypes=(np.int8, str))
+        self.assertEqual(f1.dtypes.values.tolist(), [np.dtype(np.int8), np.dtype('<U4')])
+        self.assertEqual(f1.iloc[-1].values.tolist(), [99, '2999'])
+
+        with self.assertRaises(ValueError):
+            sf.Frame.from_records([(1.5,)] * 2000 + [(np.nan,)], dtypes=(int,))
+
+        with self.assertRaises(IndexError):
+            sf.Frame.from_records([(1, 2), (3,)])
+
     #---------------------------------------------------------------------------
 
     def test_frame_from_dict_records_a(self) -> None:
@@ -6481,6 +6570,16 @@ class TestUnit(TestCase):
                 )
 
 
+    def test_frame_from_dict_records_i(self) -> None:
+        records = [dict(a=i, b=str(i)) for i in range(2000)] + [dict(a=0.5, c=True)]
+        f1 = Frame.from_dict_records(records, fill_value=None)
+        self.assertEqual(f1.columns.values.tolist(), ['a', 'b', 'c'])
+        self.assertEqual(f1.dtypes.values.tolist(),
+                [np.dtype(float), np.dtype(object), np.dtype(object)])
+        self.assertEqual(f1.iloc[-2:].to_pairs(0),
+                (('a', ((1999, 1999.0), (2000, 0.5))), ('b', ((1999, '1999'), (2000, None))), ('c', ((1999, None), (2000, True))))
+                )
+
     #---------------------------------------------------------------------------
     def test_frame_from_json_a(self) -> None:
 
@@ -7760,6 +7859,336 @@ class TestUnit(TestCase):
             # cannot create a pivot Frame from a field (q) that is not a column
             _ = f2.pivot('q')
 
+    def test_frame_pivot_n(self) -> None:
+
+        f1 = Frame.from_records(
+                (('a', 'x', 1, 1.0),
+                ('a', 'y', 2, 2.0),
+                ('b', 'x', 3, 3.0),
+                ('a', 'x', 4, np.nan),
+                ('c', 'y', 5, 5.0)),
+                columns=('i', 'c', 'p', 'q'))
+
+        # with all cells present, reductions retain their types
+        post1 = f1.pivot('i', data_fields=('p', 'q'))
+        self.assertEqual(post1.dtypes.values.tolist(),
+                [np.dtype(int), np.dtype(float)])
+        self.assertEqual(post1.to_pairs(0),
+                (('p', (('a', 7), ('b', 3), ('c', 5))), ('q', (('a', 3.0), ('b', 3.0), ('c', 5.0))))
+                )
+
+        # missing cells take the fill value
+        post2 = f1.pivot('i', 'c', 'q', fill_value=-1.0)
+        self.assertEqual(post2.dtypes.values.tolist(), [np.dtype(float)] * 2)
+        self.assertEqual(post2.to_pairs(0),
+                (('x', (('a', 1.0), ('b', 3.0), ('c', -1.0))), ('y', (('a', 2.0), ('b', -1.0), ('c', 5.0))))
+                )
+        post3 = f1.pivot('i', 'c', 'p')
+        self.assertEqual(post3.loc['b', 'y'], None)
+
+        # functions without an equivalent group reduction are applied per cell
+        post4 = f1.pivot('i', 'c', 'p',
+                func={'max': np.max, 'median': np.median, 'len': len},
+                fill_value=0)
+        self.assertEqual(post4.columns.values.tolist(),
+                [['x', 'max'], ['x', 'median'], ['x', 'len'], ['y', 'max'], ['y', 'median'], ['y', 'len']])
+        self.assertEqual(post4.loc['a'].values.tolist(), [4.0, 2.5, 2.0, 2.0, 2.0, 1.0])
+        self.assertEqual(post4.loc['c'].values.tolist(), [0.0, 0.0, 0.0, 5.0, 5.0, 1.0])
+
+        post5 = f1.pivot('i', 'c', 'q', func=lambda a: a[-1])
+        self.assertTrue(np.isnan(post5.loc['a', 'x']))
+
+    #---------------------------------------------------------------------------
+
+    def test_frame_group_reduce_a(self) -> None:
+
+        f1 = Frame.from_records(
+                (('a', 1, 2.0, True),
+                ('b', 2, np.nan, False),
+                ('a', 3, 4.0, False),
+                ('c', 1, 5.0, True)),
+                columns=('k', 'x', 'y', 'z'))
+
+        f2 = f1.group_reduce('k')
+        self.assertEqual(f2.index.name, 'k')
+        self.assertEqual(f2.columns.values.tolist(), ['x', 'y', 'z'])
+        self.assertEqual(f2.to_pairs(0),
+                (('x', (('a', 4), ('b', 2), ('c', 1))), ('y', (('a', 6.0), ('b', 0.0), ('c', 5.0))), ('z', (('a', 1), ('b', 0), ('c', 1))))
+                )
+
+        # matches the equivalent reduction of iter_group
+        for func in ('sum', 'mean', 'min', 'max', 'std'):
+            f3 = f1.group_reduce('k', func)
+            post = f1.iter_group('k').apply(
+                    lambda f: getattr(f['y'], func)())
+            self.assertEqual(f3['y'].fillna(-1).to_pairs(), post.fillna(-1).to_pairs())
+
+        self.assertEqual(f1.group_reduce('k', 'count')['y'].to_pairs(),
+                (('a', 2), ('b', 0), ('c', 1)))
+        self.assertEqual(f1.group_reduce('k', 'last')['x'].to_pairs(),
+                (('a', 3), ('b', 2), ('c', 1)))
+        self.assertTrue(np.isnan(f1.group_reduce('k', 'sum', skipna=False).loc['b', 'y']))
+
+    def test_frame_group_reduce_b(self) -> None:
+
+        f1 = FrameGO.from_records(
+                (('a', 1, 2.0, True),
+                ('b', 2, 3.0, False),
+                ('a', 3, 4.0, False),
+                ('a', 1, 5.0, True)),
+                columns=('k', 'x', 'y', 'z'))
+
+        f2 = f1.group_reduce(['k', 'x'], 'max')
+        self.assertEqual(f2.__class__, FrameGO)
+        self.assertEqual(f2.index.name, ('k', 'x'))
+        self.assertEqual(f2.to_pairs(0),
+                (('y', ((('a', 1), 5.0), (('a', 3), 4.0), (('b', 2), 3.0))), ('z', ((('a', 1), True), (('a', 3), False), (('b', 2), False))))
+                )
+
+        # group columns by values in rows
+        f3 = f1.T.group_reduce('k', 'first', axis=1)
+        self.assertEqual(f3.columns.values.tolist(), ['a', 'b'])
+        self.assertEqual(f3.to_pairs(0),
+                (('a', (('x', 1), ('y', 2.0), ('z', True))), ('b', (('x', 2), ('y', 3.0), ('z', False))))
+                )
+
+        with self.assertRaises(AxisInvalid):
+            f1.group_reduce('k', axis=2)
+
+    def test_frame_group_reduce_c(self) -> None:
+
+        f1 = Frame.from_dict(dict(
+                k=('a', 'b', 'a'),
+                s=('x', 'y', 'z'),
+                d=np.array(('2020-01-01', '2020-01-02', '2020-01-05'), dtype='datetime64[D]'),
+                v=(1.0, 2.0, 4.0)))
+
+        self.assertEqual(f1.group_reduce('k', 'max').to_pairs(0),
+                (('s', (('a', 'z'), ('b', 'y'))), ('d', (('a', np.datetime64('2020-01-05')), ('b', np.datetime64('2020-01-02')))), ('v', (('a', 4.0), ('b', 2.0))))
+                )
+        self.assertEqual(f1.drop['d'].group_reduce('k', 'sum')['s'].values.tolist(), ['xz', 'y'])
+
+        # reductions unsupported by a column's dtype raise, naming that column
+        with self.assertRaises(NotImplementedError) as cm:
+            f1.group_reduce('k', 'mean')
+        self.assertIn("'s'", str(cm.exception))
+        with self.assertRaises(NotImplementedError) as cm:
+            f1.drop['s'].group_reduce('k', 'sum')
+        self.assertIn("'d'", str(cm.exception))
+        with self.assertRaises(NotImplementedError):
+            f1.sort_values('k').set_index_hierarchy(('k', 'v'), drop=True).group_labels_reduce(0, 'std')
+
+        self.assertEqual(f1[['k', 'v']].group_reduce('k', 'mean').to_pairs(0),
+                (('v', (('a', 2.5), ('b', 2.0))),)
+                )
+
+    def test_frame_group_labels_reduce_a(self) -> None:
+
+        index = IndexHierarchy.from_product(('a', 'b'), (1, 2, 3))
+        f1 = Frame.from_dict(
+                dict(x=(1, 2, 3, 4, 5, 6), y=(1.0, np.nan, 3.0, 4.0, 5.0, 6.0)),
+                index=index)
+
+        self.assertEqual(f1.group_labels_reduce(0).to_pairs(0),
+                (('x', (('a', 6), ('b', 15))), ('y', (('a', 4.0), ('b', 15.0))))
+                )
+        self.assertEqual(f1.group_labels_reduce(1, 'mean').to_pairs(0),
+                (('x', ((1, 2.5), (2, 3.5), (3, 4.5))), ('y', ((1, 2.5), (2, 5.0), (3, 4.5))))
+                )
+
+        f2 = f1.T.group_labels_reduce(0, 'count', axis=1)
+        self.assertEqual(f2.to_pairs(0),
+                (('a', (('x', 3), ('y', 2))), ('b', (('x', 3), ('y', 3))))
+                )
+
+
+
+    def test_frame_window_reduce_a(self) -> None:
+
+        f1 = FrameGO.from_dict(
+                dict(x=(1, 2, 3, 4, 5, 6), y=(1.0, np.nan, 3.0, 4.0, 5.0, 6.0), z=tuple('abcdef')),
+                index=self.get_letters(6),
+                name='foo')
+
+        f2 = f1[['x', 'y']].window_reduce(3, 'mean', step=2)
+        self.assertEqual(f2.name, 'foo')
+        self.assertEqual(f2.to_pairs(0),
+                (('x', (('c', 2.0), ('e', 4.0))), ('y', (('c', 2.0), ('e', 4.0))))
+                )
+        f3 = f1.window_reduce(2, 'max', label_shift=-1)
+        self.assertEqual(f3['z'].values.tolist(), ['b', 'c', 'd', 'e', 'f'])
+        self.assertEqual(f3.index.values.tolist(), ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(f3.__class__, FrameGO)
+
+        f4 = f1[['x', 'y']].window_reduce(2, 'sum', axis=1, window_sized=False, start_shift=-1)
+        self.assertEqual(f4.to_pairs(0),
+                (('x', (('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5), ('f', 6))),
+                ('y', (('a', 2.0), ('b', 2.0), ('c', 6.0), ('d', 8.0), ('e', 10.0), ('f', 12.0))))
+                )
+
+        f5 = f1[['x', 'y']].window_reduce(4, 'std')
+        for label in ('x', 'y'):
+            s1 = f1[label].iter_window(size=4).apply(lambda s: s.std())
+            self.assertTrue(np.allclose(f5[label].values, s1.values))
+
+        with self.assertRaises(AxisInvalid):
+            f1.window_reduce(2, axis=2)
+
+
+    def test_frame_expanding_reduce_a(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(x=(1, 2, 3, 4), y=(1.0, np.nan, 3.0, 4.0)),
+                index=self.get_letters(4))
+
+        self.assertEqual(f1.expanding_reduce('mean').to_pairs(0),
+                (('x', (('a', 1.0), ('b', 1.5), ('c', 2.0), ('d', 2.5))),
+                ('y', (('a', 1.0), ('b', 1.0), ('c', 2.0), ('d', 8 / 3))))
+                )
+        self.assertEqual(f1.expanding_reduce('count', size=2).to_pairs(0),
+                (('x', (('b', 2), ('c', 3), ('d', 4))), ('y', (('b', 1), ('c', 2), ('d', 3))))
+                )
+        self.assertEqual(f1.expanding_reduce('max', axis=1).to_pairs(0),
+                (('x', (('a', 1.0), ('b', 2.0), ('c', 3.0), ('d', 4.0))),
+                ('y', (('a', 1.0), ('b', 2.0), ('c', 3.0), ('d', 4.0))))
+                )
+
+
+    def test_frame_join_a(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(a=(1, 2, 2, 3), b=('x', 'y', 'z', 'w')),
+                index=tuple('pqrs'))
+        f2 = Frame.from_dict(
+                dict(a=(2, 3, 4), c=(True, False, True)),
+                index=tuple('qrt'))
+
+        f3 = f1.join(f2, left_columns='a', right_columns='a')
+        self.assertEqual(f3.to_pairs(0),
+                (('a', ((0, 2), (1, 2), (2, 3))),
+                ('b', ((0, 'y'), (1, 'z'), (2, 'w'))),
+                ('c', ((0, True), (1, True), (2, False))))
+                )
+        f4 = f1.join(f2, how='outer', left_columns='a', right_columns='a', fill_value=None)
+        self.assertEqual(f4.to_pairs(0),
+                (('a', ((0, 1), (1, 2), (2, 2), (3, 3), (4, 4))),
+                ('b', ((0, 'x'), (1, 'y'), (2, 'z'), (3, 'w'), (4, None))),
+                ('c', ((0, None), (1, True), (2, True), (3, False), (4, True))))
+                )
+        f5 = f1.join(f2, how='right', left_columns=['a'], right_columns=['a'])
+        self.assertEqual(f5['a'].values.tolist(), [2, 2, 3, 4])
+        self.assertEqual(f5.dtypes['a'], np.dtype(int))
+
+        # keys of different types do not match
+        f6 = f1.join(f2, how='left', left_columns='b', right_columns='c', right_template='r_{}')
+        self.assertEqual(f6.columns.values.tolist(), ['a', 'b', 'r_a', 'r_c'])
+        self.assertEqual(f6.shape, (4, 4))
+        self.assertTrue(f6['r_a'].isna().all())
+
+    def test_frame_join_b(self) -> None:
+
+        f1 = Frame.from_dict(dict(a=(1, 2, 3)), index=tuple('pqr'))
+        f2 = FrameGO.from_dict(dict(a=(20, 30, 40)), index=tuple('qrs'))
+
+        f3 = f2.join(f1, how='outer', left_template='{}_l', right_template='{}_r')
+        self.assertEqual(f3.__class__, FrameGO)
+        self.assertEqual(f3.fillna(0).to_pairs(0),
+                (('a_l', (('q', 20.0), ('r', 30.0), ('s', 40.0), ('p', 0.0))),
+                ('a_r', (('q', 2.0), ('r', 3.0), ('s', 0.0), ('p', 1.0))))
+                )
+        f4 = f1.join(f2, how='inner', right_template='{}_r')
+        self.assertEqual(f4.to_pairs(0),
+                (('a', (('q', 2), ('r', 3))), ('a_r', (('q', 20), ('r', 30))))
+                )
+
+        index = IndexHierarchy.from_product(('a', 'b'), (1, 2))
+        f5 = Frame.from_dict(dict(x=(1, 2, 3, 4)), index=index)
+        f6 = Frame.from_dict(dict(y=(10, 30)),
+                index=IndexHierarchy.from_labels((('b', 1), ('a', 1))))
+        f7 = f5.join(f6, how='left', fill_value=0)
+        self.assertEqual(f7.to_pairs(0),
+                (('x', ((('a', 1), 1), (('a', 2), 2), (('b', 1), 3), (('b', 2), 4))),
+                ('y', ((('a', 1), 30), (('a', 2), 0), (('b', 1), 10), (('b', 2), 0))))
+                )
+
+        with self.assertRaises(NotImplementedError):
+            f1.join(f2, how='cross')
+        with self.assertRaises(ErrorInitIndex):
+            f1.join(f2)
+
+    def test_frame_join_c(self) -> None:
+        # hierarchical columns give tuple labels
+        f1 = Frame.from_dict(dict(a=(1, 2, 3)), index=tuple('pqr'))
+        f2 = Frame.from_records(((10, 'x'), (20, 'y')),
+                index=tuple('qr'),
+                columns=IndexHierarchy.from_labels((('a', 1), ('b', 2))))
+
+        f3 = f1.join(f2)
+        self.assertEqual(f3.to_pairs(0),
+                (('a', (('q', 2), ('r', 3))),
+                (('a', 1), (('q', 10), ('r', 20))),
+                (('b', 2), (('q', 'x'), ('r', 'y'))))
+                )
+        f4 = f1.join(f2, right_template='r{}')
+        self.assertEqual(f4.columns.values.tolist(), ['a', "r('a', 1)", "r('b', 2)"])
+        f5 = f2.join(f1, left_template='l{}')
+        self.assertEqual(f5.columns.values.tolist(), ["l('a', 1)", "l('b', 2)", 'a'])
+
+
+    def test_frame_join_asof_a(self) -> None:
+
+        f1 = Frame.from_dict(dict(sym=('a', 'b', 'a', 'b'), q=(1, 2, 3, 4)),
+                index=IndexSecond(('2020-01-01T00:00:00', '2020-01-01T00:00:04',
+                '2020-01-01T00:00:05', '2020-01-01T00:00:09')))
+        f2 = FrameGO.from_dict(dict(sym=('a', 'a', 'b', 'b'), px=(10.0, 11.0, 12.0, 13.0)),
+                index=IndexSecond(('2020-01-01T00:00:01', '2020-01-01T00:00:03',
+                '2020-01-01T00:00:04', '2020-01-01T00:00:07')))
+
+        f3 = f1.join_asof(f2, right_template='r_{}', fill_value='')
+        self.assertEqual(f3.index.__class__, IndexSecond)
+        self.assertEqual(f3.columns.values.tolist(), ['sym', 'q', 'r_sym', 'r_px'])
+        self.assertEqual(f3['r_sym'].values.tolist(), ['', 'b', 'b', 'b'])
+
+        f4 = f1.join_asof(f2, by='sym', fill_value=0)
+        self.assertEqual(f4['px'].values.tolist(), [0.0, 12.0, 11.0, 13.0])
+
+        f5 = f1.join_asof(f2, by=['sym'], tolerance=np.timedelta64(1, 's'))
+        self.assertEqual(f5['px'].fillna(0).values.tolist(), [0.0, 12.0, 0.0, 0.0])
+
+        # matches reindexing the union of labels and filling forward
+        f6 = f2.join_asof(f1, right_template='r_{}')
+        f7 = f1.reindex(f1.index.union(f2.index)).fillna_forward().reindex(f2.index)
+        self.assertEqual(f6['r_q'].fillna(0).values.tolist(), f7['q'].fillna(0).values.tolist())
+
+    def test_frame_join_asof_b(self) -> None:
+        # by columns are in a different order in each Frame
+        f1 = Frame.from_dict(dict(a=(1, 1, 2, 2), b=('x', 'y', 'x', 'y'), v=(0, 1, 2, 3)),
+                index=IndexSecond(('2020-01-01T00:00:00', '2020-01-01T00:00:01',
+                '2020-01-01T00:00:02', '2020-01-01T00:00:03')))
+        f2 = Frame.from_dict(dict(q=(0, 0, 0, 0), a=(1, 2, 1, 2), b=('y', 'x', 'x', 'y'), w=(10, 20, 30, 40)),
+                index=IndexSecond(('2020-01-01T00:00:00', '2020-01-01T00:00:01',
+                '2020-01-01T00:00:02', '2020-01-01T00:00:03')))
+
+        for by in (('b', 'a'), ('a', 'b')):
+            f3 = f1.join_asof(f2, by=by, fill_value=0)
+            self.assertEqual(f3.columns.values.tolist(), ['a', 'b', 'v', 'q', 'w'])
+            self.assertEqual(f3['w'].values.tolist(), [0, 10, 20, 40])
+
+    def test_frame_join_asof_c(self) -> None:
+        # hierarchical columns give tuple labels, and the name is retained
+        f1 = Frame.from_dict(dict(a=(1, 2)),
+                index=IndexSecond(('2020-01-01T00:00:01', '2020-01-01T00:00:03')),
+                name='f1')
+        f2 = Frame.from_records(((10, 'x'), (20, 'y')),
+                index=IndexSecond(('2020-01-01T00:00:00', '2020-01-01T00:00:02')),
+                columns=IndexHierarchy.from_labels((('a', 1), ('b', 2))))
+
+        f3 = f1.join_asof(f2)
+        self.assertEqual(f3.name, 'f1')
+        self.assertEqual(f3.columns.values.tolist(), ['a', ('a', 1), ('b', 2)])
+        self.assertEqual(f3[('b', 2)].values.tolist(), ['x', 'y'])
+        f4 = f1.join_asof(f2, right_template='r{}')
+        self.assertEqual(f4.columns.values.tolist(), ['a', "r('a', 1)", "r('b', 2)"])
 
     #---------------------------------------------------------------------------
 
@@ -25,6 +25,7 @@ from static_frame.core.index import _requires_reindex
 from static_frame.core.index import _index_initializer_needs_init
 
 from static_frame.core.exception import ErrorInitIndex
+from static_frame.core.exception import LocInvalid
 from static_frame.core.index import PositionsAllocator
 from static_frame.core.util import mloc
 
@@ -90,11 +91,9 @@ class TestUnit(TestCase):
     def test_index_init_f(self) -> None:
 
         labels = np.arange(3)
-        mapping = {x:x for x in range(3)}
 
         with self.assertRaises(RuntimeError):
             _ = Index._extract_labels(
-                    mapping=mapping,
                     labels=labels,
                     dtype=float
                     )
@@ -106,6 +105,30 @@ class TestUnit(TestCase):
                 [(0, 1, 2), (3, 4, 5)]
                 )
 
+    def test_index_init_h(self) -> None:
+        index1 = Index(np.array([30, 10, 20]))
+        # the mapping is not created until needed
+        self.assertIs(index1._map, None)
+        self.assertEqual(np.asarray(index1.loc_to_iloc(np.array([10, 20]))).tolist(), [1, 2])
+        self.assertIs(index1._map, None)
+
+        index2 = index1[[1, 2]]
+        self.assertIs(index2._map, None)
+        self.assertTrue(20 in index2)
+        self.assertEqual(index2._map, {10: 0, 20: 1})
+        self.assertEqual(index2.loc_to_iloc(20), 1)
+
+        # object labels are mapped to determine uniqueness
+        index3 = Index(('a', None, 3))
+        self.assertEqual(index3._map, {'a': 0, None: 1, 3: 2})
+
+        with self.assertRaises(ErrorInitIndex):
+            Index(np.array([3, 1, 3]))
+        with self.assertRaises(ErrorInitIndex):
+            Index(('a', 'b', 'a'))
+        with self.assertRaises(ErrorInitIndex):
+            IndexGO((None, 'b', None))
+
 
     #---------------------------------------------------------------------------
 
@@ -125,7 +148,172 @@ class TestUnit(TestCase):
     def test_index_loc_to_iloc_b(self) -> None:
         idx = Index(('a', 'b', 'c', 'd'))
         post = idx.loc_to_iloc(Series(['b', 'c']))
-        self.assertEqual(post, [1, 2])
+        assert isinstance(post, np.ndarray)
+        self.assertEqual(post.tolist(), [1, 2])
+
+    def test_index_loc_to_iloc_c(self) -> None:
+        idx = Index((3, 10, 20, 40))
+        post1 = idx.loc_to_iloc(np.array([40, 3, 20]))
+        assert isinstance(post1, np.ndarray)
+        self.assertEqual(post1.tolist(), [3, 0, 2])
+        self.assertTrue(idx._sorted)
+
+        self.assertEqual(idx.loc_to_iloc(slice(10, 40)), slice(1, 4))
+        # floats compared to 64-bit integers lose precision, and are found with the mapping
+        self.assertEqual(np.asarray(idx.loc_to_iloc(np.array([10.0, 20.0]))).tolist(), [1, 2])
+
+        with self.assertRaises(KeyError):
+            idx.loc_to_iloc(np.array([3, 5]))
+        with self.assertRaises(KeyError):
+            idx.loc_to_iloc(np.array([41]))
+        with self.assertRaises(LocInvalid):
+            idx.loc_to_iloc(slice(4, 40))
+
+    def test_index_loc_to_iloc_d(self) -> None:
+        idx = Index(('c', 'a', 'b'))
+        self.assertEqual(np.asarray(idx.loc_to_iloc(np.array(['b', 'c']))).tolist(), [2, 0])
+        self.assertFalse(idx._sorted)
+
+        idx = IndexGO(('a', 'b'))
+        self.assertEqual(idx.loc_to_iloc(slice('b', None)), slice(1, None))
+        self.assertTrue(idx._sorted)
+        idx.append('c')
+        self.assertTrue(idx._sorted)
+        self.assertEqual(np.asarray(idx.loc_to_iloc(np.array(['c', 'a']))).tolist(), [2, 0])
+        idx.append('0')
+        self.assertFalse(idx._sorted)
+        self.assertIs(idx._sorter, None)
+        # grow-only indices use the mapping rather than sorting
+        self.assertEqual(np.asarray(idx.loc_to_iloc(np.array(['0', 'a']))).tolist(), [3, 0])
+        self.assertIs(idx._sorter, None)
+
+    def test_index_loc_to_iloc_e(self) -> None:
+        idx = Index((30, 10, 50, 20, 40))
+
+        # unsorted labels are searched with an argsort
+        post = idx.loc_to_iloc(np.array([20, 30, 50]))
+        assert isinstance(post, np.ndarray)
+        self.assertEqual(post.tolist(), [3, 0, 2])
+        assert idx._sorter is not None
+        self.assertEqual(idx._sorter[0].tolist(), [1, 3, 0, 4, 2])
+        self.assertEqual(idx._sorter[1].tolist(), [10, 20, 30, 40, 50])
+
+        # lists of numbers are resolved as arrays
+        post = idx.loc_to_iloc([40, 10])
+        assert isinstance(post, np.ndarray)
+        self.assertEqual(post.tolist(), [4, 1])
+        self.assertEqual(np.asarray(idx.loc_to_iloc([40, 10.0])).tolist(), [4, 1])
+
+        # lists of mixed types fall back to the mapping
+        with self.assertRaises(KeyError):
+            idx.loc_to_iloc([40, 'a'])
+        with self.assertRaises(KeyError):
+            idx.loc_to_iloc(np.array([40, 60]))
+
+        self.assertEqual(np.asarray(idx.loc_to_iloc(np.array([10, 50]), offset=2)).tolist(), [3, 4])
+
+    def test_index_loc_to_iloc_f(self) -> None:
+        idx = Index((3.5, np.nan, 1.5))
+        post = idx.loc_to_iloc(np.array([1.5, 3.5]))
+        assert isinstance(post, np.ndarray)
+        self.assertEqual(post.tolist(), [2, 0])
+        # NaN is found by binary search, as NaN sorts last
+        self.assertEqual(np.asarray(idx.loc_to_iloc(np.array([1.5, np.nan]))).tolist(), [2, 1])
+        with self.assertRaises(KeyError):
+            Index((3.5, 1.5)).loc_to_iloc(np.array([1.5, np.nan]))
+
+    def test_index_loc_to_iloc_g(self) -> None:
+        idx = Index(np.arange(5))
+        # labels equal to positions are discovered, and share the positions array; as loc_is_iloc is not set, keys retain loc semantics
+        self.assertFalse(idx._loc_is_iloc)
+        self.assertTrue(idx._regular)
+        self.assertIs(idx._labels, idx._positions)
+
+        self.assertEqual(idx.loc_to_iloc(3), 3)
+        self.assertEqual(np.asarray(idx.loc_to_iloc(np.array([4, 0]))).tolist(), [4, 0])
+        self.assertEqual(idx.loc_to_iloc(slice(1, 3)), slice(1, 4))
+        self.assertEqual(np.asarray(idx.loc_to_iloc([1, 2])).tolist(), [1, 2])
+        self.assertEqual(idx.loc_to_iloc(2, offset=10), 12)
+        self.assertIs(idx._map, None)
+
+        with self.assertRaises(KeyError):
+            idx.loc_to_iloc(-1)
+        with self.assertRaises(KeyError):
+            idx.loc_to_iloc(np.array([2, 5]))
+        with self.assertRaises(LocInvalid):
+            idx.loc_to_iloc(slice(-1, 3))
+
+        for labels in (np.array([0, 2, 1, 3]), np.array([0, 1, 3]), np.array([0, 1, 2], dtype=np.int8)):
+            idx = Index(labels)
+            self.assertIsNot(idx._labels, idx._positions)
+
+    def test_index_loc_to_iloc_h(self) -> None:
+        idx = Index(np.arange(1000)[::-1])
+        # small keys use the mapping; sorting unsorted labels is deferred to large keys
+        self.assertEqual(np.asarray(idx.loc_to_iloc([998, 1])).tolist(), [1, 998])
+        self.assertIs(idx._sorter, None)
+        self.assertEqual(np.asarray(idx.loc_to_iloc(np.arange(100))).tolist()[:2], [999, 998])
+        self.assertIsNot(idx._sorter, None)
+
+        s1 = Series((1, 2, 3), index=(np.nan, 1.0, 2.0))
+        self.assertEqual(s1.loc[[np.nan, 1.0]].values.tolist(), [1, 2])
+        self.assertEqual(s1.loc[[float('nan')]].values.tolist(), [1])
+
+    def test_index_loc_to_iloc_i(self) -> None:
+        # NaN labels are found, though not equal to themselves
+        s1 = Series((1, 2, 3), index=(np.nan, 1.0, 2.0))
+        self.assertEqual(s1.loc[np.nan], 1)
+        self.assertEqual(s1.index.loc_to_iloc(float('nan'), offset=2), 2)
+        self.assertTrue(np.nan in s1.index)
+        self.assertFalse(3.0 in s1.index)
+        self.assertFalse(np.nan in Index((1.0, 2.0)))
+        with self.assertRaises(KeyError):
+            Index((1.0, 2.0)).loc_to_iloc(np.nan)
+
+        idx = IndexGO((1.0, np.nan))
+        with self.assertRaises(KeyError):
+            idx.append(np.nan)
+        idx.append(3.0)
+        self.assertTrue(np.nan in idx)
+        self.assertEqual(idx.loc_to_iloc(np.nan), 1)
+
+    def test_index_loc_to_iloc_j(self) -> None:
+        idx1 = Index(np.array([2 ** 62, 2 ** 62 + 1]))
+
+        # keys that would be compared as float64 are found with the mapping
+        key1 = np.array([2 ** 62 + 1], dtype=np.uint64)
+        self.assertEqual(np.asarray(idx1.loc_to_iloc(key1)).tolist(), [1])
+        self.assertEqual(np.asarray(idx1.loc_to_iloc(np.array([2 ** 62 + 1]))).tolist(), [1])
+
+        idx2 = Index(np.array([2 ** 53 + 1, 2 ** 53 + 3]))
+        with self.assertRaises(KeyError):
+            idx2.loc_to_iloc(np.array([float(2 ** 53)]))
+
+        # integers of fewer than 64 bits are exact as floats
+        idx3 = Index(np.array([1, 2, 3], dtype=np.int32))
+        self.assertEqual(np.asarray(idx3.loc_to_iloc(np.array([3.0, 1.0]))).tolist(), [2, 0])
+
+    def test_index_loc_to_iloc_k(self) -> None:
+        # keys of an index created with loc_is_iloc are passed through as iloc keys
+        s1 = Series(range(5))
+        self.assertTrue(s1.index._loc_is_iloc)
+        self.assertIs(s1.index._labels, s1.index._positions)
+        self.assertEqual(s1.loc[[True, False, True, False, True]].values.tolist(), [0, 2, 4])
+        self.assertEqual(s1.loc[np.array([False, True, False, False, True])].values.tolist(), [1, 4])
+        self.assertEqual(s1.loc[1:3].values.tolist(), [1, 2])
+        self.assertEqual(s1.loc[[3, 1]].values.tolist(), [3, 1])
+        self.assertEqual(s1.loc[4], 4)
+
+    def test_index_loc_to_iloc_l(self) -> None:
+        # labels of a non-native byte order are not searched
+        idx1 = Index(np.array(['', 'Ā', '0'], dtype='>U1'))
+        self.assertFalse(idx1._sorted)
+        self.assertEqual(np.asarray(idx1.loc_to_iloc(np.array(['0', 'Ā']))).tolist(), [2, 1])
+
+        labels = np.arange(np.datetime64('2020-01-01'), np.datetime64('2020-01-04'))
+        idx2 = Index(labels.astype(labels.dtype.newbyteorder('>')))
+        self.assertFalse(idx2._regular)
+        self.assertEqual(idx2.loc_to_iloc(np.datetime64('2020-01-02')), 1)
 
     #---------------------------------------------------------------------------
     def test_index_mloc_a(self) -> None:
@@ -397,7 +585,7 @@ class TestUnit(TestCase):
 
         index = IndexGO(('a', 'b', 'c'))
         index.append('d')
-        self.assertEqual(len(index.__slots__), 9)
+        self.assertEqual(len(index.__slots__), 12)
         self.assertFalse(index.STATIC)
         self.assertEqual(index._IMMUTABLE_CONSTRUCTOR, Index)
         self.assertEqual(Index._MUTABLE_CONSTRUCTOR, IndexGO)
@@ -408,6 +596,36 @@ class TestUnit(TestCase):
         with self.assertRaises(KeyError):
             index.append((2, 5))
 
+    def test_index_go_d(self) -> None:
+
+        index = IndexGO((0, 1))
+        values = []
+        for i in range(2, 20):
+            index.append(i)
+            values.append(index.values)
+            self.assertEqual(index.loc_to_iloc(i), i)
+
+        # storage is over-allocated, and prior values are not mutated by later appends
+        self.assertTrue(len(index._labels_mutable) > len(index))
+        self.assertEqual(values[0].tolist(), [0, 1, 2])
+        self.assertFalse(values[0].flags.writeable)
+        self.assertEqual(index.values.tolist(), list(range(20)))
+
+        # storage is converted when appended values require a new dtype
+        index.append('a')
+        index.append(20.5)
+        self.assertEqual(index.dtype, object)
+        self.assertEqual(index.values.tolist()[-3:], [19, 'a', 20.5])
+        self.assertEqual(values[-1].dtype, np.int64)
+
+    def test_index_go_e(self) -> None:
+
+        index = IndexGO(())
+        index.append(('a', 1))
+        index.append(('b', 2))
+        self.assertEqual(index.values.tolist(), [('a', 1), ('b', 2)])
+        self.assertEqual(index.loc_to_iloc(('b', 2)), 1)
+
 
     #---------------------------------------------------------------------------
 
@@ -497,6 +715,26 @@ class TestUnit(TestCase):
                 self.assertFalse(index_new._labels.flags.writeable)
                 self.assertEqual(index_new.loc[v], index.loc[v])
 
+    def test_index_pickle_b(self) -> None:
+        index = Index(('a', 'b', 'c'), name='foo')
+        self.assertEqual(index.loc_to_iloc('b'), 1)
+        self.assertIsNot(index._map, None)
+
+        # the mapping is not pickled, and is created after unpickling when needed
+        index_new = pickle.loads(pickle.dumps(index))
+        self.assertIs(index_new._map, None)
+        self.assertEqual(index_new.loc_to_iloc('c'), 2)
+        self.assertEqual(index_new.name, 'foo')
+
+        index = IndexGO(range(4), loc_is_iloc=True)
+        index_new = pickle.loads(pickle.dumps(index))
+        self.assertTrue(index_new._loc_is_iloc)
+        self.assertIs(index_new._labels, index_new._positions)
+        index_new.append(4)
+        index_new.append('a')
+        self.assertEqual(index_new.values.tolist(), [0, 1, 2, 3, 4, 'a'])
+        self.assertEqual(index.values.tolist(), [0, 1, 2, 3])
+
     def test_index_drop_a(self) -> None:
 
         index = Index(list('abcdefg'))
@@ -815,6 +1053,38 @@ class TestUnit(TestCase):
                 ['c', 'b', 'a']
                 )
 
+    def test_index_union_c(self) -> None:
+
+        idx1 = Index(('c', 'b', 'a'))
+        # equal operands reuse the Index
+        self.assertIs(idx1.union(idx1), idx1)
+        self.assertIs(idx1.union(Index(('c', 'b', 'a'))), idx1)
+        self.assertIs(idx1.intersection(Index(('c', 'b', 'a'))), idx1)
+
+        idx2 = IndexGO(('c', 'b', 'a'))
+        idx3 = idx2.union(idx2)
+        self.assertIsNot(idx3, idx2)
+        self.assertEqual(idx3.values.tolist(), ['c', 'b', 'a'])
+
+    def test_index_union_d(self) -> None:
+
+        idx1 = Index(('b', 'd', 'f'))
+        idx2 = Index(('a', 'bb', 'd', 'g'))
+
+        idx3 = idx1.union(idx2)
+        self.assertEqual(idx3.values.tolist(), ['a', 'b', 'bb', 'd', 'f', 'g'])
+        self.assertTrue(idx3._sorted)
+
+        idx4 = idx1.intersection(idx2)
+        self.assertEqual(idx4.values.tolist(), ['d'])
+
+        # a sorted superset is reused for the union, a sorted subset for the intersection
+        idx5 = Index((3.5, 4.0, 10.0))
+        self.assertIs(idx5.union(Index((4.0,))), idx5)
+        self.assertIs(idx5.intersection(Index((1.0, 3.5, 4.0, 10.0, 20.0))), idx5)
+        self.assertEqual(idx5.intersection(Index((np.nan, 4.0))).values.tolist(), [4.0])
+
+
 
 
     def test_index_to_html_a(self) -> None:
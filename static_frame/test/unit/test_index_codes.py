@@ -0,0 +1,111 @@
+
+import unittest
+import numpy as np
+
+from static_frame import Index
+from static_frame import IndexDate
+from static_frame import IndexHierarchy
+
+from static_frame.core.index_codes import IndexCodes
+from static_frame.core.index_codes import IndexProduct
+
+from static_frame.test.test_case import TestCase
+
+
+class TestUnit(TestCase):
+
+    def test_index_codes_from_arrays_a(self) -> None:
+        codes = IndexCodes.from_arrays((
+                np.array(['b', 'b', 'a']),
+                np.array(['2020-01-02', '2020-01-01', '2020-01-02'])),
+                index_constructors=(Index, IndexDate),
+                )
+        self.assertEqual(len(codes), 3)
+        self.assertEqual(codes.depth, 2)
+        self.assertEqual(codes.codes[0].dtype, np.int8)
+        self.assertEqual(codes.codes[1].tolist(), [0, 1, 0])
+        self.assertEqual(codes.indices[1].__class__, IndexDate)
+        self.assertEqual(codes.values_at_depth(1).dtype, np.dtype('datetime64[D]'))
+        keys = codes.keys()
+        assert keys is not None
+        self.assertEqual(keys.tolist(), [0, 1, 2])
+
+    def test_index_codes_from_index_level_a(self) -> None:
+        ih = IndexHierarchy.from_product(('a', 'b'), (1, 2), (True, False))
+        codes = IndexCodes.from_index_level(ih._levels)
+
+        self.assertEqual(codes.values_at_depth(0).tolist(), ['a'] * 4 + ['b'] * 4)
+        self.assertEqual(codes.values_at_depth(2).tolist(), [True, False] * 4)
+        # keys of a product are its positions
+        keys = codes.keys()
+        assert keys is not None
+        self.assertEqual(keys.tolist(), list(range(8)))
+
+        self.assertEqual(codes.leaf_changes(1).tolist(),
+                [True, False, False, False, True, False, False, False])
+        self.assertEqual(codes.leaf_changes(2).tolist(),
+                [True, False, True, False, True, False, True, False])
+
+    def test_index_codes_isin_a(self) -> None:
+        codes = IndexCodes.from_arrays((
+                np.array(['b', 'b', 'a']),
+                np.array([2, 1, 2])),
+                )
+        post = codes.isin((np.array(['a', 'b', 'c']), np.array([2, 2, 1])))
+        assert post is not None
+        self.assertEqual(post.tolist(), [True, False, True])
+
+    def test_index_codes_positions_for_labels_a(self) -> None:
+        codes = IndexCodes.from_arrays((
+                np.array(['b', 'b', 'a', 'a']),
+                np.array([2, 1, 1, 2])),
+                )
+        post = codes.positions_for_labels(
+                (np.array(['a', 'b', 'c', 'a']), np.array([2, 2, 1, 3])))
+        assert post is not None
+        positions, found = post
+        self.assertEqual(found.tolist(), [True, True, False, False])
+        self.assertEqual(positions[found].tolist(), [3, 0])
+
+    def test_index_codes_sort_order_a(self) -> None:
+        codes = IndexCodes.from_arrays((
+                np.array(['b', 'b', 'a', 'a']),
+                np.array([2, 1, 3, 1])),
+                )
+        self.assertEqual(codes.sort_order().tolist(), [3, 2, 1, 0])
+
+    def test_index_product_a(self) -> None:
+        product = IndexProduct((Index(('a', 'b')), IndexDate(('2020-01-01', '2020-01-02', '2020-01-03'))))
+        self.assertEqual(len(product), 6)
+        self.assertEqual(product.multipliers, [3, 1])
+        self.assertEqual(product.values_at_depth(0).tolist(), ['a', 'a', 'a', 'b', 'b', 'b'])
+        self.assertEqual(product.values_at_depth(1).dtype, np.dtype('datetime64[D]'))
+        self.assertEqual(tuple(product.label_widths_at_depth(0)), (('a', 3), ('b', 3)))
+
+        positions, found = product.positions_for_labels(
+                (np.array(['b', 'a', 'c']), np.array(['2020-01-02', '2020-01-03', '2020-01-01'], dtype='datetime64[D]')))
+        self.assertEqual(found.tolist(), [True, True, False])
+        self.assertEqual(positions[found].tolist(), [4, 2])
+
+        codes = product.to_index_codes()
+        keys = codes.keys()
+        assert keys is not None
+        self.assertEqual(keys.tolist(), list(range(6)))
+        self.assertEqual(product.to_index_level().get_labels().tolist(),
+                product.get_labels().tolist())
+
+    def test_index_product_b(self) -> None:
+        product = IndexProduct((Index(('a', 'b')), Index((1, 2, 3))))
+        # as with IndexLevel, there are no labels beyond the depth
+        self.assertEqual(list(product.iter(2)), [])
+        self.assertEqual(list(product.label_widths_at_depth(2)), [])
+
+        # positions of very large products cannot be represented by 64-bit integers
+        product = IndexProduct([Index(range(2 ** 16))] * 4)
+        self.assertIs(product.multipliers, None)
+        with self.assertRaises(NotImplementedError):
+            product.leaf_loc_to_iloc((0, 0, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
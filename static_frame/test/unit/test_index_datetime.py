@@ -394,6 +394,85 @@ class TestUnit(TestCase):
                 index.loc_to_iloc(slice('2018-02-11', '2018-02-24')),  # type: ignore
                 slice(41, 55, None))
 
+    def test_index_date_loc_to_iloc_b(self) -> None:
+
+        index = IndexDate(('2018-01-30', '2018-02-02', '2018-02-28', '2018-03-01', '2018-04-05'))
+
+        # partial selection by month is found with binary search on sorted labels
+        self.assertEqual(index.loc_to_iloc(slice('2018-02', '2018-03')), slice(1, 4))
+        self.assertTrue(index._sorted)
+        self.assertEqual(index.loc_to_iloc(slice('2018-03', None)), slice(3, None))
+        self.assertEqual(index.loc_to_iloc(slice('2017-01', '2017-12')), slice(0, 0))
+        self.assertEqual(index.loc_to_iloc(slice(None, '2018-01')), slice(None, 1))
+
+        post = index.loc_to_iloc(np.array(['2018-03-01', '2018-01-30'], dtype='datetime64[D]'))
+        assert isinstance(post, np.ndarray)
+        self.assertEqual(post.tolist(), [3, 0])
+
+        with self.assertRaises(KeyError):
+            index.loc_to_iloc(np.array(['2018-03-02'], dtype='datetime64[D]'))
+
+    def test_index_date_loc_to_iloc_c(self) -> None:
+
+        index = IndexSecond(np.arange(
+                np.datetime64('2020-01-01T00:00:00'),
+                np.datetime64('2020-01-03T00:00:00'),
+                np.timedelta64(60, 's')))
+        self.assertEqual(len(index), 2880)
+
+        # regular labels are found by arithmetic, without creating a mapping
+        self.assertEqual(index.loc_to_iloc('2020-01-01T00:02:00'), 2)
+        self.assertTrue(index._regular)
+        self.assertEqual(np.asarray(index.loc_to_iloc(
+                np.array(['2020-01-02T23:59:00', '2020-01-01T00:01:00'], dtype='datetime64[s]'))).tolist(),
+                [2879, 1])
+        self.assertEqual(index.loc_to_iloc(slice('2020-01-02', '2020-01-02')), slice(1440, 2880))
+        self.assertIs(index._map, None)
+
+        with self.assertRaises(KeyError):
+            index.loc_to_iloc('2020-01-01T00:02:01')
+        with self.assertRaises(KeyError):
+            index.loc_to_iloc(np.array(['2020-01-03T00:00:00'], dtype='datetime64[s]'))
+
+    def test_index_date_union_a(self) -> None:
+
+        index1 = IndexDate.from_date_range('2020-01-01', '2020-01-10')
+        index2 = IndexDate.from_date_range('2020-01-05', '2020-01-20')
+        index3 = IndexDate.from_date_range('2020-02-01', '2020-02-05')
+
+        post = index1.union(index2)
+        self.assertEqual(post.__class__, IndexDate)
+        self.assertEqual(len(post), 20)
+        self.assertEqual(post.values[[0, -1]].tolist(),
+                [datetime.date(2020, 1, 1), datetime.date(2020, 1, 20)])
+
+        # not adjacent: not regular
+        post = index1.union(index3)
+        self.assertEqual(len(post), 15)
+        self.assertEqual(post.loc_to_iloc('2020-02-01'), 10)
+
+        self.assertEqual(index1.union(index1[2:5]).values.tolist(), index1.values.tolist())
+
+    def test_index_date_intersection_a(self) -> None:
+
+        index1 = IndexDate.from_date_range('2020-01-01', '2020-01-10')
+        index2 = IndexDate.from_date_range('2020-01-05', '2020-01-20')
+        index3 = IndexDate.from_date_range('2020-02-01', '2020-02-05')
+
+        post = index1.intersection(index2)
+        self.assertEqual(post.values.tolist(),
+                [datetime.date(2020, 1, d) for d in range(5, 11)])
+
+        post = index1.intersection(index3)
+        self.assertEqual(len(post), 0)
+        self.assertEqual(post.dtype, np.dtype('datetime64[D]'))
+
+        # not aligned
+        index4 = IndexDate.from_date_range('2020-01-01', '2020-01-10', 2)
+        index5 = IndexDate.from_date_range('2020-01-02', '2020-01-10', 2)
+        self.assertEqual(len(index4.intersection(index5)), 0)
+        self.assertEqual(len(index4.union(index5)), 10)
+
 
 
 
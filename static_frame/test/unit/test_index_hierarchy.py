@@ -2,6 +2,7 @@
 import unittest
 import pickle
 import datetime
+from itertools import product
 import numpy as np
 
 from collections import OrderedDict
@@ -9,6 +10,8 @@ from collections import OrderedDict
 from static_frame import Index
 # from static_frame import IndexGO
 from static_frame import IndexDate
+from static_frame import IndexDateGO
+from static_frame import IndexGO
 from static_frame import Series
 from static_frame import Frame
 from static_frame import FrameGO
@@ -200,15 +203,16 @@ class TestUnit(TestCase):
                 ['A', 'B', 'C'],
                 slice('2018-01-01', '2018-01-04'),  # type: ignore
                 ['x', 'y']])
-        # this will break if we recognize this can be a slice
-        self.assertEqual(post, list(range(len(ih))))
+        # contiguous matches are combined into a slice
+        self.assertEqual(post, slice(0, len(ih)))
 
         post = ih.loc_to_iloc(HLoc[
                 ['A', 'B', 'C'],
                 slice('2018-01-01', '2018-01-04'),  # type: ignore
                 'x'])
 
-        self.assertEqual(post, list(range(0, len(ih), 2)))
+        assert isinstance(post, np.ndarray)
+        self.assertEqual(post.tolist(), list(range(0, len(ih), 2)))
 
         post = ih.loc_to_iloc(HLoc[
                 'C',
@@ -218,17 +222,21 @@ class TestUnit(TestCase):
         self.assertEqual(post, 21)
 
         post = ih.loc_to_iloc(HLoc['B', '2018-01-03':, 'y'])  # type: ignore  # https://github.com/python/typeshed/pull/3024
-        self.assertEqual(post, [13, 15])
+        assert isinstance(post, np.ndarray)
+        self.assertEqual(post.tolist(), [13, 15])
 
 
         post = ih.loc_to_iloc(HLoc[['B', 'C'], '2018-01-03'])
-        self.assertEqual(post, [12, 13, 20, 21])
+        assert isinstance(post, np.ndarray)
+        self.assertEqual(post.tolist(), [12, 13, 20, 21])
 
         post = ih.loc_to_iloc(HLoc[['A', 'C'], :, 'y'])
-        self.assertEqual(post, [1, 3, 5, 7, 17, 19, 21, 23])
+        assert isinstance(post, np.ndarray)
+        self.assertEqual(post.tolist(), [1, 3, 5, 7, 17, 19, 21, 23])
 
         post = ih.loc_to_iloc(HLoc[['A', 'C'], :, 'x'])
-        self.assertEqual(post, [0, 2, 4, 6, 16, 18, 20, 22])
+        assert isinstance(post, np.ndarray)
+        self.assertEqual(post.tolist(), [0, 2, 4, 6, 16, 18, 20, 22])
 
 
 
@@ -264,21 +272,25 @@ class TestUnit(TestCase):
 
 
         post = ih.loc_to_iloc(HLoc['I', ['A', 'C']])
-        self.assertEqual(post, [0, 1, 5, 6])
+        assert isinstance(post, np.ndarray)
+        self.assertEqual(post.tolist(), [0, 1, 5, 6])
 
 
         post = ih.loc_to_iloc(HLoc[:, 'A', :])
-        self.assertEqual(post, [0, 1, 7, 8, 9])
+        assert isinstance(post, np.ndarray)
+        self.assertEqual(post.tolist(), [0, 1, 7, 8, 9])
 
 
         post = ih.loc_to_iloc(HLoc[:, 'C', 3])
-        self.assertEqual(post, [6])
+        self.assertEqual(post, slice(6, 7))
 
         post = ih.loc_to_iloc(HLoc[:, :, 3])
-        self.assertEqual(post, [4, 6, 9])
+        assert isinstance(post, np.ndarray)
+        self.assertEqual(post.tolist(), [4, 6, 9])
 
         post = ih.loc_to_iloc(HLoc[:, :, 1])
-        self.assertEqual(post, [0, 2, 7, 10])
+        assert isinstance(post, np.ndarray)
+        self.assertEqual(post.tolist(), [0, 2, 7, 10])
 
         # TODO: not sure what to do when a multiple selection, [1, 2], is a superset of the leaf index; we do not match with a normal loc
         # ih.loc_to_iloc((slice(None), slice(None), [1,2]))
@@ -322,10 +334,12 @@ class TestUnit(TestCase):
 
         # selection with an Index objext
         iloc1 = ih.loc_to_iloc(Index((labels[2], labels[5])))
-        self.assertEqual(iloc1, [2, 5])
+        assert isinstance(iloc1, np.ndarray)
+        self.assertEqual(iloc1.tolist(), [2, 5])
 
         iloc2 = ih.loc_to_iloc(Index(labels))
-        self.assertEqual(iloc2, [0, 1, 2, 3, 4, 5])
+        assert isinstance(iloc2, np.ndarray)
+        self.assertEqual(iloc2.tolist(), [0, 1, 2, 3, 4, 5])
 
 
 
@@ -346,8 +360,8 @@ class TestUnit(TestCase):
         ih3 = IndexHierarchy.from_labels(labels[-3:])
 
         # selection with an IndexHierarchy
-        self.assertEqual(ih1.loc_to_iloc(ih2), [0, 1, 2])
-        self.assertEqual(ih1.loc_to_iloc(ih3), [3, 4, 5])
+        self.assertEqual(np.asarray(ih1.loc_to_iloc(ih2)).tolist(), [0, 1, 2])
+        self.assertEqual(np.asarray(ih1.loc_to_iloc(ih3)).tolist(), [3, 4, 5])
 
 
 
@@ -369,7 +383,71 @@ class TestUnit(TestCase):
         self.assertEqual(a1.tolist(), [False, True, False, False, True, False]) #type: ignore
 
         a2 = ih1.loc_to_iloc(Series((labels[5], labels[2], labels[4])))
-        self.assertEqual(a2, [5, 2, 4])
+        assert isinstance(a2, np.ndarray)
+        self.assertEqual(a2.tolist(), [5, 2, 4])
+
+    def test_hierarchy_loc_to_iloc_g(self) -> None:
+
+        ih1 = IndexHierarchy.from_product(('a', 'b', 'c'), (1, 2, 3))
+
+        self.assertEqual(ih1.loc_to_iloc(HLoc['b']), slice(3, 6))
+        self.assertEqual(ih1.loc_to_iloc(HLoc[['a', 'b']]), slice(0, 6))
+        self.assertEqual(ih1.loc_to_iloc(HLoc['b', [2, 3]]), slice(4, 6))
+        self.assertEqual(np.asarray(ih1.loc_to_iloc(HLoc[['a', 'c']])).tolist(),
+                [0, 1, 2, 6, 7, 8])
+
+        # open slice bounds are limited to the leaf index
+        self.assertEqual(ih1.loc_to_iloc(HLoc['b', 2:]), slice(4, 6))
+        self.assertEqual(ih1.loc_to_iloc(HLoc['a', :2]), slice(0, 2))
+        self.assertEqual(np.asarray(ih1.loc_to_iloc(HLoc[:, 2:])).tolist(),
+                [1, 2, 4, 5, 7, 8])
+
+        f1 = Frame(np.arange(18).reshape(9, 2), index=ih1)
+        f2 = f1.loc[HLoc['b']]
+        self.assertEqual(f2.values.tolist(), [[6, 7], [8, 9], [10, 11]])
+        self.assertTrue(np.shares_memory(f2._blocks._blocks[0], f1._blocks._blocks[0]))
+
+    def test_hierarchy_loc_to_iloc_h(self) -> None:
+
+        ih1 = IndexHierarchy.from_labels(
+                (('a', 2), ('a', 1), ('b', 1), ('b', 2), ('c', 3)))
+
+        self.assertEqual(np.asarray(ih1.loc_to_iloc([('b', 2), ('a', 1)])).tolist(), [3, 1])
+        self.assertEqual(np.asarray(ih1.loc_to_iloc(ih1.values[::-1])).tolist(), [4, 3, 2, 1, 0])
+
+        # labels found at each depth but not in combination
+        with self.assertRaises(KeyError):
+            ih1.loc_to_iloc([('b', 2), ('c', 1)])
+        with self.assertRaises(KeyError):
+            ih1.loc_to_iloc([('b', 2), ('d', 1)])
+
+        # a product is resolved by arithmetic
+        ih2 = IndexHierarchy.from_product(('a', 'b'), (1, 2, 3))
+        self.assertEqual(np.asarray(ih2.loc_to_iloc([('b', 3), ('a', 2)])).tolist(), [5, 1])
+        self.assertIs(ih2._codes, None)
+
+    def test_hierarchy_loc_to_iloc_i(self) -> None:
+
+        ih1 = IndexHierarchy.from_product(('a', 'b'),
+                IndexDate(('2020-01-01', '2020-02-01')))
+        s1 = Series(range(4), index=ih1)
+
+        self.assertEqual(s1.loc[[('a', '2020-02-01'), ('b', '2020-01-01')]].values.tolist(), [1, 2])
+        self.assertEqual(s1.loc[[('a', np.datetime64('2020-02-01')), ('b', '2020-01-01')]].values.tolist(), [1, 2])
+
+        # partial dates select many labels, and cannot be used in a leaf selection
+        with self.assertRaises(KeyError):
+            s1.loc[[('a', '2020-02'), ('b', '2020-01')]]
+        with self.assertRaises(KeyError):
+            s1.loc[[('a', '2020-01-01'), ('b', '2020')]]
+
+        # labels of another type at a depth are not found
+        ih2 = IndexHierarchy.from_labels((('a', 1), ('a', 2), ('b', 1)))
+        self.assertEqual(np.asarray(ih2.loc_to_iloc([('b', 1), ('a', 2)])).tolist(), [2, 1])
+        with self.assertRaises(KeyError):
+            ih2.loc_to_iloc([('b', 1), ('a', '2')])
+        with self.assertRaises(KeyError):
+            ih2.loc_to_iloc([('b', 1.5), ('a', 2)])
 
     #---------------------------------------------------------------------------
 
@@ -429,6 +507,64 @@ class TestUnit(TestCase):
         with self.assertRaises(RuntimeError):
             IndexHierarchy.from_product((1, 2))
 
+    def test_hierarchy_from_product_c(self) -> None:
+
+        ih1 = IndexHierarchy.from_product(('a', 'b', 'c'), (1, 2), (True, False))
+        ih2 = IndexHierarchy.from_labels(product(('a', 'b', 'c'), (1, 2), (True, False)))
+
+        # neither labels nor levels are created for lookups
+        self.assertEqual(len(ih1), 12)
+        self.assertEqual(ih1.depth, 3)
+        self.assertEqual(ih1.loc_to_iloc(('b', 2, False)), 7)
+        self.assertTrue(('c', 1, True) in ih1)
+        self.assertFalse(('c', 3, True) in ih1)
+        self.assertIs(ih1._labels, None)
+        self.assertIs(ih1._levels_tree, None)
+
+        for key in (HLoc['b'],
+                HLoc['b':],  # type: ignore
+                HLoc[:, 2],
+                HLoc['a', 1:],
+                HLoc[['c', 'a'], :, True],
+                HLoc['c', 2, False],
+                HLoc['c', [1, 2], False],
+                HLoc[:, :, [False]],
+                ):
+            post1 = ih1.loc_to_iloc(key)
+            post2 = ih2.loc_to_iloc(key)
+            if isinstance(post1, np.ndarray):
+                self.assertEqual(post1.tolist(), np.asarray(post2).tolist())
+            else:
+                self.assertEqual(post1, post2)
+
+        self.assertEqual(ih1.loc_to_iloc(HLoc['b']), slice(4, 8))
+        self.assertEqual(np.asarray(ih1.loc_to_iloc(ih2.iloc[[5, 1]])).tolist(), [5, 1])
+        self.assertEqual(ih1.loc_to_iloc(slice(('a', 2, True), ('b', 1, True))), slice(2, 5))
+
+        with self.assertRaises(KeyError):
+            ih1.loc_to_iloc(HLoc['d'])
+        with self.assertRaises(KeyError):
+            ih1.loc_to_iloc(('a', 3, True))
+
+        self.assertEqual(ih1.isin([('b', 1, True), ('c', 3, True)]).tolist(),
+                [False] * 4 + [True] + [False] * 7)
+        self.assertIs(ih1._labels, None)
+
+        self.assertEqual(ih1.values.tolist(), ih2.values.tolist())
+        self.assertEqual(ih1._levels.get_labels().tolist(), ih2.values.tolist())
+
+    def test_hierarchy_from_product_d(self) -> None:
+
+        ih1 = IndexHierarchyGO.from_product(Index(('a', 'b')), IndexDate(('2020-01-01', '2020-01-02')))
+        self.assertEqual(ih1.index_types.values.tolist(), [IndexGO, IndexDateGO])
+
+        ih2 = ih1.copy()
+        ih1.append(('c', '2020-01-01'))
+        self.assertIs(ih1._product, None)
+        self.assertEqual(ih1.loc_to_iloc(('c', '2020-01-01')), 4)
+        self.assertEqual(len(ih2), 4)
+        self.assertEqual(ih2.loc_to_iloc(HLoc['b']), slice(2, 4))
+
 
     def test_hierarchy_from_tree_a(self) -> None:
 
@@ -606,6 +742,65 @@ class TestUnit(TestCase):
                     reorder_for_hierarchy=True,
                     continuation_token='')
 
+    def test_hierarchy_from_labels_i(self) -> None:
+
+        labels = np.array([['I', 'A', 1], ['I', 'B', 1], ['II', 'A', 2]], dtype=object)
+        ih1 = IndexHierarchy.from_labels(labels, name='foo')
+        self.assertEqual(ih1.values.tolist(), labels.tolist())
+        self.assertEqual(ih1.dtypes.values.tolist(),
+                [np.dtype('<U2'), np.dtype('<U1'), np.dtype(int)])
+        self.assertEqual(ih1.name, 'foo')
+        self.assertEqual(ih1.loc_to_iloc(('II', 'A', 2)), 2)
+
+        with self.assertRaises(ErrorInitIndex):
+            IndexHierarchy.from_labels(labels[[0, 2, 1]])
+
+    #---------------------------------------------------------------------------
+
+    def test_hierarchy_from_values_per_depth_a(self) -> None:
+
+        values = (
+                np.array(['a', 'a', 'a', 'b', 'b']),
+                np.array([1, 1, 2, 1, 3]),
+                ('x', 'y', 'x', 'x', 'x'),
+                )
+        ih1 = IndexHierarchy.from_values_per_depth(values)
+        ih2 = IndexHierarchy.from_labels(zip(*values))
+
+        self.assertEqual(ih1.values.tolist(), ih2.values.tolist())
+        self.assertEqual(list(ih1._levels.depths()), [3, 3, 3, 3])
+        for label in ih2:
+            self.assertEqual(ih1.loc_to_iloc(label), ih2.loc_to_iloc(label))
+        self.assertEqual(ih1.loc_to_iloc(HLoc['b']), slice(3, 5))
+        self.assertEqual(np.asarray(ih1.loc_to_iloc(HLoc[:, 1, 'x'])).tolist(), [0, 3])
+
+        # codes are retained from construction
+        assert ih1._codes is not None
+        self.assertEqual(ih1._codes.codes[1].tolist(), [0, 0, 1, 0, 2])
+
+    def test_hierarchy_from_values_per_depth_b(self) -> None:
+
+        ih1 = IndexHierarchyGO.from_values_per_depth(
+                (('a', 'a', 'b'), ('2020-01-01', '2020-01-02', '2020-01-01')),
+                index_constructors=(Index, IndexDate),
+                )
+        ih1.append(('b', '2020-01-03'))
+        self.assertEqual(ih1.index_types.values.tolist(), [IndexGO, IndexDateGO])
+        self.assertEqual(ih1.values_at_depth(1).tolist(),
+                [datetime.date(2020, 1, 1), datetime.date(2020, 1, 2),
+                datetime.date(2020, 1, 1), datetime.date(2020, 1, 3)])
+
+        with self.assertRaises(ErrorInitIndex):
+            IndexHierarchy.from_values_per_depth((('a', 'b', 'a'), (1, 2, 3)))
+        with self.assertRaises(ErrorInitIndex):
+            IndexHierarchy.from_values_per_depth((('a', 'a'), (1, 1)))
+        with self.assertRaises(ErrorInitIndex):
+            IndexHierarchy.from_values_per_depth((('a', 'a'), (1,)))
+        with self.assertRaises(ErrorInitIndex):
+            IndexHierarchy.from_values_per_depth((('a', 'a'),))
+
+        self.assertEqual(len(IndexHierarchy.from_values_per_depth(((), ()))), 0)
+
     #---------------------------------------------------------------------------
 
     def test_hierarchy_from_index_items_a(self) -> None:
@@ -921,6 +1116,27 @@ class TestUnit(TestCase):
                 [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
                 )
 
+    def test_hierarchy_index_go_b(self) -> None:
+
+        ih1 = IndexHierarchyGO.from_product(('I',), IndexDate(('2020-01-01',)))
+        post = []
+        for i in range(2, 12):
+            ih1.append(('I', f'2020-01-{i:02}'))
+            post.append(ih1.values)
+
+        # labels are a view of over-allocated storage, updated without deriving labels from levels
+        self.assertFalse(ih1._recache)
+        assert ih1._labels_mutable is not None
+        self.assertTrue(len(ih1._labels_mutable) > len(ih1))
+        self.assertEqual(post[0].tolist(),
+                [['I', datetime.date(2020, 1, 1)], ['I', datetime.date(2020, 1, 2)]])
+        self.assertEqual(ih1.values.tolist(), ih1._levels.get_labels().tolist())
+        self.assertEqual(ih1.loc_to_iloc(('I', '2020-01-11')), 10)
+
+        ih1.append(('II', '2020-02-01'))
+        self.assertEqual(ih1.values.tolist(), ih1._levels.get_labels().tolist())
+        self.assertEqual(post[-1].shape, (11, 2))
+
 
 
     def test_hierarchy_relabel_a(self) -> None:
@@ -1371,6 +1587,29 @@ class TestUnit(TestCase):
         with self.assertRaises(NotImplementedError):
             _ = ih.drop_level(0)
 
+    def test_hierarchy_drop_level_h(self) -> None:
+
+        ih = IndexHierarchy.from_labels(
+                (('b', 2, 'x'), ('b', 2, 'y'), ('a', 1, 'x'), ('a', 3, 'x')),
+                name='foo')
+
+        ih1 = ih.drop_level(-1)
+        self.assertEqual(ih1.values.tolist(), [['b', 2], ['a', 1], ['a', 3]])
+        self.assertEqual(ih1.name, 'foo')
+        assert isinstance(ih1, IndexHierarchy)
+        self.assertEqual(ih1.dtypes.values.tolist(),
+                [np.dtype('<U1'), np.dtype(int)])
+
+        ih2 = ih.drop_level(-2)
+        self.assertEqual(ih2.values.tolist(), ['b', 'a'])
+
+        ih3 = ih.drop_level(1)
+        self.assertEqual(ih3.values.tolist(),
+                [[2, 'x'], [2, 'y'], [1, 'x'], [3, 'x']])
+
+        with self.assertRaises(ErrorInitIndex):
+            _ = ih.drop_level(2)
+
 
 
     #---------------------------------------------------------------------------
@@ -1593,9 +1832,22 @@ class TestUnit(TestCase):
             index_new = pickle.loads(pbytes)
 
             for v in index: # iter labels (arrays here)
-                self.assertFalse(index_new._labels.flags.writeable)
+                self.assertFalse(index_new.values.flags.writeable)
                 self.assertEqual(index_new.loc[tuple(v)], index.loc[tuple(v)])
 
+    def test_index_hierarchy_pickle_b(self) -> None:
+
+        ih1 = IndexHierarchyGO.from_product(('a', 'b'), (1, 2))
+        self.assertEqual(len(ih1.values), 4)
+
+        # labels are not pickled, and are derived from levels after unpickling
+        ih2 = pickle.loads(pickle.dumps(ih1))
+        self.assertIs(ih2._labels, None)
+        ih2.append(('b', 3))
+        self.assertEqual(ih2.values.tolist(),
+                [['a', 1], ['a', 2], ['b', 1], ['b', 2], ['b', 3]])
+        self.assertEqual(len(ih1), 4)
+
 
     # def test_index_hierarchy_get_a(self) -> None:
 
@@ -1669,6 +1921,66 @@ class TestUnit(TestCase):
         extract = ih1.loc[post]
         self.assertEqual(extract.values.shape, (2, 3))
 
+    def test_index_hierarchy_isin_e(self) -> None:
+
+        ih1 = IndexHierarchy.from_labels(
+                (('a', True), ('a', False), ('b', False)))
+        self.assertEqual(ih1.isin([('b', False), ('c', True)]).tolist(),
+                [False, False, True])
+        self.assertEqual(ih1.isin([('a', 1)]).tolist(),
+                [True, False, False])
+        self.assertTrue(ih1._codes is not None)
+
+    def test_index_hierarchy_isin_f(self) -> None:
+
+        ih1 = IndexHierarchy.from_product(('a', 'b'), (1, 2),
+                IndexDate(('2020-01-01', '2020-02-01')))
+
+        # labels that are not dates at a date depth, or that are of the wrong length, are not found
+        self.assertEqual(ih1.isin([('a', 1, 'x'), ('b', 2)]).tolist(),
+                [False] * 8)
+        self.assertEqual(ih1.isin([('a', 1, 'x'), ('b', 2, '2020-02-01')]).tolist(),
+                [False] * 7 + [True])
+        self.assertEqual(ih1.isin([('a', 'x', '2020-01-01'), ('b', 1, '2020-02')]).tolist(),
+                [False] * 8)
+
+        ih2 = IndexHierarchy.from_labels((('a', 1, '2020-01-01'), ('b', 2, '2020-02-01')),
+                index_constructors=(Index, Index, IndexDate))
+        self.assertEqual(ih2.isin([('a', 1, 'x'), ('b', 2, '2020-02-01')]).tolist(),
+                [False, True])
+
+    def test_index_hierarchy_codes_a(self) -> None:
+
+        ih1 = IndexHierarchy.from_labels(
+                (('b', 2), ('b', 1), ('a', 2), ('a', 3)))
+        self.assertEqual(ih1.values_at_depth(1).dtype, np.dtype(int))
+        self.assertEqual(ih1.values_at_depth(1).tolist(), [2, 1, 2, 3])
+        self.assertEqual(ih1.values_at_depth([1, 0]).tolist(),
+                [[2, 'b'], [1, 'b'], [2, 'a'], [3, 'a']])
+        assert ih1._codes is not None
+        self.assertEqual(ih1._codes.codes[1].tolist(), [0, 1, 0, 2])
+        self.assertEqual(ih1._codes.indices[0].values.tolist(), ['b', 'a'])
+
+        self.assertEqual(ih1.sort().values.tolist(),
+                [['a', 2], ['a', 3], ['b', 1], ['b', 2]])
+
+        ih2 = ih1.rehierarch((1, 0))
+        self.assertEqual(ih2.values.tolist(),
+                [[2, 'b'], [2, 'a'], [1, 'b'], [3, 'a']])
+
+    def test_index_hierarchy_codes_b(self) -> None:
+
+        ih1 = IndexHierarchyGO.from_labels((('a', 1), ('a', 2), ('b', 1), ('b', 2)))
+        self.assertEqual(ih1.isin([('c', 3)]).tolist(), [False] * 4)
+        self.assertTrue(ih1._codes is not None)
+
+        # appending discards codes
+        ih1.append(('c', 3))
+        self.assertIs(ih1._codes, None)
+        self.assertEqual(ih1.isin([('c', 3)]).tolist(), [False] * 4 + [True])
+        self.assertEqual(ih1.values_at_depth(0).tolist(),
+                ['a', 'a', 'b', 'b', 'c'])
+
     def test_index_hierarchy_roll_a(self) -> None:
 
         ih1 = IndexHierarchy.from_product((1, 2), (30, 70))
@@ -1752,7 +2064,7 @@ class TestUnit(TestCase):
                 )
 
         self.assertEqual(tuple(hidx.label_widths_at_depth(1)),
-                ((np.datetime64('2019-01-05'), 2), (np.datetime64('2019-01-06'), 2), (np.datetime64('2019-01-07'), 0), (np.datetime64('2019-01-08'), 2), (np.datetime64('2019-01-05'), 2), (np.datetime64('2019-01-06'), 2), (np.datetime64('2019-01-07'), 0), (np.datetime64('2019-01-08'), 2))
+                ((np.datetime64('2019-01-05'), 2), (np.datetime64('2019-01-06'), 2), (np.datetime64('2019-01-07'), 2), (np.datetime64('2019-01-08'), 2), (np.datetime64('2019-01-05'), 2), (np.datetime64('2019-01-06'), 2), (np.datetime64('2019-01-07'), 2), (np.datetime64('2019-01-08'), 2))
                 )
 
         self.assertEqual(tuple(hidx.label_widths_at_depth(2)),
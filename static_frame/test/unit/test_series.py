@@ -2341,6 +2341,95 @@ class TestUnit(TestCase):
                 ((('circle', 'rough'), 12), (('circle', 'smooth'), 10), (('square', 'rough'), 4), (('square', 'smooth'), 2), (('triangle', 'rough'), 20), (('triangle', 'smooth'), 18))
                 )
 
+    def test_series_group_labels_reduce_a(self) -> None:
+
+        colors = ('red', 'green')
+        shapes = ('square', 'circle', 'triangle')
+
+        s1 = sf.Series((1, 2, np.nan, 4, 5, 6),
+                index=sf.IndexHierarchy.from_product(shapes, colors),
+                name='foo'
+                )
+
+        s2 = s1.group_labels_reduce(0)
+        self.assertEqual(s2.name, 'foo')
+        self.assertEqual(s2.to_pairs(),
+                (('circle', 4.0), ('square', 3.0), ('triangle', 11.0))
+                )
+        self.assertEqual(s1.group_labels_reduce(1, 'mean').to_pairs(),
+                (('green', 4.0), ('red', 3.0))
+                )
+        self.assertEqual(s1.group_labels_reduce(0, 'count').to_pairs(),
+                (('circle', 1), ('square', 2), ('triangle', 2))
+                )
+        s3 = s1.group_labels_reduce(0, 'max', skipna=False)
+        self.assertEqual(s3[['square', 'triangle']].to_pairs(),
+                (('square', 2.0), ('triangle', 6.0))
+                )
+        self.assertTrue(np.isnan(s3['circle']))
+
+        # matches iter_group_labels for multiple depths
+        s4 = s1.group_labels_reduce([1, 0], 'first', skipna=False)
+        self.assertEqual(s4.index.depth, 2)
+        self.assertEqual(s4.fillna(-1).to_pairs(),
+                s1.iter_group_labels([1, 0]).apply(lambda s: s.iloc[0]).fillna(-1).to_pairs()
+                )
+
+        with self.assertRaises(NotImplementedError):
+            s1.group_labels_reduce(0, 'median')
+
+
+
+
+    def test_series_window_reduce_a(self) -> None:
+
+        s1 = Series((1, 2, np.nan, 4, 5, 6),
+                index=self.get_letters(6),
+                name='foo'
+                )
+        s2 = s1.window_reduce(3, 'sum')
+        self.assertEqual(s2.name, 'foo')
+        self.assertEqual(s2.to_pairs(),
+                (('c', 3.0), ('d', 6.0), ('e', 9.0), ('f', 15.0))
+                )
+        for func in ('sum', 'mean', 'min', 'max', 'std'):
+            s3 = s1.window_reduce(2, func, step=2, label_shift=-1, window_sized=False, start_shift=-1)
+            s4 = s1.iter_window(size=2, step=2, label_shift=-1, window_sized=False, start_shift=-1
+                    ).apply(lambda s: getattr(s, func)())
+            self.assertEqual(s3.index.values.tolist(), s4.index.values.tolist())
+            self.assertTrue(np.allclose(s3.values, s4.values))
+
+        s5 = s1.window_reduce(2, 'max', skipna=False)
+        self.assertEqual(s5.fillna(0).to_pairs(),
+                (('b', 2.0), ('c', 0.0), ('d', 0.0), ('e', 5.0), ('f', 6.0))
+                )
+        self.assertEqual(s1.window_reduce(10, 'count').to_pairs(), ())
+
+
+    def test_series_expanding_reduce_a(self) -> None:
+
+        s1 = Series((1, np.nan, 3, 2, 5),
+                index=self.get_letters(5),
+                name='foo'
+                )
+        s2 = s1.expanding_reduce('sum')
+        self.assertEqual(s2.name, 'foo')
+        self.assertEqual(s2.to_pairs(),
+                (('a', 1.0), ('b', 1.0), ('c', 4.0), ('d', 6.0), ('e', 11.0))
+                )
+        self.assertEqual(s1.expanding_reduce('max', size=3).to_pairs(),
+                (('c', 3.0), ('d', 3.0), ('e', 5.0))
+                )
+        for func in ('sum', 'mean', 'min', 'max', 'std'):
+            s3 = s1.expanding_reduce(func)
+            s4 = s1.iter_window(size=1, step=0, size_increment=1
+                    ).apply(lambda s: getattr(s, func)())
+            self.assertTrue(np.allclose(s3.values, s4.values))
+
+        # matches cumsum in the handling of missing values
+        self.assertEqual(s1.expanding_reduce('sum', skipna=False).fillna(0).values.tolist(),
+                s1.cumsum(skipna=False).fillna(0).values.tolist()
+                )
 
     def test_series_locmin_a(self) -> None:
         s1 = Series((2, 3, 0,), index=list('abc'))
@@ -1,4 +1,5 @@
 import unittest
+import zipfile
 # from io import StringIO
 
 from static_frame.core.frame import Frame
@@ -185,6 +186,17 @@ class TestUnit(TestCase):
             with self.assertRaises(NotImplementedError):
                 st.write(((f1.name, f1),))
 
+    def test_store_zip_pickle_d(self) -> None:
+
+        f1 = Frame.from_dict(dict(a=(1,2), b=(3,4)), name='foo')
+
+        with temp_file('.zip') as fp:
+            st = StoreZipPickle(fp)
+            st.write(((f1.name, f1),))
+            # protocol 4 is readable by all supported Python versions
+            with zipfile.ZipFile(fp) as zf:
+                self.assertEqual(zf.read('foo.pickle')[:2], b'\x80\x04')
+
 
 
 if __name__ == '__main__':
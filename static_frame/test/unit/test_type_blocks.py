@@ -17,6 +17,7 @@ from static_frame import mloc
 
 
 from static_frame.core.util import immutable_filter
+from static_frame.core.util import isna_array
 from static_frame.core.index_correspondence import IndexCorrespondence
 from static_frame.test.test_case import TestCase
 from static_frame.test.test_case import skip_win
@@ -64,16 +65,16 @@ class TestUnit(TestCase):
 
     def test_type_blocks_contiguous_pairs(self) -> None:
 
-        a = [(0, 1), (0, 2), (2, 3), (2, 1)]
-        post = list(TypeBlocks._indices_to_contiguous_pairs(a))
+        a = np.array([(0, 1), (0, 2), (2, 3), (2, 1)])
+        post = list(TypeBlocks._indices_to_contiguous_pairs(a[:, 0], a[:, 1]))
         self.assertEqual(post, [
                 (0, slice(1, 3)),
                 (2, slice(3, 4)),
                 (2, slice(1, 2)),
                 ])
 
-        a = [(0, 0), (0, 1), (0, 2), (1, 4), (2, 1), (2, 3)]
-        post = list(TypeBlocks._indices_to_contiguous_pairs(a))
+        a = np.array([(0, 0), (0, 1), (0, 2), (1, 4), (2, 1), (2, 3)])
+        post = list(TypeBlocks._indices_to_contiguous_pairs(a[:, 0], a[:, 1]))
         self.assertEqual(post, [
                 (0, slice(0, 3)),
                 (1, slice(4, 5)),
@@ -183,6 +184,15 @@ class TestUnit(TestCase):
         self.assertEqual(list(tb1._key_to_block_slices([3,5,6])),
             [(1, slice(0, 1, None)), (1, slice(2, 3, None)), (2, slice(0, 1, None))]
             )
+        self.assertEqual(list(tb1._key_to_block_slices([5, 4, 3, 4, 0])),
+            [(1, slice(2, None, -1)), (1, slice(1, 2)), (0, slice(0, 1))]
+            )
+        self.assertEqual(list(tb1._key_to_block_slices([5, 4, 3, 4], retain_key_order=False)),
+            [(1, slice(0, 2)), (1, slice(1, 3))]
+            )
+        self.assertEqual(list(tb1._key_to_block_slices(np.array([True, False, True, True, False, False, True, False]))),
+            [(0, slice(0, 1)), (0, slice(2, 3)), (1, slice(0, 1)), (2, slice(0, 1))]
+            )
 
     #---------------------------------------------------------------------------
 
@@ -354,6 +364,24 @@ class TestUnit(TestCase):
                 ['od', 'oe', True]],
                 match_dtype=object)
 
+    def test_type_blocks_extract_d(self) -> None:
+        a1 = np.arange(12).reshape(6, 2)
+        a2 = np.arange(6) * 10
+        tb1 = TypeBlocks.from_blocks((a1, a2))
+
+        # contiguous positions are extracted as views
+        tb2 = tb1._extract(np.array([2, 3, 4]))
+        self.assertEqual(tb2.values.tolist(), [[4, 5, 20], [6, 7, 30], [8, 9, 40]])
+        self.assertTrue(np.shares_memory(tb2._blocks[0], tb1._blocks[0]))
+        self.assertTrue(np.shares_memory(tb2._blocks[1], tb1._blocks[1]))
+
+        tb3 = tb1._extract(np.array([3]), 2)
+        self.assertEqual(tb3.values.tolist(), [[30]])
+
+        tb4 = tb1._extract(np.array([4, 2]))
+        self.assertEqual(tb4.values.tolist(), [[8, 9, 40], [4, 5, 20]])
+        self.assertFalse(np.shares_memory(tb4._blocks[0], tb1._blocks[0]))
+
 
     def test_type_blocks_extract_array_a(self) -> None:
         a1 = np.array([[1, 2, 3], [4, 5, 6], [0, 0, 1]])
@@ -498,6 +526,20 @@ class TestUnit(TestCase):
         tb2a = tb2[[2,3,7]]
         self.assertTrue(tb1.block_compatible(tb2a))
 
+    def test_type_blocks_block_compatible_c(self) -> None:
+
+        a1 = np.array([[1, 2], [3, 4]])
+        a2 = np.array([True, False])
+        tb1 = TypeBlocks.from_blocks((a1, a2))
+        tb2 = TypeBlocks.from_blocks((a2, a1))
+        tb3 = TypeBlocks.from_blocks((a1.astype(float), np.empty((2, 0)), a2))
+
+        # widths of blocks are compared, not dtypes
+        self.assertTrue(tb1.block_compatible(tb3))
+        self.assertFalse(tb1.block_compatible(tb2, axis=1))
+        self.assertTrue(tb1.block_compatible(tb2, axis=0))
+        self.assertFalse(tb1.block_compatible(TypeBlocks.from_blocks((a2, a2, a2))))
+
     #---------------------------------------------------------------------------
 
     def test_type_blocks_consolidate_a(self) -> None:
@@ -551,6 +593,44 @@ class TestUnit(TestCase):
         tb2 = tb1.consolidate()
         self.assertTrue((tb1.dtypes == tb2.dtypes).all())
 
+    def test_type_blocks_consolidate_d(self) -> None:
+        blocks = [np.arange(3, dtype=float) + i for i in range(40)]
+
+        tb1 = TypeBlocks.from_blocks(blocks)
+        self.assertEqual(len(tb1._blocks), 40)
+        self.assertAlmostEqual(tb1.fragmentation, 0.975)
+
+        post = tb1.values
+        self.assertEqual(len(tb1._blocks), 1)
+        self.assertEqual(tb1.fragmentation, 0.0)
+        self.assertEqual(tb1.shape, (3, 40))
+        self.assertEqual(tb1._index_block.tolist(), [0] * 40)
+        self.assertEqual(tb1._index_column.tolist(), list(range(40)))
+        self.assertEqual(post[:, 39].tolist(), [39.0, 40.0, 41.0])
+        self.assertEqual(tb1.iloc[2, 10], 12.0)
+
+    def test_type_blocks_consolidate_e(self) -> None:
+        blocks = [np.arange(3, dtype=float) + i for i in range(40)]
+        count = TypeBlocks.CONSOLIDATE_BLOCK_COUNT_MIN
+        try:
+            TypeBlocks.CONSOLIDATE_BLOCK_COUNT_MIN = None
+            tb1 = TypeBlocks.from_blocks(blocks)
+            self.assertEqual([a.sum() for a in tb1.axis_values(1)], [780.0, 820.0, 860.0])
+            self.assertEqual(len(tb1._blocks), 40)
+        finally:
+            TypeBlocks.CONSOLIDATE_BLOCK_COUNT_MIN = count
+
+        tb2 = TypeBlocks.from_blocks(blocks)
+        self.assertEqual([a.sum() for a in tb2.axis_values(1)], [780.0, 820.0, 860.0])
+        self.assertEqual(len(tb2._blocks), 1)
+
+        # mixed types that cannot consolidate are not reblocked
+        tb3 = TypeBlocks.from_blocks([np.arange(3) + i if i % 2 else np.arange(3) > i
+                for i in range(40)])
+        self.assertEqual(tb3.fragmentation, 0.0)
+        tb3.values
+        self.assertEqual(len(tb3._blocks), 40)
+
 
     #---------------------------------------------------------------------------
 
@@ -1159,6 +1239,81 @@ class TestUnit(TestCase):
         self.assertEqual(subtb.values.tolist(),
                 [[0, 0, 1, 2, True, False, True], [0, 0, 1, 1, True, False, True]])
 
+    def test_type_blocks_group_c(self) -> None:
+
+        a1 = np.array([3, 1, 3, 2, 1, 1])
+        a2 = np.arange(6) * 10
+        tb1 = TypeBlocks.from_blocks((a1, a2))
+
+        post1 = list(tb1.group(axis=0, key=0))
+        self.assertEqual([g for g, _, _ in post1], [1, 2, 3])
+        self.assertEqual(post1[0][1].tolist(), [1, 4, 5])
+        self.assertEqual(post1[0][2].values.tolist(), [[1, 10], [1, 40], [1, 50]])
+        self.assertEqual(post1[1][1], slice(3, 4))
+        self.assertEqual(post1[2][2].values.tolist(), [[3, 0], [3, 20]])
+
+        # sorted groups are extracted as slices that share memory
+        tb2 = TypeBlocks.from_blocks((np.sort(a1), a2))
+        post2 = list(tb2.group(axis=0, key=0))
+        self.assertEqual([s for _, s, _ in post2],
+                [slice(0, 3), slice(3, 4), slice(4, 6)])
+        self.assertTrue(np.shares_memory(post2[2][2]._blocks[1], tb2._blocks[1]))
+
+        # column groups by row values
+        post3 = list(tb1.group(axis=1, key=[0, 1]))
+        self.assertEqual([g for g, _, _ in post3], [(0, 10), (3, 1)])
+        self.assertEqual([s for _, s, _ in post3], [slice(1, 2), slice(0, 1)])
+
+    def test_type_blocks_group_reduce_a(self) -> None:
+
+        a1 = np.array([3, 1, 3, 2, 1, 1])
+        a2 = np.array([[1.0, 10], [2, 20], [np.nan, 30], [4, 40], [5, 50], [6, 60]])
+        a3 = np.array([True, False, True, True, False, True])
+        tb1 = TypeBlocks.from_blocks((a1, a2, a3))
+
+        groups, tb2 = tb1.group_reduce(axis=0, key=0, func='sum', skipna=True)
+        self.assertEqual(groups.tolist(), [1, 2, 3])
+        self.assertEqual(tb2.shape, (3, 3))
+        self.assertEqual(tb2.dtypes.tolist(),
+                [np.dtype(float), np.dtype(float), np.dtype(int)])
+        self.assertEqual(tb2.values.tolist(),
+                [[13.0, 130.0, 1], [4.0, 40.0, 1], [1.0, 40.0, 2]])
+
+        groups, tb3 = tb1.group_reduce(axis=0, key=[0, 3], func='count', skipna=True)
+        self.assertEqual(groups.tolist(), [[1, False], [1, True], [2, True], [3, True]])
+        self.assertEqual(tb3.values.tolist(), [[2, 2], [1, 1], [1, 1], [1, 2]])
+
+        # group columns by the values in row 0
+        groups, tb4 = tb1.group_reduce(axis=1, key=0, func='max', skipna=True)
+        self.assertEqual(groups.tolist(), [1.0, 3.0, 10.0])
+        self.assertEqual(tb4.shape, (5, 3))
+        self.assertEqual(tb4.values[:, 2].tolist(), [20.0, 30.0, 40.0, 50.0, 60.0])
+
+        groups, tb5 = tb1.group_reduce(axis=0, key=slice(None), func='sum', skipna=True)
+        self.assertEqual(tb5.shape, (6, 0))
+
+
+
+    def test_type_blocks_take_rows_fill_a(self) -> None:
+
+        a1 = np.array([1, 2, 3])
+        a2 = np.array([[1.5, 2.5], [3.5, 4.5], [5.5, 6.5]])
+        a3 = np.array(['a', 'b', 'c'])
+        tb1 = TypeBlocks.from_blocks((a1, a2, a3))
+
+        tb2 = tb1.take_rows_fill(np.array([2, 0, 0]), fill_value=None)
+        self.assertEqual(tb2.dtypes.tolist(), tb1.dtypes.tolist())
+        self.assertEqual(tb2.values.tolist(),
+                [[3, 5.5, 6.5, 'c'], [1, 1.5, 2.5, 'a'], [1, 1.5, 2.5, 'a']])
+
+        tb3 = tb1.take_rows_fill(np.array([-1, 1]), fill_value=np.nan)
+        self.assertEqual(tb3.dtypes.tolist(),
+                [np.dtype(float), np.dtype(float), np.dtype(float), np.dtype(object)])
+        self.assertEqual(tb3.values[1].tolist(), [2.0, 3.5, 4.5, 'b'])
+        self.assertTrue(isna_array(tb3.values[0]).all())
+
+        tb4 = TypeBlocks.from_zero_size_shape((3, 0)).take_rows_fill(np.array([0, -1]), 0)
+        self.assertEqual(tb4.shape, (2, 0))
 
     def test_type_blocks_transpose_a(self) -> None:
 
@@ -2253,6 +2408,23 @@ class TestUnit(TestCase):
                 [False, False, False]
                 )
 
+    def test_type_blocks_pickle_b(self) -> None:
+
+        a1 = np.array([[1, 2], [3, 4]])
+        a2 = np.array(['b', 'c'])
+        tb1 = TypeBlocks.from_blocks((a1, a2))
+
+        # only blocks and shape are pickled
+        tb2 = pickle.loads(pickle.dumps(tb1, protocol=5))
+        self.assertEqual(tb2._index_block.tolist(), [0, 0, 1])
+        self.assertEqual(tb2._index_column.tolist(), [0, 1, 0])
+        self.assertEqual(tb2.shape, (2, 3))
+        self.assertEqual(tb2.iloc[1].values.tolist(), [[3, 4, 'c']])
+
+        tb3 = TypeBlocks.from_zero_size_shape((3, 0))
+        tb4 = pickle.loads(pickle.dumps(tb3))
+        self.assertEqual(tb4.shape, (3, 0))
+
 
     #---------------------------------------------------------------------------
     def test_type_blocks_roll_blocks_a(self) -> None:
@@ -2482,6 +2654,27 @@ class TestUnit(TestCase):
         # array was not added
         self.assertEqual(len(tb.shapes), 1)
 
+    def test_type_blocks_append_f(self) -> None:
+
+        tb1 = TypeBlocks.from_blocks(np.array([[1, 2], [3, 4]]))
+        tb2 = tb1.copy()
+        for i in range(10):
+            tb1.append(np.array([i, -i]))
+
+        # the index is grown in over-allocated storage, of which the index arrays are immutable views
+        assert tb1._index_mutable is not None
+        self.assertTrue(tb1._index_mutable.shape[1] > tb1.shape[1])
+        self.assertFalse(tb1._index_block.flags.writeable)
+        self.assertEqual(tb1._index_block.tolist(), [0, 0] + list(range(1, 11)))
+        self.assertEqual(tb1._index_column.tolist(), [0, 1] + [0] * 10)
+        self.assertEqual(tb1.iloc[1, 11], -9)
+
+        # a copy retains its own index
+        tb2.append(np.array([[5, 6], [7, 8]]))
+        self.assertEqual(tb2._index_block.tolist(), [0, 0, 1, 1])
+        self.assertEqual(tb1._index_block.tolist(), [0, 0] + list(range(1, 11)))
+        self.assertEqual(tb2.values.tolist(), [[1, 2, 5, 6], [3, 4, 7, 8]])
+
 
 
 
@@ -66,6 +66,17 @@ from static_frame.core.util import argmax_2d
 
 from static_frame.core.util import _array_to_duplicated_sortable
 from static_frame.core.util import _ufunc_set_1d
+from static_frame.core.util import union_sorted
+from static_frame.core.util import intersect_sorted
+from static_frame.core.util import array_to_codes
+from static_frame.core.util import locations_to_selections
+from static_frame.core.util import array_group_reduce
+from static_frame.core.util import array_window_reduce
+from static_frame.core.util import join_locations
+from static_frame.core.util import join_asof_locations
+from static_frame.core.util import array_to_groups_and_locations
+from static_frame.core.util import ufunc_unique_and_locations
+from static_frame.core.util import positions_to_slice
 
 from static_frame.test.test_case import TestCase
 from static_frame.test.test_case import UnHashable
@@ -682,7 +693,263 @@ class TestUnit(TestCase):
         self.assertEqual(post.tolist(),
                 [(0, 1), (0, 3)])
 
+    def test_union_sorted_a(self) -> None:
+        a1 = np.array([1, 4, 7, 10])
+        a2 = np.array([0, 4, 5, 10, 11])
+        self.assertEqual(union_sorted(a1, a2).tolist(), [0, 1, 4, 5, 7, 10, 11])
+        self.assertEqual(union_sorted(a1, a1[:0]).tolist(), [1, 4, 7, 10])
+
+        a3 = np.array(['a', 'c'])
+        a4 = np.array(['b', 'bb', 'c'])
+        self.assertEqual(union_sorted(a3, a4).tolist(), ['a', 'b', 'bb', 'c'])
+
+    def test_intersect_sorted_a(self) -> None:
+        a1 = np.array([1, 4, 7, 10])
+        a2 = np.array([0, 4, 5, 10, 11])
+        self.assertEqual(intersect_sorted(a1, a2).tolist(), [4, 10])
+        self.assertEqual(intersect_sorted(a2, a1).tolist(), [4, 10])
+        self.assertEqual(intersect_sorted(a1, a2[:0]).tolist(), [])
+
+    def test_array_to_codes_a(self) -> None:
+        unique, codes = array_to_codes(np.array(['b', 'a', 'b', 'c', 'a']))
+        self.assertEqual(unique.tolist(), ['b', 'a', 'c'])
+        self.assertEqual(codes.tolist(), [0, 1, 0, 2, 1])
+
+        # unsortable values are mapped in observed order
+        a1 = np.array([3, 'x', (1, 2), 3, None, 'x'], dtype=object)
+        unique, codes = array_to_codes(a1)
+        self.assertEqual(unique.tolist(), [3, 'x', (1, 2), None])
+        self.assertEqual(codes.tolist(), [0, 1, 2, 0, 3, 1])
+
+    def test_positions_to_slice_a(self) -> None:
+        self.assertEqual(positions_to_slice(np.array([3, 4, 5])), slice(3, 6))
+        self.assertEqual(positions_to_slice(np.array([3])), slice(3, 4))
+        self.assertEqual(positions_to_slice(np.array([3, 5, 4, 6])), None)
+        self.assertEqual(positions_to_slice(np.array([-2, -1])), None)
+        self.assertEqual(positions_to_slice(np.array([], dtype=int)), None)
+
+    def test_locations_to_selections_a(self) -> None:
+        # sorted locations produce only slices
+        post1 = list(locations_to_selections(np.array([0, 0, 1, 2, 2, 2]), 3))
+        self.assertEqual(post1, [slice(0, 2), slice(2, 3), slice(3, 6)])
+
+        post2 = list(locations_to_selections(np.array([1, 0, 2, 0, 1, 1]), 3))
+        # unsorted locations produce arrays where not contiguous
+        assert isinstance(post2[0], np.ndarray) and isinstance(post2[1], np.ndarray)
+        self.assertEqual(post2[0].tolist(), [1, 3])
+        self.assertEqual(post2[1].tolist(), [0, 4, 5])
+        self.assertEqual(post2[2], slice(2, 3))
+
+        post3 = list(locations_to_selections(np.array([1, 1, 0, 0]), 2))
+        self.assertEqual(post3, [slice(2, 4), slice(0, 2)])
+
+        self.assertEqual(list(locations_to_selections(np.array([], dtype=int), 0)), [])
+
+    def test_array_to_groups_and_locations_a(self) -> None:
+        groups, locations = array_to_groups_and_locations(np.array([7, 3, 7, 5, 3]))
+        self.assertEqual(groups.tolist(), [3, 5, 7])
+        self.assertEqual(locations.tolist(), [2, 0, 2, 1, 0])
+
+        # a span greater than the size is sorted
+        a1 = np.array([7, -3000, 7], dtype=np.int16)
+        groups, locations = array_to_groups_and_locations(a1)
+        self.assertEqual(groups.dtype, a1.dtype)
+        self.assertEqual(groups.tolist(), [-3000, 7])
+        self.assertEqual(locations.tolist(), [1, 0, 1])
+
+    def test_ufunc_unique_and_locations_a(self) -> None:
+        unique, locations = ufunc_unique_and_locations(
+                np.array(['b', 'a', 'b']))
+        self.assertEqual(unique.tolist(), ['a', 'b'])
+        self.assertEqual(locations.tolist(), [1, 0, 1])
+
+        # unorderable values are in order of first appearance, as ufunc_unique
+        a1 = np.array(['far', 20, 'far', None], dtype=object)
+        unique, locations = ufunc_unique_and_locations(a1)
+        self.assertEqual(unique.tolist(), ufunc_unique(a1).tolist())
+        self.assertEqual(locations.tolist(), [0, 1, 0, 2])
+
+        a2 = np.array([['far', 1], [20, 2], ['far', 1]], dtype=object)
+        unique, locations = ufunc_unique_and_locations(a2)
+        self.assertEqual(unique.tolist(), [['far', 1], [20, 2]])
+        self.assertEqual(locations.tolist(), [0, 1, 0])
+
+    def test_array_group_reduce_a(self) -> None:
+        locations = np.array([0, 0, 0, 1, 2, 2])
+        counts = np.array([3, 1, 2])
+        a1 = np.array([1.0, np.nan, 3.0, np.nan, 5.0, 7.0])
+
+        def post(func: str, skipna: bool = True) -> tp.List[tp.Any]:
+            return tp.cast(tp.List[tp.Any], array_group_reduce(a1,
+                    locations=locations,
+                    counts=counts,
+                    func=func,
+                    skipna=skipna).tolist())
+
+        self.assertEqual(post('sum'), [4.0, 0.0, 12.0])
+        self.assertEqual(post('count'), [2, 0, 2])
+        self.assertEqual(post('count', False), [3, 1, 2])
+        self.assertEqual(post('min')[0], 1.0)
+        self.assertTrue(np.isnan(post('min')[1]))
+        self.assertEqual(post('std')[2], 1.0)
+        self.assertEqual(post('first', False)[::2], [1.0, 5.0])
+        self.assertEqual(post('last')[0], 3.0)
+        self.assertTrue(np.isnan(post('sum', False)[0]))
+
+        a2 = np.array([[1, 2], [3, 4], [5, 6], [7, 8], [9, 10], [11, 12]])
+        post2 = array_group_reduce(a2,
+                locations=locations,
+                counts=counts,
+                func='mean',
+                skipna=True)
+        self.assertEqual(post2.tolist(), [[3.0, 4.0], [7.0, 8.0], [10.0, 11.0]])
+
+        a3 = np.array([None, 'b', 'a', 'c', 'd', None], dtype=object)
+        post3 = array_group_reduce(a3,
+                locations=locations,
+                counts=counts,
+                func='max',
+                skipna=True)
+        self.assertEqual(post3.tolist(), ['b', 'c', 'd'])
 
+        with self.assertRaises(NotImplementedError):
+            array_group_reduce(a1, locations=locations, counts=counts, func='median', skipna=True)
+
+    def test_array_window_reduce_a(self) -> None:
+        starts = np.array([0, 1, 2, 4, 6])
+        stops = np.array([3, 4, 5, 6, 6])
+        a1 = np.array([1.0, np.nan, 3.0, 4.0, np.inf, 6.0])
+
+        def post(func: str, skipna: bool = True) -> tp.List[tp.Any]:
+            return tp.cast(tp.List[tp.Any], array_window_reduce(a1,
+                    starts=starts,
+                    stops=stops,
+                    func=func,
+                    skipna=skipna).tolist())
+
+        self.assertEqual(post('sum')[:4], [4.0, 7.0, np.inf, np.inf])
+        self.assertEqual(post('sum')[4], 0.0)
+        self.assertEqual(post('count'), [2, 2, 3, 2, 0])
+        self.assertEqual(post('count', False), [3, 3, 3, 2, 0])
+        self.assertEqual(post('mean')[:2], [2.0, 3.5])
+        self.assertEqual(post('min')[:4], [1.0, 3.0, 3.0, 6.0])
+        self.assertEqual(post('max')[:4], [3.0, 4.0, np.inf, np.inf])
+        self.assertEqual([round(v, 6) for v in post('std')[:2]], [1.0, 0.5])
+        self.assertTrue(np.isnan(post('std')[2]))
+        self.assertTrue(np.isnan(post('min')[4]))
+        self.assertTrue(np.isnan(post('sum', False)[0]))
+        self.assertEqual(post('sum', False)[2:], [np.inf, np.inf, 0.0])
+
+        a2 = np.arange(12).reshape(6, 2)
+        post2 = array_window_reduce(a2,
+                starts=starts,
+                stops=stops,
+                func='max',
+                skipna=True)
+        self.assertEqual(post2[:4].tolist(), [[4, 5], [6, 7], [8, 9], [10, 11]])
+        post3 = array_window_reduce(a2,
+                starts=starts,
+                stops=stops,
+                func='sum',
+                skipna=True)
+        self.assertEqual(post3.tolist(), [[6, 9], [12, 15], [18, 21], [18, 20], [0, 0]])
+
+        a3 = np.array(['2020-01-03', 'NaT', '2020-01-01'], dtype='datetime64[D]')
+        post4 = array_window_reduce(a3,
+                starts=np.array([0, 1, 1]),
+                stops=np.array([2, 2, 3]),
+                func='min',
+                skipna=True)
+        self.assertEqual(post4.astype(str).tolist(), ['2020-01-03', 'NaT', '2020-01-01'])
+
+        with self.assertRaises(NotImplementedError):
+            array_window_reduce(a1, starts=starts, stops=stops, func='median', skipna=True)
+
+    def test_array_window_reduce_b(self) -> None:
+        # results do not depend on values before each window
+        a1 = np.array([1e16, 1, 1, 2, 1])
+        starts = np.array([0, 1, 2, 3])
+        stops = np.array([2, 3, 4, 5])
+
+        def post(array: np.ndarray, func: str) -> tp.List[tp.Any]:
+            return tp.cast(tp.List[tp.Any], array_window_reduce(array,
+                    starts=starts,
+                    stops=stops,
+                    func=func,
+                    skipna=True).tolist())
+
+        self.assertEqual(post(a1, 'sum'), [1e16 + 1, 2.0, 3.0, 3.0])
+        self.assertEqual(post(a1, 'mean'), [5e15, 1.0, 1.5, 1.5])
+        self.assertEqual(post(a1, 'std'), [5e15 - 0.5, 0.0, 0.5, 0.5])
+
+        a2 = np.array([1e9 + 0.1, 1e9 + 0.2, np.nan, 1e9 + 0.4, 1e9 + 0.7])
+        self.assertEqual([round(v, 4) for v in post(a2, 'std')], [0.05, 0.0, 0.0, 0.15])
+
+        a3 = np.array(['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(post(a3, 'max'), ['b', 'c', 'd', 'e'])
+        with self.assertRaises(NotImplementedError):
+            post(a3, 'sum')
+
+        a4 = np.array(['a', None, 'c', 'd', 'e'], dtype=object)
+        with self.assertRaises(TypeError):
+            post(a4, 'min')
+
+
+
+
+    def test_join_locations_a(self) -> None:
+        left = [np.array([1, 2, 2, 3, 5])]
+        right = [np.array([2, 3, 3, 4, 2])]
+
+        def post(how: str) -> tp.List[tp.List[int]]:
+            return [a.tolist() for a in join_locations(left, right, how)]
+
+        self.assertEqual(post('inner'), [[1, 1, 2, 2, 3, 3], [0, 4, 0, 4, 1, 2]])
+        self.assertEqual(post('left'),
+                [[0, 1, 1, 2, 2, 3, 3, 4], [-1, 0, 4, 0, 4, 1, 2, -1]])
+        self.assertEqual(post('right'),
+                [[1, 2, 3, 3, -1, 1, 2], [0, 0, 1, 2, 3, 4, 4]])
+        self.assertEqual(post('outer'),
+                [[0, 1, 1, 2, 2, 3, 3, 4, -1], [-1, 0, 4, 0, 4, 1, 2, -1, 3]])
+
+        # composite keys of different types
+        post2 = join_locations(
+                [np.array(['a', 'b']), np.array([1, 2])],
+                [np.array(['b', 'a', 'a'], dtype=object), np.array([2, 1, 2])],
+                'outer')
+        self.assertEqual([a.tolist() for a in post2], [[0, 1, -1], [1, 0, 2]])
+
+        post3 = join_locations([np.array([], dtype=int)], [np.array([1])], 'left')
+        self.assertEqual([a.tolist() for a in post3], [[], []])
+
+        with self.assertRaises(NotImplementedError):
+            join_locations(left, right, 'cross')
+        with self.assertRaises(RuntimeError):
+            join_locations(left, [], 'inner')
+
+
+    def test_join_asof_locations_a(self) -> None:
+        right = np.array(['2020-01-01T00:00:01', '2020-01-01T00:00:03',
+                '2020-01-01T00:00:03', '2020-01-01T00:00:07'], dtype='datetime64[s]')
+        left = np.array(['2020-01-01T00:00:00', '2020-01-01T00:00:03',
+                '2020-01-01T00:00:05', '2020-01-01T00:00:09'], dtype='datetime64[ns]')
+
+        self.assertEqual(join_asof_locations(left, right).tolist(), [-1, 2, 2, 3])
+        self.assertEqual(join_asof_locations(left, right[::-1]).tolist(), [-1, 2, 2, 0])
+        self.assertEqual(join_asof_locations(left, right,
+                tolerance=np.timedelta64(1, 's')).tolist(), [-1, 2, -1, -1])
+
+        left_by = [np.array(['a', 'b', 'a', 'b'])]
+        right_by = [np.array(['a', 'a', 'b', 'b'])]
+        self.assertEqual(join_asof_locations(left, right,
+                left_by=left_by,
+                right_by=right_by).tolist(), [-1, 2, 1, 3])
+        self.assertEqual(join_asof_locations(left, right,
+                left_by=left_by,
+                right_by=right_by,
+                tolerance=np.timedelta64(1, 's')).tolist(), [-1, 2, -1, -1])
+
+        self.assertEqual(join_asof_locations(left, right[:0]).tolist(), [-1, -1, -1, -1])
 
     def test_union2d_a(self) -> None:
         a1 = np.array([[3, 1], [0, 1]])